@@ -5,8 +5,149 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://sfc-gh-jdemlow.github.io',
                 'git_url': 'https://github.com/sfc-gh-jdemlow/cortex_forecast',
                 'lib_path': 'cortex_forecast'},
-  'syms': { 'cortex_forecast.connection': { 'cortex_forecast.connection.AuthenticationError': ( 'connection.html#authenticationerror',
+  'syms': { 'cortex_forecast.batch': { 'cortex_forecast.batch.BatchResult': ('batch.html#batchresult', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.BatchResult.ok': ('batch.html#batchresult.ok', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch': ('batch.html#forecastbatch', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.__init__': ( 'batch.html#forecastbatch.__init__',
+                                                                                         'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch._build_and_score': ( 'batch.html#forecastbatch._build_and_score',
+                                                                                                 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch._build_training_table': ( 'batch.html#forecastbatch._build_training_table',
+                                                                                                      'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch._create_tags': ( 'batch.html#forecastbatch._create_tags',
+                                                                                             'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch._output_key': ( 'batch.html#forecastbatch._output_key',
+                                                                                            'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch._share_training_table': ( 'batch.html#forecastbatch._share_training_table',
+                                                                                                      'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.plan': ( 'batch.html#forecastbatch.plan',
+                                                                                     'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.run': ( 'batch.html#forecastbatch.run',
+                                                                                    'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.run_plan': ( 'batch.html#forecastbatch.run_plan',
+                                                                                         'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.summary': ( 'batch.html#forecastbatch.summary',
+                                                                                        'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ForecastBatch.training_groups': ( 'batch.html#forecastbatch.training_groups',
+                                                                                                'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardResult': ('batch.html#shardresult', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardResult.ok': ('batch.html#shardresult.ok', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast': ('batch.html#shardedforecast', 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.__init__': ( 'batch.html#shardedforecast.__init__',
+                                                                                           'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast._prepare': ( 'batch.html#shardedforecast._prepare',
+                                                                                           'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast._record': ( 'batch.html#shardedforecast._record',
+                                                                                          'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast._run_shard': ( 'batch.html#shardedforecast._run_shard',
+                                                                                             'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast._shard_model': ( 'batch.html#shardedforecast._shard_model',
+                                                                                               'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast._status_table': ( 'batch.html#shardedforecast._status_table',
+                                                                                                'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.completed_shards': ( 'batch.html#shardedforecast.completed_shards',
+                                                                                                   'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.fetch_forecast': ( 'batch.html#shardedforecast.fetch_forecast',
+                                                                                                 'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.resume': ( 'batch.html#shardedforecast.resume',
+                                                                                         'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.run': ( 'batch.html#shardedforecast.run',
+                                                                                      'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch.ShardedForecast.summary': ( 'batch.html#shardedforecast.summary',
+                                                                                          'cortex_forecast/batch.py'),
+                                       'cortex_forecast.batch._timed': ('batch.html#_timed', 'cortex_forecast/batch.py')},
+            'cortex_forecast.benchmark': { 'cortex_forecast.benchmark._legacy_chart_split': ( 'benchmark.html#_legacy_chart_split',
+                                                                                              'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark._measure': ( 'benchmark.html#_measure',
+                                                                                   'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark._peak_rss_mb': ( 'benchmark.html#_peak_rss_mb',
+                                                                                       'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.benchmark_chart_preparation': ( 'benchmark.html#benchmark_chart_preparation',
+                                                                                                      'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.benchmark_end_to_end': ( 'benchmark.html#benchmark_end_to_end',
+                                                                                               'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.benchmark_forecast_batch': ( 'benchmark.html#benchmark_forecast_batch',
+                                                                                                   'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.benchmark_result_formats': ( 'benchmark.html#benchmark_result_formats',
+                                                                                                   'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.benchmark_session_pool': ( 'benchmark.html#benchmark_session_pool',
+                                                                                                 'cortex_forecast/benchmark.py'),
+                                           'cortex_forecast.benchmark.compare_benchmarks': ( 'benchmark.html#compare_benchmarks',
+                                                                                             'cortex_forecast/benchmark.py')},
+            'cortex_forecast.cache': { 'cortex_forecast.cache.QueryCache': ('cache.html#querycache', 'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.__init__': ( 'cache.html#querycache.__init__',
+                                                                                      'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache._discard': ( 'cache.html#querycache._discard',
+                                                                                      'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache._disk_path': ( 'cache.html#querycache._disk_path',
+                                                                                        'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache._load_from_disk': ( 'cache.html#querycache._load_from_disk',
+                                                                                             'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.clear': ( 'cache.html#querycache.clear',
+                                                                                   'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.get': ('cache.html#querycache.get', 'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.get_or_fetch': ( 'cache.html#querycache.get_or_fetch',
+                                                                                          'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.invalidate': ( 'cache.html#querycache.invalidate',
+                                                                                        'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.invalidate_after': ( 'cache.html#querycache.invalidate_after',
+                                                                                              'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.make_key': ( 'cache.html#querycache.make_key',
+                                                                                      'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.set': ('cache.html#querycache.set', 'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.QueryCache.stats': ( 'cache.html#querycache.stats',
+                                                                                   'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.get_query_cache': ('cache.html#get_query_cache', 'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.normalize_sql': ('cache.html#normalize_sql', 'cortex_forecast/cache.py'),
+                                       'cortex_forecast.cache.set_query_cache': ('cache.html#set_query_cache', 'cortex_forecast/cache.py')},
+            'cortex_forecast.cleanup': { 'cortex_forecast.cleanup.ForecastGC': ('cleanup.html#forecastgc', 'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC.__init__': ( 'cleanup.html#forecastgc.__init__',
+                                                                                          'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC._drop_statements': ( 'cleanup.html#forecastgc._drop_statements',
+                                                                                                  'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC._reason': ( 'cleanup.html#forecastgc._reason',
+                                                                                         'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC._registered_models': ( 'cleanup.html#forecastgc._registered_models',
+                                                                                                    'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC._table_exists': ( 'cleanup.html#forecastgc._table_exists',
+                                                                                               'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC.collect': ( 'cleanup.html#forecastgc.collect',
+                                                                                         'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC.list_models': ( 'cleanup.html#forecastgc.list_models',
+                                                                                             'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC.list_training_tables': ( 'cleanup.html#forecastgc.list_training_tables',
+                                                                                                      'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.ForecastGC.report': ( 'cleanup.html#forecastgc.report',
+                                                                                        'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup._as_utc': ('cleanup.html#_as_utc', 'cortex_forecast/cleanup.py'),
+                                         'cortex_forecast.cleanup.model_version': ( 'cleanup.html#model_version',
+                                                                                    'cortex_forecast/cleanup.py')},
+            'cortex_forecast.connection': { 'cortex_forecast.connection.AuthenticationError': ( 'connection.html#authenticationerror',
                                                                                                 'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool': ( 'connection.html#sessionpool',
+                                                                                        'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.__init__': ( 'connection.html#sessionpool.__init__',
+                                                                                                 'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool._close': ( 'connection.html#sessionpool._close',
+                                                                                               'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool._free_slot': ( 'connection.html#sessionpool._free_slot',
+                                                                                                   'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool._healthy': ( 'connection.html#sessionpool._healthy',
+                                                                                                 'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.acquire': ( 'connection.html#sessionpool.acquire',
+                                                                                                'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.close_all': ( 'connection.html#sessionpool.close_all',
+                                                                                                  'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.evict_idle': ( 'connection.html#sessionpool.evict_idle',
+                                                                                                   'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.keep_alive': ( 'connection.html#sessionpool.keep_alive',
+                                                                                                   'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.release': ( 'connection.html#sessionpool.release',
+                                                                                                'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.session': ( 'connection.html#sessionpool.session',
+                                                                                                'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SessionPool.stats': ( 'connection.html#sessionpool.stats',
+                                                                                              'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection': ( 'connection.html#snowparkconnection',
                                                                                                'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection.__enter__': ( 'connection.html#snowparkconnection.__enter__',
@@ -15,65 +156,449 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection.__init__': ( 'connection.html#snowparkconnection.__init__',
                                                                                                         'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SnowparkConnection._cache_scope': ( 'connection.html#snowparkconnection._cache_scope',
+                                                                                                            'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection._configure_key_pair_auth': ( 'connection.html#snowparkconnection._configure_key_pair_auth',
                                                                                                                         'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SnowparkConnection._create_new_session': ( 'connection.html#snowparkconnection._create_new_session',
+                                                                                                                   'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection._get_active_or_new_session': ( 'connection.html#snowparkconnection._get_active_or_new_session',
                                                                                                                           'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection._load_private_key': ( 'connection.html#snowparkconnection._load_private_key',
                                                                                                                  'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SnowparkConnection.cached_sql': ( 'connection.html#snowparkconnection.cached_sql',
+                                                                                                          'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SnowparkConnection.cached_table_preview': ( 'connection.html#snowparkconnection.cached_table_preview',
+                                                                                                                    'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection.close_session': ( 'connection.html#snowparkconnection.close_session',
                                                                                                              'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection.get_session': ( 'connection.html#snowparkconnection.get_session',
                                                                                                            'cortex_forecast/connection.py'),
                                             'cortex_forecast.connection.SnowparkConnection.load_connection_config': ( 'connection.html#snowparkconnection.load_connection_config',
-                                                                                                                      'cortex_forecast/connection.py')},
-            'cortex_forecast.forecast': { 'cortex_forecast.forecast.SnowflakeMLForecast': ( 'cortex_forecast.html#snowflakemlforecast',
+                                                                                                                      'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.SnowparkConnection.run_sql': ( 'connection.html#snowparkconnection.run_sql',
+                                                                                                       'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection._file_version': ( 'connection.html#_file_version',
+                                                                                          'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection._login': ( 'connection.html#_login',
+                                                                                   'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection._pool_key': ( 'connection.html#_pool_key',
+                                                                                      'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.clear_credential_cache': ( 'connection.html#clear_credential_cache',
+                                                                                                   'cortex_forecast/connection.py'),
+                                            'cortex_forecast.connection.get_session_pool': ( 'connection.html#get_session_pool',
+                                                                                             'cortex_forecast/connection.py')},
+            'cortex_forecast.forecast': { 'cortex_forecast.forecast.ForecastPlan': ( 'cortex_forecast.html#forecastplan',
+                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.ForecastPlan.__len__': ( 'cortex_forecast.html#forecastplan.__len__',
+                                                                                             'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.ForecastPlan.sql': ( 'cortex_forecast.html#forecastplan.sql',
+                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.ForecastPlan.to_dataframe': ( 'cortex_forecast.html#forecastplan.to_dataframe',
+                                                                                                  'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.ForecastPlan.to_script': ( 'cortex_forecast.html#forecastplan.to_script',
+                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts': ( 'cortex_forecast.html#lazycharts',
+                                                                                   'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.__getitem__': ( 'cortex_forecast.html#lazycharts.__getitem__',
+                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.__init__': ( 'cortex_forecast.html#lazycharts.__init__',
+                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.__iter__': ( 'cortex_forecast.html#lazycharts.__iter__',
+                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.__len__': ( 'cortex_forecast.html#lazycharts.__len__',
+                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.frame': ( 'cortex_forecast.html#lazycharts.frame',
+                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.n_pages': ( 'cortex_forecast.html#lazycharts.n_pages',
+                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.page': ( 'cortex_forecast.html#lazycharts.page',
+                                                                                        'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.page_series': ( 'cortex_forecast.html#lazycharts.page_series',
+                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.LazyCharts.search': ( 'cortex_forecast.html#lazycharts.search',
+                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast': ( 'cortex_forecast.html#snowflakemlforecast',
                                                                                             'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.__init__': ( 'cortex_forecast.html#snowflakemlforecast.__init__',
                                                                                                      'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._compile_plan': ( 'cortex_forecast.html#snowflakemlforecast._compile_plan',
+                                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._create_tag_sql': ( 'cortex_forecast.html#snowflakemlforecast._create_tag_sql',
+                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._diagnostics_sql': ( 'cortex_forecast.html#snowflakemlforecast._diagnostics_sql',
+                                                                                                             'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._fetch_forecast_sql': ( 'cortex_forecast.html#snowflakemlforecast._fetch_forecast_sql',
+                                                                                                                'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._format_value': ( 'cortex_forecast.html#snowflakemlforecast._format_value',
                                                                                                           'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._generate_create_model_sql': ( 'cortex_forecast.html#snowflakemlforecast._generate_create_model_sql',
                                                                                                                        'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._generate_forecast_sql': ( 'cortex_forecast.html#snowflakemlforecast._generate_forecast_sql',
                                                                                                                    'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._generate_incremental_input_data_sql': ( 'cortex_forecast.html#snowflakemlforecast._generate_incremental_input_data_sql',
+                                                                                                                                 'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._generate_input_data_sql': ( 'cortex_forecast.html#snowflakemlforecast._generate_input_data_sql',
                                                                                                                      'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._generate_unique_model_name': ( 'cortex_forecast.html#snowflakemlforecast._generate_unique_model_name',
                                                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._historic_actuals_sql': ( 'cortex_forecast.html#snowflakemlforecast._historic_actuals_sql',
+                                                                                                                  'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._incremental_training_table_name': ( 'cortex_forecast.html#snowflakemlforecast._incremental_training_table_name',
+                                                                                                                             'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast._load_config': ( 'cortex_forecast.html#snowflakemlforecast._load_config',
                                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._local_training_sql': ( 'cortex_forecast.html#snowflakemlforecast._local_training_sql',
+                                                                                                                'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._model_comment': ( 'cortex_forecast.html#snowflakemlforecast._model_comment',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._model_family_pattern': ( 'cortex_forecast.html#snowflakemlforecast._model_family_pattern',
+                                                                                                                  'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._output_columns': ( 'cortex_forecast.html#snowflakemlforecast._output_columns',
+                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._output_table_ddl': ( 'cortex_forecast.html#snowflakemlforecast._output_table_ddl',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._output_table_statements': ( 'cortex_forecast.html#snowflakemlforecast._output_table_statements',
+                                                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._output_write_mode': ( 'cortex_forecast.html#snowflakemlforecast._output_write_mode',
+                                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._plan_key': ( 'cortex_forecast.html#snowflakemlforecast._plan_key',
+                                                                                                      'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._planning': ( 'cortex_forecast.html#snowflakemlforecast._planning',
+                                                                                                      'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._registry_ddl': ( 'cortex_forecast.html#snowflakemlforecast._registry_ddl',
+                                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._retention_sql': ( 'cortex_forecast.html#snowflakemlforecast._retention_sql',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._reuse_settings': ( 'cortex_forecast.html#snowflakemlforecast._reuse_settings',
+                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._run_step_async': ( 'cortex_forecast.html#snowflakemlforecast._run_step_async',
+                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._series_filter': ( 'cortex_forecast.html#snowflakemlforecast._series_filter',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._series_filter_ctes': ( 'cortex_forecast.html#snowflakemlforecast._series_filter_ctes',
+                                                                                                                'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._set_progress': ( 'cortex_forecast.html#snowflakemlforecast._set_progress',
+                                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._shard_predicate': ( 'cortex_forecast.html#snowflakemlforecast._shard_predicate',
+                                                                                                             'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._timestamp_literal': ( 'cortex_forecast.html#snowflakemlforecast._timestamp_literal',
+                                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._training_select_clause': ( 'cortex_forecast.html#snowflakemlforecast._training_select_clause',
+                                                                                                                    'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._training_table_statements': ( 'cortex_forecast.html#snowflakemlforecast._training_table_statements',
+                                                                                                                       'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._training_window_bounds': ( 'cortex_forecast.html#snowflakemlforecast._training_window_bounds',
+                                                                                                                    'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast._training_window_predicate': ( 'cortex_forecast.html#snowflakemlforecast._training_window_predicate',
+                                                                                                                       'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.chart_settings': ( 'cortex_forecast.html#snowflakemlforecast.chart_settings',
+                                                                                                           'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.cleanup': ( 'cortex_forecast.html#snowflakemlforecast.cleanup',
                                                                                                     'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.create_altair_visualization': ( 'cortex_forecast.html#snowflakemlforecast.create_altair_visualization',
                                                                                                                         'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.create_and_run_forecast': ( 'cortex_forecast.html#snowflakemlforecast.create_and_run_forecast',
                                                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.create_and_run_forecast_async': ( 'cortex_forecast.html#snowflakemlforecast.create_and_run_forecast_async',
+                                                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.create_faceted_chart': ( 'cortex_forecast.html#snowflakemlforecast.create_faceted_chart',
+                                                                                                                 'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.create_feature_importance_chart': ( 'cortex_forecast.html#snowflakemlforecast.create_feature_importance_chart',
                                                                                                                             'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.create_model': ( 'cortex_forecast.html#snowflakemlforecast.create_model',
+                                                                                                         'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.create_single_chart': ( 'cortex_forecast.html#snowflakemlforecast.create_single_chart',
                                                                                                                 'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.create_tags': ( 'cortex_forecast.html#snowflakemlforecast.create_tags',
                                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.create_training_table': ( 'cortex_forecast.html#snowflakemlforecast.create_training_table',
+                                                                                                                  'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.display': ( 'cortex_forecast.html#snowflakemlforecast.display',
                                                                                                     'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.display_charts': ( 'cortex_forecast.html#snowflakemlforecast.display_charts',
                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.evaluation_metrics_table': ( 'cortex_forecast.html#snowflakemlforecast.evaluation_metrics_table',
+                                                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.fetch_dataframe': ( 'cortex_forecast.html#snowflakemlforecast.fetch_dataframe',
+                                                                                                            'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.fetch_dataframes': ( 'cortex_forecast.html#snowflakemlforecast.fetch_dataframes',
+                                                                                                             'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.fetch_forecast': ( 'cortex_forecast.html#snowflakemlforecast.fetch_forecast',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.find_registered_model': ( 'cortex_forecast.html#snowflakemlforecast.find_registered_model',
+                                                                                                                  'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.generate_forecast_and_visualization': ( 'cortex_forecast.html#snowflakemlforecast.generate_forecast_and_visualization',
                                                                                                                                 'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.get_fully_qualified_name': ( 'cortex_forecast.html#snowflakemlforecast.get_fully_qualified_name',
                                                                                                                      'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.get_training_data_query': ( 'cortex_forecast.html#snowflakemlforecast.get_training_data_query',
                                                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.get_training_watermark': ( 'cortex_forecast.html#snowflakemlforecast.get_training_watermark',
+                                                                                                                   'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.iter_chart_series': ( 'cortex_forecast.html#snowflakemlforecast.iter_chart_series',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.iter_forecast': ( 'cortex_forecast.html#snowflakemlforecast.iter_forecast',
+                                                                                                          'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.jupyter_display': ( 'cortex_forecast.html#snowflakemlforecast.jupyter_display',
                                                                                                             'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.load_historic_actuals': ( 'cortex_forecast.html#snowflakemlforecast.load_historic_actuals',
                                                                                                                   'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.local_backtest': ( 'cortex_forecast.html#snowflakemlforecast.local_backtest',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.local_forecast': ( 'cortex_forecast.html#snowflakemlforecast.local_forecast',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.model_fingerprint': ( 'cortex_forecast.html#snowflakemlforecast.model_fingerprint',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.persist_evaluation_metrics': ( 'cortex_forecast.html#snowflakemlforecast.persist_evaluation_metrics',
+                                                                                                                       'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.plan': ( 'cortex_forecast.html#snowflakemlforecast.plan',
+                                                                                                 'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.prepare_chart_data': ( 'cortex_forecast.html#snowflakemlforecast.prepare_chart_data',
+                                                                                                               'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.prepare_output': ( 'cortex_forecast.html#snowflakemlforecast.prepare_output',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.register_model': ( 'cortex_forecast.html#snowflakemlforecast.register_model',
+                                                                                                           'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.resolve_training_window': ( 'cortex_forecast.html#snowflakemlforecast.resolve_training_window',
+                                                                                                                    'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.reuse_registered_model': ( 'cortex_forecast.html#snowflakemlforecast.reuse_registered_model',
+                                                                                                                   'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.run_command': ( 'cortex_forecast.html#snowflakemlforecast.run_command',
                                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.run_command_async': ( 'cortex_forecast.html#snowflakemlforecast.run_command_async',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.run_forecast': ( 'cortex_forecast.html#snowflakemlforecast.run_forecast',
+                                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.run_plan': ( 'cortex_forecast.html#snowflakemlforecast.run_plan',
+                                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.run_procedure': ( 'cortex_forecast.html#snowflakemlforecast.run_procedure',
+                                                                                                          'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.run_query': ( 'cortex_forecast.html#snowflakemlforecast.run_query',
                                                                                                       'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.series_error_ranking': ( 'cortex_forecast.html#snowflakemlforecast.series_error_ranking',
+                                                                                                                 'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.series_pruning_report': ( 'cortex_forecast.html#snowflakemlforecast.series_pruning_report',
+                                                                                                                  'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.show_key_data_aspects': ( 'cortex_forecast.html#snowflakemlforecast.show_key_data_aspects',
                                                                                                                   'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.source_data_version': ( 'cortex_forecast.html#snowflakemlforecast.source_data_version',
+                                                                                                                'cortex_forecast/forecast.py'),
                                           'cortex_forecast.forecast.SnowflakeMLForecast.streamlit_display': ( 'cortex_forecast.html#snowflakemlforecast.streamlit_display',
-                                                                                                              'cortex_forecast/forecast.py')}}}
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.training_data_key': ( 'cortex_forecast.html#snowflakemlforecast.training_data_key',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.SnowflakeMLForecast.wait_for_forecast': ( 'cortex_forecast.html#snowflakemlforecast.wait_for_forecast',
+                                                                                                              'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast._async_result_to_pandas': ( 'cortex_forecast.html#_async_result_to_pandas',
+                                                                                                'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast._fetch_arrow': ( 'cortex_forecast.html#_fetch_arrow',
+                                                                                     'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast._fetch_batches': ( 'cortex_forecast.html#_fetch_batches',
+                                                                                       'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast._fetch_rows': ( 'cortex_forecast.html#_fetch_rows',
+                                                                                    'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast._normalize_series_frame': ( 'cortex_forecast.html#_normalize_series_frame',
+                                                                                                'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.clear_plan_cache': ( 'cortex_forecast.html#clear_plan_cache',
+                                                                                         'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.minmax_downsample': ( 'cortex_forecast.html#minmax_downsample',
+                                                                                          'cortex_forecast/forecast.py'),
+                                          'cortex_forecast.forecast.register_result_format': ( 'cortex_forecast.html#register_result_format',
+                                                                                               'cortex_forecast/forecast.py')},
+            'cortex_forecast.local': { 'cortex_forecast.local.LocalForecaster': ('local.html#localforecaster', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.LocalForecaster.__init__': ( 'local.html#localforecaster.__init__',
+                                                                                           'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.LocalForecaster.backtest': ( 'local.html#localforecaster.backtest',
+                                                                                           'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.LocalForecaster.fit': ( 'local.html#localforecaster.fit',
+                                                                                      'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.LocalForecaster.forecast': ( 'local.html#localforecaster.forecast',
+                                                                                           'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.LocalForecaster.from_config': ( 'local.html#localforecaster.from_config',
+                                                                                              'cortex_forecast/local.py'),
+                                       'cortex_forecast.local._backtest_chunk': ('local.html#_backtest_chunk', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local._forward_fill': ('local.html#_forward_fill', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local._row_std': ('local.html#_row_std', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.exponential_smoothing': ( 'local.html#exponential_smoothing',
+                                                                                        'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.moving_average': ('local.html#moving_average', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.panel_array': ('local.html#panel_array', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.right_align': ('local.html#right_align', 'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.rolling_origin_splits': ( 'local.html#rolling_origin_splits',
+                                                                                        'cortex_forecast/local.py'),
+                                       'cortex_forecast.local.seasonal_naive': ('local.html#seasonal_naive', 'cortex_forecast/local.py')},
+            'cortex_forecast.procedure': { 'cortex_forecast.procedure._package_zip': ( 'procedure.html#_package_zip',
+                                                                                       'cortex_forecast/procedure.py'),
+                                           'cortex_forecast.procedure._session_scope': ( 'procedure.html#_session_scope',
+                                                                                         'cortex_forecast/procedure.py'),
+                                           'cortex_forecast.procedure.deploy_procedure': ( 'procedure.html#deploy_procedure',
+                                                                                           'cortex_forecast/procedure.py'),
+                                           'cortex_forecast.procedure.procedure_ddl': ( 'procedure.html#procedure_ddl',
+                                                                                        'cortex_forecast/procedure.py'),
+                                           'cortex_forecast.procedure.run_forecast_procedure': ( 'procedure.html#run_forecast_procedure',
+                                                                                                 'cortex_forecast/procedure.py')},
+            'cortex_forecast.sweep': { 'cortex_forecast.sweep.ForecastSweep': ('sweep.html#forecastsweep', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.__init__': ( 'sweep.html#forecastsweep.__init__',
+                                                                                         'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep._candidate_model_name': ( 'sweep.html#forecastsweep._candidate_model_name',
+                                                                                                      'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep._evaluate': ( 'sweep.html#forecastsweep._evaluate',
+                                                                                          'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep._prune': ( 'sweep.html#forecastsweep._prune',
+                                                                                       'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep._run_cortex': ( 'sweep.html#forecastsweep._run_cortex',
+                                                                                            'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep._screen_local': ( 'sweep.html#forecastsweep._screen_local',
+                                                                                              'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.best': ( 'sweep.html#forecastsweep.best',
+                                                                                     'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.best_model': ( 'sweep.html#forecastsweep.best_model',
+                                                                                           'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.candidate_config': ( 'sweep.html#forecastsweep.candidate_config',
+                                                                                                 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.leaderboard': ( 'sweep.html#forecastsweep.leaderboard',
+                                                                                            'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.run': ( 'sweep.html#forecastsweep.run',
+                                                                                    'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.ForecastSweep.write_leaderboard': ( 'sweep.html#forecastsweep.write_leaderboard',
+                                                                                                  'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.SweepResult': ('sweep.html#sweepresult', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.SweepResult.ok': ('sweep.html#sweepresult.ok', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep._metric_score': ('sweep.html#_metric_score', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep._score_key': ('sweep.html#_score_key', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep._set_path': ('sweep.html#_set_path', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.apply_params': ('sweep.html#apply_params', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.grid_candidates': ('sweep.html#grid_candidates', 'cortex_forecast/sweep.py'),
+                                       'cortex_forecast.sweep.random_candidates': ( 'sweep.html#random_candidates',
+                                                                                    'cortex_forecast/sweep.py')},
+            'cortex_forecast.testing': { 'cortex_forecast.testing.DuckDBSession': ( 'testing.html#duckdbsession',
+                                                                                    'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.__init__': ( 'testing.html#duckdbsession.__init__',
+                                                                                             'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession._call_procedure': ( 'testing.html#duckdbsession._call_procedure',
+                                                                                                    'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession._expand_table_functions': ( 'testing.html#duckdbsession._expand_table_functions',
+                                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession._register': ( 'testing.html#duckdbsession._register',
+                                                                                              'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession._run': ( 'testing.html#duckdbsession._run',
+                                                                                         'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession._run_script': ( 'testing.html#duckdbsession._run_script',
+                                                                                                'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.close': ( 'testing.html#duckdbsession.close',
+                                                                                          'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.create_table': ( 'testing.html#duckdbsession.create_table',
+                                                                                                 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.get_current_database': ( 'testing.html#duckdbsession.get_current_database',
+                                                                                                         'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.get_current_schema': ( 'testing.html#duckdbsession.get_current_schema',
+                                                                                                       'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.get_current_warehouse': ( 'testing.html#duckdbsession.get_current_warehouse',
+                                                                                                          'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.DuckDBSession.translate': ( 'testing.html#duckdbsession.translate',
+                                                                                              'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalAsyncJob': ( 'testing.html#localasyncjob',
+                                                                                    'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalAsyncJob.__init__': ( 'testing.html#localasyncjob.__init__',
+                                                                                             'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalAsyncJob._run': ( 'testing.html#localasyncjob._run',
+                                                                                         'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalAsyncJob.is_done': ( 'testing.html#localasyncjob.is_done',
+                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalAsyncJob.result': ( 'testing.html#localasyncjob.result',
+                                                                                           'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame': ( 'testing.html#localdataframe',
+                                                                                     'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame.__init__': ( 'testing.html#localdataframe.__init__',
+                                                                                              'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame._result': ( 'testing.html#localdataframe._result',
+                                                                                             'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame.collect': ( 'testing.html#localdataframe.collect',
+                                                                                             'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame.collect_nowait': ( 'testing.html#localdataframe.collect_nowait',
+                                                                                                    'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame.to_pandas': ( 'testing.html#localdataframe.to_pandas',
+                                                                                               'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalDataFrame.to_pandas_batches': ( 'testing.html#localdataframe.to_pandas_batches',
+                                                                                                       'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalQueryHistory': ( 'testing.html#localqueryhistory',
+                                                                                        'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalQueryHistory.__init__': ( 'testing.html#localqueryhistory.__init__',
+                                                                                                 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession': ( 'testing.html#localsession',
+                                                                                   'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.__init__': ( 'testing.html#localsession.__init__',
+                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession._execute': ( 'testing.html#localsession._execute',
+                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession._run': ( 'testing.html#localsession._run',
+                                                                                        'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.add_response': ( 'testing.html#localsession.add_response',
+                                                                                                'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.close': ( 'testing.html#localsession.close',
+                                                                                         'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.create_async_job': ( 'testing.html#localsession.create_async_job',
+                                                                                                    'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.query_history': ( 'testing.html#localsession.query_history',
+                                                                                                 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.LocalSession.sql': ( 'testing.html#localsession.sql',
+                                                                                       'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel': ( 'testing.html#seasonalnaivemodel',
+                                                                                         'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel.__init__': ( 'testing.html#seasonalnaivemodel.__init__',
+                                                                                                  'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel._groups': ( 'testing.html#seasonalnaivemodel._groups',
+                                                                                                 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel.evaluation_metrics': ( 'testing.html#seasonalnaivemodel.evaluation_metrics',
+                                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel.feature_importance': ( 'testing.html#seasonalnaivemodel.feature_importance',
+                                                                                                            'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.SeasonalNaiveModel.forecast': ( 'testing.html#seasonalnaivemodel.forecast',
+                                                                                                  'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing._closing_paren': ( 'testing.html#_closing_paren',
+                                                                                     'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing._named_arg': ('testing.html#_named_arg', 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing._split_statements': ( 'testing.html#_split_statements',
+                                                                                        'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.make_config': ('testing.html#make_config', 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.make_forecast_frame': ( 'testing.html#make_forecast_frame',
+                                                                                          'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.make_panel': ('testing.html#make_panel', 'cortex_forecast/testing.py'),
+                                         'cortex_forecast.testing.pipeline_session': ( 'testing.html#pipeline_session',
+                                                                                       'cortex_forecast/testing.py')},
+            'cortex_forecast.tracing': { 'cortex_forecast.tracing.RunReport': ('tracing.html#runreport', 'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.__init__': ( 'tracing.html#runreport.__init__',
+                                                                                         'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.__len__': ( 'tracing.html#runreport.__len__',
+                                                                                        'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.__repr__': ( 'tracing.html#runreport.__repr__',
+                                                                                         'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport._emit': ( 'tracing.html#runreport._emit',
+                                                                                      'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport._emit_opentelemetry': ( 'tracing.html#runreport._emit_opentelemetry',
+                                                                                                    'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.enrich': ( 'tracing.html#runreport.enrich',
+                                                                                       'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.finish': ( 'tracing.html#runreport.finish',
+                                                                                       'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.finish_query': ( 'tracing.html#runreport.finish_query',
+                                                                                             'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.span': ( 'tracing.html#runreport.span',
+                                                                                     'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.start': ( 'tracing.html#runreport.start',
+                                                                                      'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.step': ( 'tracing.html#runreport.step',
+                                                                                     'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.summary': ( 'tracing.html#runreport.summary',
+                                                                                        'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.RunReport.to_dataframe': ( 'tracing.html#runreport.to_dataframe',
+                                                                                             'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.Span': ('tracing.html#span', 'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.Span.finish': ('tracing.html#span.finish', 'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.Span.to_dict': ( 'tracing.html#span.to_dict',
+                                                                                   'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing._matching_query_id': ( 'tracing.html#_matching_query_id',
+                                                                                         'cortex_forecast/tracing.py'),
+                                         'cortex_forecast.tracing.traced_step': ( 'tracing.html#traced_step',
+                                                                                  'cortex_forecast/tracing.py')}}}
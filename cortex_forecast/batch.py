@@ -0,0 +1,325 @@
+"""Train and score many forecast configs concurrently"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_batch.ipynb.
+
+# %% auto 0
+__all__ = ['BatchResult', 'ForecastBatch', 'ShardResult', 'ShardedForecast']
+
+# %% ../nbs/04_batch.ipynb 3
+import time
+import hashlib
+import logging
+import threading
+import pandas as pd
+
+from dataclasses import dataclass, field
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
+from .connection import SnowparkConnection, get_session_pool
+from .cache import get_query_cache
+from .forecast import ForecastPlan, SnowflakeMLForecast
+
+# %% ../nbs/04_batch.ipynb 5
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+@dataclass
+class BatchResult:
+    index: int
+    model_name: str
+    model: SnowflakeMLForecast
+    forecast: Optional[pd.DataFrame] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    shared_training_table: bool = False
+    error: Optional[Exception] = None
+    value: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ForecastBatch:
+    def __init__(self, configs: List[Union[str, Dict]], connection_config=None, session=None, max_workers: int = 4,
+                 is_streamlit=False, **forecast_kwargs):
+        if session is None:
+            session = SnowparkConnection(connection_config=connection_config).get_session()
+        self.session = session
+        self.max_workers = max_workers
+        self.models = [
+            SnowflakeMLForecast(config, connection_config=connection_config, is_streamlit=is_streamlit,
+                                session=session, **forecast_kwargs)
+            for config in configs
+        ]
+        self.results: List[BatchResult] = []
+
+    def training_groups(self) -> Dict[tuple, List[int]]:
+        groups = {}
+        for i, model in enumerate(self.models):
+            groups.setdefault(model.training_data_key(), []).append(i)
+        return groups
+
+    def _output_key(self, model):
+        return model.get_fully_qualified_name(model.config['output']['table']).upper()
+
+    def _create_tags(self):
+        # Tags are account objects, so each distinct tag set only needs creating once
+        seen = set()
+        for model in self.models:
+            tags = frozenset((model.config['model'].get('tags') or {}).items())
+            if tags not in seen:
+                seen.add(tags)
+                model.create_tags()
+
+    def _build_training_table(self, leader):
+        _, elapsed = _timed(leader.create_training_table)
+        return leader, elapsed
+
+    def _build_and_score(self, result, table_future, output_lock, evaluate=None):
+        model = result.model
+        start = time.perf_counter()
+        try:
+            leader, result.timings['training_table'] = table_future.result()
+            if model is not leader:
+                self._share_training_table(model, leader)
+                result.shared_training_table = True
+            if evaluate is not None:
+                result.value, result.timings['evaluate'] = _timed(lambda: evaluate(result))
+                result.timings['total'] = time.perf_counter() - start
+                return
+            _, result.timings['model'] = _timed(model.create_model)
+            # Only the DELETEs race with other writers; the inserts themselves append concurrently
+            with output_lock:
+                _, prepare_seconds = _timed(model.prepare_output)
+            _, result.timings['forecast'] = _timed(lambda: model.run_forecast(prepare=False))
+            result.timings['forecast'] += prepare_seconds
+            result.forecast, result.timings['fetch'] = _timed(model.fetch_forecast)
+        except Exception as e:
+            logging.error(f"Forecast {result.index} ({result.model_name}) failed: {e}")
+            result.error = e
+        result.timings['total'] = time.perf_counter() - start
+
+    def run(self, evaluate: Optional[Callable[[BatchResult], Any]] = None) -> List[BatchResult]:
+        """Build the shared training tables, then train, forecast and fetch every model.
+
+        With `evaluate`, it is called with each `BatchResult` once the model's training table is ready, in place
+        of the model, forecast and fetch steps; its return value is kept in `result.value`.
+        """
+        self._create_tags()
+        groups = self.training_groups()
+        results = [BatchResult(i, model.model_name, model) for i, model in enumerate(self.models)]
+        output_locks = {key: threading.Lock() for key in {self._output_key(model) for model in self.models}}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # Training tables are queued before any model task, so a model task waiting on
+            # its table can never hold the last free worker while that table is still queued
+            tables = {key: pool.submit(self._build_training_table, self.models[indices[0]])
+                      for key, indices in groups.items()}
+            futures = [
+                pool.submit(self._build_and_score, results[i], tables[key], output_locks[self._output_key(self.models[i])],
+                            evaluate)
+                for key, indices in groups.items() for i in indices
+            ]
+            for future in futures:
+                future.result()
+
+        self.results = results
+        return results
+
+    def _share_training_table(self, model, leader):
+        model.temp_table_name = leader.temp_table_name
+        model.training_data_query = leader.training_data_query
+        model.training_window = leader.training_window
+
+    def plan(self, max_timestamp=None) -> ForecastPlan:
+        # Each training group's table is planned once by its leader; identical idempotent
+        # statements (tags, output table DDL) are kept only the first time they appear
+        statements, seen, hashes, cached = [], set(), [], True
+        for indices in self.training_groups().values():
+            leader = self.models[indices[0]]
+            for i in indices:
+                model = self.models[i]
+                if model is leader:
+                    steps = ('tags', 'training_table', 'model', 'forecast')
+                else:
+                    self._share_training_table(model, leader)
+                    steps = ('tags', 'model', 'forecast')
+                model_plan = model.plan(max_timestamp, steps)
+                hashes.append(model_plan.config_hash)
+                cached = cached and model_plan.cached
+                for step, sql in model_plan.statements:
+                    if sql not in seen:
+                        seen.add(sql)
+                        statements.append((step, sql))
+        config_hash = hashlib.sha256('|'.join(hashes).encode()).hexdigest()
+        return ForecastPlan(statements, config_hash, [model.model_name for model in self.models], cached)
+
+    def run_plan(self, plan: Optional[ForecastPlan] = None) -> List[BatchResult]:
+        # One request trains and scores every model, then all forecasts are fetched concurrently
+        plan = plan or self.plan()
+        leader = self.models[0]
+        with leader.report.step('plan'):
+            _, elapsed = _timed(lambda: leader.fetch_dataframe(plan.to_script()))
+        for _, sql in plan.statements:
+            get_query_cache().invalidate_after(sql)
+        frames, fetch_elapsed = _timed(lambda: leader.fetch_dataframes(
+            {str(i): model._fetch_forecast_sql() for i, model in enumerate(self.models)}))
+
+        shared = {i for indices in self.training_groups().values() for i in indices[1:]}
+        self.results = [
+            BatchResult(i, model.model_name, model, forecast=frames[str(i)], shared_training_table=i in shared,
+                        timings={'plan': elapsed, 'fetch': fetch_elapsed, 'total': elapsed + fetch_elapsed})
+            for i, model in enumerate(self.models)
+        ]
+        return self.results
+
+    def summary(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            'index': r.index,
+            'model_name': r.model_name,
+            'ok': r.ok,
+            'shared_training_table': r.shared_training_table,
+            'error': str(r.error) if r.error else None,
+            **r.timings,
+        } for r in self.results])
+
+# %% ../nbs/04_batch.ipynb 13
+@dataclass
+class ShardResult:
+    shard: int
+    model_name: str
+    warehouse: Optional[str] = None
+    status: str = 'pending'
+    seconds: Optional[float] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'done'
+
+
+class ShardedForecast:
+    SHARD_TABLE = 'CORTEX_FORECAST_SHARDS'
+
+    def __init__(self, config: Union[str, Dict], shards: int = 8, connection_config=None, session=None,
+                 max_workers: int = 4, warehouses: Optional[List[str]] = None, pool=None,
+                 model_name: Optional[str] = None, **forecast_kwargs):
+        self.model = SnowflakeMLForecast(config, connection_config=connection_config, session=session, **forecast_kwargs)
+        if not self.model.config['input_data'].get('series_column'):
+            raise ValueError("Sharded training needs a series_column to partition on.")
+        if self.model.config['forecast_config'].get('incremental_training'):
+            raise ValueError("Sharded training does not support incremental_training.")
+        if model_name:
+            self.model.model_name = self.model.report.name = model_name
+        self.shards = shards
+        self.max_workers = max_workers
+        self.warehouses = list(warehouses or [])
+        self.pool = pool or (get_session_pool() if self.warehouses else None)
+        self.forecast_kwargs = forecast_kwargs
+        self.results: List[ShardResult] = []
+
+    def _status_table(self):
+        return self.model.get_fully_qualified_name(self.SHARD_TABLE)
+
+    def _prepare(self):
+        # Shared by every shard: tags, one MAX() for the training window, and the output and status tables
+        model = self.model
+        model.create_tags()
+        model.resolve_training_window()
+        model.run_command(f"""
+        CREATE TABLE IF NOT EXISTS {self._status_table()} (
+            MODEL_NAME STRING, SHARD INT, SHARD_COUNT INT, SHARD_MODEL STRING, WAREHOUSE STRING,
+            STATUS STRING, ERROR STRING, SECONDS FLOAT, UPDATED_AT TIMESTAMP_NTZ
+        )""")
+        for sql in model._output_table_statements():
+            model.run_command(sql)
+
+    def completed_shards(self) -> set:
+        df = self.model.fetch_dataframe(f"""
+        SELECT SHARD FROM {self._status_table()}
+        WHERE MODEL_NAME = '{self.model.model_name}' AND SHARD_COUNT = {self.shards} AND STATUS = 'done'
+        """)
+        return set(df.iloc[:, 0].astype(int)) if len(df) else set()
+
+    def _record(self, result: ShardResult):
+        error = str(result.error)[:1000].replace("'", "''") if result.error else None
+        values = {
+            'SHARD_COUNT': str(self.shards),
+            'SHARD_MODEL': f"'{result.model_name}'",
+            'WAREHOUSE': f"'{result.warehouse}'" if result.warehouse else 'NULL',
+            'STATUS': f"'{result.status}'",
+            'ERROR': f"'{error}'" if error else 'NULL',
+            'SECONDS': str(result.seconds) if result.seconds is not None else 'NULL',
+            'UPDATED_AT': 'CURRENT_TIMESTAMP()',
+        }
+        self.model.run_command(f"""
+        MERGE INTO {self._status_table()} t
+        USING (SELECT '{self.model.model_name}' AS MODEL_NAME, {result.shard} AS SHARD) s
+        ON t.MODEL_NAME = s.MODEL_NAME AND t.SHARD = s.SHARD
+        WHEN MATCHED THEN UPDATE SET {', '.join(f'{col} = {value}' for col, value in values.items())}
+        WHEN NOT MATCHED THEN INSERT (MODEL_NAME, SHARD, {', '.join(values)})
+            VALUES (s.MODEL_NAME, s.SHARD, {', '.join(values.values())})""")
+
+    def _shard_model(self, result: ShardResult, session) -> SnowflakeMLForecast:
+        shard = SnowflakeMLForecast(self.model.config, connection_config=self.model.connection_config, session=session,
+                                    **self.forecast_kwargs)
+        shard.model_name = shard.report.name = result.model_name
+        shard.shard = (result.shard, self.shards)
+        shard.training_window = self.model.training_window
+        return shard
+
+    def _run_shard(self, result: ShardResult):
+        start = time.perf_counter()
+        connection_config = {**self.model.connection_config, 'warehouse': result.warehouse}
+        try:
+            with (self.pool.session(connection_config) if result.warehouse else nullcontext(self.model.session)) as session:
+                shard = self._shard_model(result, session)
+                for sql in shard._training_table_statements():
+                    shard.run_command(sql)
+                shard.create_model()
+                # Output rows carry the parent's MODEL_NAME; the series hash picks out this shard's rows, so
+                # whatever an earlier attempt wrote before failing is cleared and a resumed shard never duplicates
+                output_table = shard.get_fully_qualified_name(shard.config['output']['table'])
+                shard.run_command(f"""
+                DELETE FROM {output_table}
+                WHERE MODEL_NAME = '{self.model.model_name}' AND {shard._shard_predicate(*shard.shard)}""")
+                shard.run_command(shard._generate_forecast_sql(output_model_name=self.model.model_name))
+            result.status, result.error = 'done', None
+        except Exception as e:
+            logging.error(f"Shard {result.shard}/{self.shards} ({result.model_name}) failed: {e}")
+            result.status, result.error = 'failed', e
+        result.seconds = time.perf_counter() - start
+        self._record(result)
+
+    def run(self, resume: bool = False) -> List[ShardResult]:
+        self._prepare()
+        done = self.completed_shards() if resume else set()
+        results = [
+            ShardResult(k, f"{self.model.model_name}_S{k:03d}",
+                        warehouse=self.warehouses[k % len(self.warehouses)] if self.warehouses else None,
+                        status='done' if k in done else 'pending')
+            for k in range(self.shards)
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            list(pool.map(self._run_shard, [r for r in results if r.status == 'pending']))
+        self.results = results
+        return results
+
+    def resume(self) -> List[ShardResult]:
+        return self.run(resume=True)
+
+    def fetch_forecast(self) -> pd.DataFrame:
+        return self.model.fetch_forecast()
+
+    def summary(self) -> pd.DataFrame:
+        return pd.DataFrame([{
+            'shard': r.shard,
+            'model_name': r.model_name,
+            'warehouse': r.warehouse,
+            'status': r.status,
+            'seconds': r.seconds,
+            'error': str(r.error) if r.error else None,
+        } for r in self.results])
@@ -0,0 +1,177 @@
+"""Offline throughput benchmarks against the local stand-in session"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['benchmark_result_formats', 'benchmark_forecast_batch', 'benchmark_session_pool', 'benchmark_chart_preparation',
+           'benchmark_end_to_end', 'compare_benchmarks']
+
+# %% ../nbs/03_benchmark.ipynb 3
+import io
+import sys
+import time
+import tracemalloc
+import pandas as pd
+
+from typing import Iterable, Optional
+from contextlib import redirect_stdout
+from .batch import ForecastBatch
+from .connection import SessionPool
+from .forecast import SnowflakeMLForecast, LazyCharts, RESULT_FORMATS
+from .testing import DuckDBSession, LocalSession, make_panel, make_config, make_forecast_frame, pipeline_session
+
+# %% ../nbs/03_benchmark.ipynb 4
+def _peak_rss_mb():
+    "The process's peak resident set size in MB, or `None` where `resource` is unavailable (Windows)."
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+def _measure(fn):
+    """Run `fn` once, returning its result, wall time in seconds, the peak of Python allocations traced by
+    `tracemalloc` in MB, and how far the call raised the process's peak RSS in MB."""
+    rss_before = _peak_rss_mb()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Peak RSS only ever grows, so a call that stays under an earlier high-water mark reports 0
+    rss_growth = None if rss_before is None else _peak_rss_mb() - rss_before
+    return result, elapsed, peak / 1024 ** 2, rss_growth
+
+# %% ../nbs/03_benchmark.ipynb 6
+def benchmark_result_formats(n_series: int = 1000, n_steps: int = 100, formats: Optional[Iterable[str]] = None,
+                             repeat: int = 3) -> pd.DataFrame:
+    session = LocalSession({r'FROM PANEL': make_panel(n_series=n_series, n_steps=n_steps)})
+    model = SnowflakeMLForecast(make_config(), connection_config={'database': 'LOCAL', 'schema': 'PUBLIC'}, session=session)
+    results = []
+    for result_format in formats or RESULT_FORMATS:
+        for _ in range(repeat):
+            df, elapsed, traced_mb, rss_mb = _measure(lambda: model.fetch_dataframe("SELECT * FROM PANEL", result_format))
+            results.append({'format': result_format, 'rows': len(df), 'seconds': elapsed, 'rows_per_sec': len(df) / elapsed,
+                            'traced_peak_mb': traced_mb, 'rss_growth_mb': rss_mb})
+    return pd.DataFrame(results).groupby('format', sort=False).agg(
+        {'rows': 'first', 'seconds': 'median', 'rows_per_sec': 'median', 'traced_peak_mb': 'median',
+         'rss_growth_mb': 'max'}).reset_index()
+
+# %% ../nbs/03_benchmark.ipynb 9
+def benchmark_forecast_batch(n_configs: int = 12, n_training_windows: int = 3, latency: float = 0.05,
+                             max_workers: int = 4) -> pd.DataFrame:
+    configs = [make_config(training_days=30 * (1 + i % n_training_windows), forecast_days=7 + i) for i in range(n_configs)]
+    connection_config = {'database': 'LOCAL', 'schema': 'PUBLIC'}
+    results = []
+    with redirect_stdout(io.StringIO()):
+        serial_session = pipeline_session(configs[0], latency=latency)
+        models = [SnowflakeMLForecast(config, connection_config=connection_config, session=serial_session) for config in configs]
+        _, serial_seconds, *_ = _measure(lambda: [model.create_and_run_forecast() for model in models])
+        results.append({'runner': 'serial', 'seconds': serial_seconds, 'statements': len(serial_session.queries)})
+
+        batch = ForecastBatch(configs, connection_config=connection_config,
+                              session=pipeline_session(configs[0], latency=latency), max_workers=max_workers)
+        _, batch_seconds, *_ = _measure(batch.run)
+        results.append({'runner': f'batch[{max_workers}]', 'seconds': batch_seconds, 'statements': len(batch.session.queries)})
+    return pd.DataFrame(results)
+
+# %% ../nbs/03_benchmark.ipynb 12
+def benchmark_session_pool(n_forecasts: int = 20, login_delay: float = 0.2, max_size: int = 2) -> pd.DataFrame:
+    config = make_config()
+    connection_config = {'database': 'LOCAL', 'schema': 'PUBLIC'}
+    logins = []
+
+    def factory(_):
+        time.sleep(login_delay)
+        logins.append(1)
+        return pipeline_session(config)
+
+    def fresh():
+        for _ in range(n_forecasts):
+            SnowflakeMLForecast(config, connection_config=connection_config, session=factory(connection_config)).create_and_run_forecast()
+
+    pool = SessionPool(factory=factory, max_size=max_size)
+    def pooled():
+        for _ in range(n_forecasts):
+            with SnowflakeMLForecast(config, connection_config=connection_config, pool=pool) as model:
+                model.create_and_run_forecast()
+
+    results = []
+    for name, run in (('new session per forecast', fresh), (f'pool[{max_size}]', pooled)):
+        logins.clear()
+        with redirect_stdout(io.StringIO()):
+            _, seconds, *_ = _measure(run)
+        results.append({'runner': name, 'seconds': seconds, 'logins': len(logins)})
+    pool.close_all()
+    return pd.DataFrame(results)
+
+# %% ../nbs/03_benchmark.ipynb 15
+def _legacy_chart_split(df_forecast: pd.DataFrame, df_actuals: pd.DataFrame, series_col: str, ts_col: str) -> dict:
+    "The pre-vectorization chart prep: concat, melt, dropna, then one boolean mask per series."
+    df_forecast, df_actuals = df_forecast.copy(), df_actuals.copy()
+    df_forecast['TYPE'] = 'Forecast'
+    df_actuals['TYPE'] = 'Historic'
+    df_actuals['FORECAST'] = df_actuals['TARGET']
+    df_actuals['LOWER_BOUND'] = df_actuals['UPPER_BOUND'] = float('nan')
+    df = pd.concat([df_forecast, df_actuals], ignore_index=True).melt(
+        id_vars=[ts_col, 'TYPE', series_col], value_vars=['FORECAST', 'LOWER_BOUND', 'UPPER_BOUND'],
+        var_name='VALUE_TYPE', value_name='VOLUME').dropna(subset=['VOLUME'])
+    return {series: df[df[series_col] == series] for series in df[series_col].unique()}
+
+def benchmark_chart_preparation(series_counts: Iterable[int] = (10, 1_000, 10_000), n_steps: int = 21,
+                                horizon: int = 14, legacy_max_series: int = 1_000) -> pd.DataFrame:
+    config = make_config(forecast_days=horizon)
+    model = SnowflakeMLForecast(config, connection_config={'database': 'LOCAL', 'schema': 'PUBLIC'}, session=LocalSession())
+    results = []
+    for n_series in series_counts:
+        df_forecast = make_forecast_frame(config, n_series=n_series)
+        df_actuals = make_panel(n_series=n_series, n_steps=n_steps)
+
+        def vectorized():
+            df, ts_col = model.prepare_chart_data(df_forecast, df_actuals)
+            return dict(model.iter_chart_series(df, 'SERIES'))
+
+        runners = [('vectorized', vectorized)]
+        if n_series <= legacy_max_series:
+            runners.append(('legacy', lambda: _legacy_chart_split(df_forecast, df_actuals, 'SERIES', 'TS')))
+        for name, run in runners:
+            frames, seconds, traced_mb, rss_mb = _measure(run)
+            results.append({'series': n_series, 'method': name, 'charts': len(frames), 'seconds': seconds,
+                            'us_per_series': 1e6 * seconds / n_series, 'traced_peak_mb': traced_mb, 'rss_growth_mb': rss_mb})
+    return pd.DataFrame(results)
+
+# %% ../nbs/03_benchmark.ipynb 18
+def benchmark_end_to_end(sizes: Iterable = ((10, 365), (100, 365), (1_000, 365)), latency: float = 0.0,
+                         training_days: Optional[int] = 120) -> pd.DataFrame:
+    connection_config = {'database': 'LOCAL', 'schema': 'PUBLIC'}
+    results = []
+    for n_series, n_steps in sizes:
+        config = make_config(training_days=training_days)
+        session = DuckDBSession({'PANEL': make_panel(n_series=n_series, n_steps=n_steps)}, latency=latency)
+        model = SnowflakeMLForecast(config, connection_config=connection_config, session=session)
+        phases = (('create_and_run_forecast', model.create_and_run_forecast),
+                  ('fetch_forecast', model.fetch_forecast),
+                  ('generate_forecast_and_visualization', model.generate_forecast_and_visualization))
+        for phase, run in phases:
+            statements = len(session.queries)
+            with redirect_stdout(io.StringIO()):
+                result, seconds, traced_mb, rss_mb = _measure(run)
+            results.append({'series': n_series, 'steps': n_steps, 'phase': phase, 'seconds': seconds,
+                            'traced_peak_mb': traced_mb, 'rss_growth_mb': rss_mb,
+                            'statements': len(session.queries) - statements,
+                            'rows': len(result) if isinstance(result, (pd.DataFrame, LazyCharts)) else None})
+        session.close()
+    return pd.DataFrame(results)
+
+def compare_benchmarks(current: pd.DataFrame, baseline: pd.DataFrame, tolerance: float = 0.2,
+                       keys: Iterable[str] = ('series', 'steps', 'phase')) -> pd.DataFrame:
+    "Rows of `current` whose `seconds` exceed the matching `baseline` row by more than `tolerance`."
+    keys = list(keys)
+    merged = current.merge(baseline[keys + ['seconds']], on=keys, suffixes=('', '_baseline'))
+    merged['ratio'] = merged['seconds'] / merged['seconds_baseline']
+    return merged[merged['ratio'] > 1 + tolerance].reset_index(drop=True)
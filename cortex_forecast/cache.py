@@ -0,0 +1,155 @@
+"""Shared TTL cache for metadata and preview queries"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_cache.ipynb.
+
+# %% auto 0
+__all__ = ['normalize_sql', 'QueryCache', 'get_query_cache', 'set_query_cache']
+
+# %% ../nbs/05_cache.ipynb 3
+import os
+import re
+import time
+import pickle
+import hashlib
+import logging
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# %% ../nbs/05_cache.ipynb 5
+_DDL = re.compile(r'^\s*(CREATE|DROP|ALTER|UNDROP)\b', re.IGNORECASE)
+_DML = re.compile(r'^\s*(INSERT|MERGE|DELETE|UPDATE|TRUNCATE|COPY)\b', re.IGNORECASE)
+_TARGET = re.compile(
+    r'\b(?:TABLE|VIEW|SCHEMA|DATABASE|FORECAST|TAG|STAGE|INTO|FROM|UPDATE)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?([\w$."]+)',
+    re.IGNORECASE)
+
+def normalize_sql(sql: str) -> str:
+    return re.sub(r'\s+', ' ', sql).strip().rstrip(';').strip()
+
+class QueryCache:
+    def __init__(self, max_entries: int = 256, ttl: float = 300, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, sql, value)
+        self._lock = threading.Lock()
+        if path:
+            os.makedirs(path, exist_ok=True)
+
+    def make_key(self, sql: str, role: Optional[str] = None, warehouse: Optional[str] = None) -> str:
+        scope = f"{(role or '').upper()}|{(warehouse or '').upper()}|{normalize_sql(sql)}"
+        return hashlib.sha256(scope.encode()).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def _load_from_disk(self, key):
+        if not self.path or not os.path.isfile(self._disk_path(key)):
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            entry = self._entries.get(key) or self._load_from_disk(key)
+            if entry is None or entry[0] < time.time():
+                self.misses += 1
+                self._discard(key)
+                return default
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: str, sql: str, value: Any, ttl: Optional[float] = None) -> None:
+        entry = (time.time() + (self.ttl if ttl is None else ttl), normalize_sql(sql), value)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self._discard(oldest)
+            if self.path:
+                with open(self._disk_path(key), 'wb') as f:
+                    pickle.dump(entry, f)
+
+    def get_or_fetch(self, sql: str, fetch: Callable[[], Any], role: Optional[str] = None,
+                     warehouse: Optional[str] = None, ttl: Optional[float] = None):
+        key = self.make_key(sql, role, warehouse)
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = fetch()
+            self.set(key, sql, value, ttl)
+        return value
+
+    def _discard(self, key):
+        self._entries.pop(key, None)
+        if self.path and os.path.isfile(self._disk_path(key)):
+            os.remove(self._disk_path(key))
+
+    def invalidate(self, object_name: Optional[str] = None) -> int:
+        "Drop every entry, or only those whose SQL mentions `object_name` (matched on its unqualified name)."
+        with self._lock:
+            entries = dict(self._entries)
+            if self.path:
+                # Entries written by other processes are only on disk
+                for fname in os.listdir(self.path):
+                    if fname.endswith('.pkl') and fname[:-4] not in entries:
+                        entry = self._load_from_disk(fname[:-4])
+                        if entry is not None:
+                            entries[fname[:-4]] = entry
+            if object_name is None:
+                keys = list(entries)
+            else:
+                name = object_name.split('.')[-1].strip('"').upper()
+                pattern = re.compile(rf'(?<![\w$]){re.escape(name)}(?![\w$])', re.IGNORECASE)
+                keys = [k for k, (_, sql, _) in entries.items() if pattern.search(sql)]
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def invalidate_after(self, sql: str) -> int:
+        "Invalidate whatever a just-executed statement may have changed."
+        is_ddl, is_dml = bool(_DDL.match(sql)), bool(_DML.match(sql))
+        if not (is_ddl or is_dml):
+            return 0
+        dropped = 0
+        target = _TARGET.search(sql)
+        if target:
+            dropped += self.invalidate(target.group(1))
+        if is_ddl:
+            with self._lock:
+                keys = [k for k, (_, cached_sql, _) in self._entries.items() if cached_sql.upper().startswith('SHOW ')]
+                for key in keys:
+                    self._discard(key)
+            dropped += len(keys)
+        return dropped
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.hits = self.misses = 0
+
+# %% ../nbs/05_cache.ipynb 6
+_query_cache = QueryCache()
+
+def get_query_cache() -> QueryCache:
+    "The process-wide cache shared by `SnowparkConnection`, `SnowflakeMLForecast` and the Streamlit pages."
+    return _query_cache
+
+def set_query_cache(cache: QueryCache) -> QueryCache:
+    global _query_cache
+    _query_cache = cache
+    return cache
@@ -0,0 +1,173 @@
+"""Garbage collection of the models and training tables left behind by forecast runs"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_cleanup.ipynb.
+
+# %% auto 0
+__all__ = ['model_version', 'ForecastGC']
+
+# %% ../nbs/10_cleanup.ipynb 3
+import re
+import logging
+import pandas as pd
+
+from typing import Dict, Iterable, List, Optional, Union
+from .forecast import SnowflakeMLForecast
+
+# %% ../nbs/10_cleanup.ipynb 5
+_PART_SUFFIX = re.compile(r'_(?:S\d{3}|C\d{3}(?:_SCREEN)?)$', re.IGNORECASE)
+_GENERATED_VERSION = re.compile(r'^(\w+?)_\d{8}_[a-z]{5}$', re.IGNORECASE)
+
+
+def model_version(name: str) -> tuple:
+    "`(family, version)` of a model name; names not generated by this package are their own family."
+    version = _PART_SUFFIX.sub('', name.upper())
+    match = _GENERATED_VERSION.match(version)
+    return (match.group(1) if match else version), version
+
+
+def _as_utc(values: pd.Series) -> pd.Series:
+    values = pd.to_datetime(values)
+    return values.dt.tz_localize('UTC') if values.dt.tz is None else values.dt.tz_convert('UTC')
+
+# %% ../nbs/10_cleanup.ipynb 8
+class ForecastGC:
+    REPORT_COLUMNS = ['OBJECT_TYPE', 'NAME', 'FAMILY', 'VERSION', 'CREATED_ON', 'AGE_DAYS', 'ACTION', 'REASON']
+
+    def __init__(self, config: Union[str, Dict], keep_last: Optional[int] = 3, max_age_days: Optional[float] = None,
+                 all_families: bool = False, protect: Iterable[str] = (), batch_size: int = 200,
+                 connection_config=None, session=None, **forecast_kwargs):
+        if keep_last is None and max_age_days is None:
+            raise ValueError("Set keep_last, max_age_days or both; without either every object would be dropped.")
+        self.model = SnowflakeMLForecast(config, connection_config=connection_config, session=session, **forecast_kwargs)
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+        self.all_families = all_families
+        self.protect = {name.upper() for name in protect}
+        self.batch_size = batch_size
+
+    def _table_exists(self, name: str) -> bool:
+        model = self.model
+        result = model.run_command(f"""
+        SELECT COUNT(*) FROM {model.database}.INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = '{model.schema}' AND TABLE_NAME = '{name}'""")
+        return bool(result and result[0][0])
+
+    def _registered_models(self) -> set:
+        model = self.model
+        if not self._table_exists(model.REGISTRY_TABLE):
+            return set()
+        names = model.fetch_dataframe(f"SELECT MODEL_NAME FROM {model.get_fully_qualified_name(model.REGISTRY_TABLE)}")
+        return {str(name).upper() for name in names.iloc[:, 0]} if len(names) else set()
+
+    def list_models(self) -> pd.DataFrame:
+        model = self.model
+        shown = model.fetch_dataframe(f"SHOW SNOWFLAKE.ML.FORECAST IN SCHEMA {model.database}.{model.schema}")
+        shown = shown.rename(columns=str.upper)
+        registered = self._registered_models()
+        rows = []
+        for row in shown.itertuples(index=False):
+            family, version = model_version(row.NAME)
+            # Only marked or registered models are ours to drop; a name that merely looks generated is reported
+            managed = model.COMMENT_MARKER in str(row.COMMENT or '') or row.NAME.upper() in registered
+            if not managed and not _GENERATED_VERSION.match(version):
+                continue
+            rows.append({'OBJECT_TYPE': 'MODEL', 'NAME': f"{row.DATABASE_NAME}.{row.SCHEMA_NAME}.{row.NAME}",
+                         'FAMILY': family, 'VERSION': version, 'CREATED_ON': row.CREATED_ON, 'MANAGED': managed})
+        models = pd.DataFrame(rows, columns=self.REPORT_COLUMNS[:5] + ['MANAGED'])
+        if not self.all_families:
+            models = models[models['FAMILY'] == model.config['model']['name'].upper()]
+        return models.reset_index(drop=True)
+
+    def list_training_tables(self) -> pd.DataFrame:
+        model = self.model
+        columns = self.REPORT_COLUMNS[:5]
+        if not self._table_exists(model.WATERMARK_TABLE):
+            return pd.DataFrame(columns=columns)
+        tables = model.fetch_dataframe(f"""
+        SELECT TRAINING_TABLE, MAX(UPDATED_AT) AS UPDATED_AT
+        FROM {model.get_fully_qualified_name(model.WATERMARK_TABLE)}
+        GROUP BY TRAINING_TABLE""").rename(columns=str.upper)
+        if not self.all_families:
+            tables = tables[tables['TRAINING_TABLE'].str.upper() == model._incremental_training_table_name().upper()]
+        return pd.DataFrame({'OBJECT_TYPE': 'TABLE', 'NAME': tables['TRAINING_TABLE'], 'FAMILY': None,
+                             'VERSION': tables['TRAINING_TABLE'], 'CREATED_ON': tables['UPDATED_AT'], 'MANAGED': True},
+                            columns=columns + ['MANAGED']).reset_index(drop=True)
+
+    def report(self, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        "Every object in scope with the `ACTION` the retention rules give it; nothing is dropped."
+        now = pd.Timestamp.now(tz='UTC') if now is None else pd.Timestamp(now)
+        now = now.tz_localize('UTC') if now.tzinfo is None else now.tz_convert('UTC')
+        frames = [df.assign(CREATED_ON=_as_utc(df['CREATED_ON']))
+                  for df in (self.list_models(), self.list_training_tables()) if len(df)]
+        if not frames:
+            return pd.DataFrame(columns=self.REPORT_COLUMNS)
+        df = pd.concat(frames, ignore_index=True)
+        df['AGE_DAYS'] = (now - df['CREATED_ON']).dt.total_seconds() / 86400
+
+        # Versions are ranked by their newest object, so shard and candidate models share one rank
+        is_model = df['OBJECT_TYPE'] == 'MODEL'
+        managed = df['MANAGED'].astype(bool)
+        ranked = df[is_model & managed]
+        version_created = ranked.groupby('VERSION')['CREATED_ON'].max()
+        ranks = version_created.groupby(ranked.groupby('VERSION')['FAMILY'].first()).rank(method='first', ascending=False)
+        df['VERSION_RANK'] = df['VERSION'].map(ranks)
+
+        recent = df['AGE_DAYS'] < self.max_age_days if self.max_age_days is not None else pd.Series(False, index=df.index)
+        newest = (is_model & (df['VERSION_RANK'] <= self.keep_last)) if self.keep_last is not None else pd.Series(False, index=df.index)
+        # keep_last only ranks models, so without max_age_days no rule can expire a training table
+        unaged = ~is_model & (self.max_age_days is None)
+        protected = df['NAME'].str.split('.').str[-1].str.upper().isin(self.protect)
+        df['ACTION'] = (protected | newest | recent | unaged).map({True: 'keep', False: 'drop'})
+        df['REASON'] = [self._reason(*flags) for flags in zip(protected, newest, recent, unaged, is_model)]
+        df.loc[~managed, 'ACTION'] = 'report'
+        df.loc[~managed, 'REASON'] = f'name looks generated, but the model is not marked {self.model.COMMENT_MARKER} or registered'
+
+        return (df.sort_values(['OBJECT_TYPE', 'FAMILY', 'CREATED_ON'], ascending=[True, True, False], kind='stable')
+                [self.REPORT_COLUMNS].reset_index(drop=True))
+
+    def _reason(self, protected: bool, newest: bool, recent: bool, unaged: bool, is_model: bool) -> str:
+        if protected:
+            return 'protected'
+        if unaged:
+            return 'training tables are only dropped by max_age_days'
+        if newest:
+            return f'one of the newest {self.keep_last} versions'
+        if recent:
+            return f'younger than {self.max_age_days} days'
+        rules = ([f'not one of the newest {self.keep_last} versions'] if is_model and self.keep_last is not None else [])
+        rules += [f'older than {self.max_age_days} days'] if self.max_age_days is not None else []
+        return ' and '.join(rules)
+
+    def _drop_statements(self, rows: pd.DataFrame) -> List[str]:
+        model = self.model
+        models = list(rows.loc[rows['OBJECT_TYPE'] == 'MODEL', 'NAME'])
+        tables = list(rows.loc[rows['OBJECT_TYPE'] == 'TABLE', 'NAME'])
+        quoted = lambda values: ', '.join(f"'{value.upper()}'" for value in values)
+        statements = [f"DROP SNOWFLAKE.ML.FORECAST IF EXISTS {name}" for name in models]
+        statements += [f"DROP TABLE IF EXISTS {name}" for name in tables]
+        # The registry keeps bare model names, the watermark table fully qualified table names
+        if models and self._table_exists(model.REGISTRY_TABLE):
+            statements.append(f"DELETE FROM {model.get_fully_qualified_name(model.REGISTRY_TABLE)} "
+                              f"WHERE UPPER(MODEL_NAME) IN ({quoted(name.split('.')[-1] for name in models)})")
+        if tables:
+            statements.append(f"DELETE FROM {model.get_fully_qualified_name(model.WATERMARK_TABLE)} "
+                              f"WHERE UPPER(TRAINING_TABLE) IN ({quoted(tables)})")
+        return statements
+
+    def collect(self, dry_run: bool = True, now: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        "Drop the objects `report` marks for dropping, unless `dry_run`; returns the report."
+        report = self.report(now)
+        expired = report.index[report['ACTION'] == 'drop']
+        if dry_run or not len(expired):
+            return report
+        for start in range(0, len(expired), self.batch_size):
+            chunk = expired[start:start + self.batch_size]
+            statements = self._drop_statements(report.loc[chunk])
+            script = "EXECUTE IMMEDIATE $$\nBEGIN\n" + "".join(f"    {sql};\n" for sql in statements) + "END;\n$$"
+            try:
+                self.model.run_command(script)
+                report.loc[chunk, 'ACTION'] = 'dropped'
+            except Exception as e:
+                logging.error(f"Dropping {len(chunk)} expired objects failed: {e}")
+                report.loc[chunk, 'ACTION'] = 'failed'
+        return report
@@ -3,19 +3,25 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_connection.ipynb.
 
 # %% auto 0
-__all__ = ['AuthenticationError', 'SnowparkConnection']
+__all__ = ['AuthenticationError', 'clear_credential_cache', 'SnowparkConnection', 'SessionPool', 'get_session_pool']
 
 # %% ../nbs/00_connection.ipynb 3
 import os
+import json
+import time
 import logging
+import threading
 import yaml
 
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Callable, Optional, Dict
+from contextlib import contextmanager
 from snowflake.snowpark import Session
 from snowflake.snowpark.context import get_active_session
 from snowflake.snowpark.exceptions import SnowparkSessionException
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.backends import default_backend
+from .cache import get_query_cache
 
 logging.getLogger('snowflake.snowpark').setLevel(logging.WARNING)
 
@@ -24,12 +30,47 @@ class AuthenticationError(Exception):
     """Custom exception for authentication errors."""
     pass
 
+_ENV_VARS = [
+    'SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_ROLE', 
+    'SNOWFLAKE_WAREHOUSE', 'SNOWFLAKE_DATABASE', 'SNOWFLAKE_SCHEMA', 
+    'SNOWFLAKE_PRIVATE_KEY_PATH'
+]
+
+# Process-wide memo of decoded keys and loaded configs, keyed by file path and mtime
+_config_cache = {}
+_private_key_cache = {}
+_credential_lock = threading.Lock()
+
+def _file_version(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+def clear_credential_cache() -> None:
+    with _credential_lock:
+        _config_cache.clear()
+        _private_key_cache.clear()
+
 class SnowparkConnection:
-    def __init__(self, connection_config: Optional[Dict[str, str]] = None, config_file: str = 'snowflake_config.yaml'):
+    def __init__(self, connection_config: Optional[Dict[str, str]] = None, config_file: str = 'snowflake_config.yaml', session: Optional[Session] = None, pool=None):
         self.connection_config = connection_config or self.load_connection_config(config_file)
-        self.session = self._get_active_or_new_session()
+        self._pool = pool
+        if session is not None:
+            # An explicit session (e.g. a local stand-in) skips the login entirely
+            self.session = session
+        elif pool is not None:
+            self.session = pool.acquire(self.connection_config)
+        else:
+            self.session = self._get_active_or_new_session()
 
     def load_connection_config(self, yaml_file: str) -> Dict[str, str]:
+        # Cached per file version and environment; the result is read-only so it can be shared
+        cache_key = (os.path.abspath(yaml_file), _file_version(yaml_file), tuple(os.getenv(var) for var in _ENV_VARS))
+        with _credential_lock:
+            if cache_key in _config_cache:
+                return _config_cache[cache_key]
+
         config = {}
         if os.path.isfile(yaml_file):
             try:
@@ -42,17 +83,14 @@ class SnowparkConnection:
                 raise
         
         # Fallback to environment variables if certain keys are missing
-        env_vars = [
-            'SNOWFLAKE_ACCOUNT', 'SNOWFLAKE_USER', 'SNOWFLAKE_ROLE', 
-            'SNOWFLAKE_WAREHOUSE', 'SNOWFLAKE_DATABASE', 'SNOWFLAKE_SCHEMA', 
-            'SNOWFLAKE_PRIVATE_KEY_PATH'
-        ]
-        
-        for var in env_vars:
+        for var in _ENV_VARS:
             key = var.lower().split('snowflake_')[1]
             if os.getenv(var) and key not in config:
                 config[key] = os.getenv(var)
         
+        config = MappingProxyType(config)
+        with _credential_lock:
+            _config_cache[cache_key] = config
         return config
     
     def _get_active_or_new_session(self) -> Session:
@@ -67,10 +105,12 @@ class SnowparkConnection:
 
     def _create_new_session(self) -> Session:
         try:
-            if 'private_key_path' in self.connection_config:
-                self._configure_key_pair_auth(self.connection_config)
+            # Work on a copy so the (possibly shared) connection config is never mutated
+            config = dict(self.connection_config)
+            if 'private_key_path' in config:
+                self._configure_key_pair_auth(config)
             
-            session = Session.builder.configs(self.connection_config).create()
+            session = Session.builder.configs(config).create()
             logging.info("Snowpark session created successfully.")
             return session
         except Exception as e:
@@ -78,6 +118,10 @@ class SnowparkConnection:
             raise AuthenticationError(f"Failed to create session: {str(e)}")
 
     def _load_private_key(self, private_key_path: str) -> bytes:
+        cache_key = (os.path.abspath(os.path.expanduser(private_key_path)), _file_version(private_key_path))
+        with _credential_lock:
+            if cache_key in _private_key_cache:
+                return _private_key_cache[cache_key]
         try:
             with open(private_key_path, "rb") as key_file:
                 p_key = serialization.load_pem_private_key(
@@ -91,6 +135,8 @@ class SnowparkConnection:
                 encryption_algorithm=serialization.NoEncryption()
             )
             logging.info("Private key loaded successfully.")
+            with _credential_lock:
+                _private_key_cache[cache_key] = private_key_bytes
             return private_key_bytes
         except FileNotFoundError:
             logging.error(f"Private key file not found: {private_key_path}")
@@ -111,7 +157,29 @@ class SnowparkConnection:
     def get_session(self) -> Session:
         return self.session
 
+    def _cache_scope(self) -> Dict[str, Optional[str]]:
+        return {'role': self.connection_config.get('role'), 'warehouse': self.connection_config.get('warehouse')}
+
+    def cached_sql(self, query: str, ttl: Optional[float] = None):
+        """Run a read-only query through the shared query cache, returning a pandas DataFrame."""
+        return get_query_cache().get_or_fetch(query, lambda: self.session.sql(query).to_pandas(), ttl=ttl, **self._cache_scope())
+
+    def cached_table_preview(self, table_name: str, n: int = 5, ttl: Optional[float] = None):
+        return get_query_cache().get_or_fetch(f"SELECT * FROM {table_name} LIMIT {n}",
+                                              lambda: self.session.table(table_name).limit(n).to_pandas(),
+                                              ttl=ttl, **self._cache_scope())
+
+    def run_sql(self, query: str):
+        """Execute a statement and drop any cached results it may have changed."""
+        result = self.session.sql(query).collect()
+        get_query_cache().invalidate_after(query)
+        return result
+
     def close_session(self) -> None:
+        if self._pool is not None:
+            # Pooled sessions go back to the pool instead of logging out
+            self._pool.release(self.connection_config, self.session)
+            return
         try:
             self.session.close()
             logging.info("Snowpark session closed successfully.")
@@ -124,3 +192,152 @@ class SnowparkConnection:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close_session()
+
+# %% ../nbs/00_connection.ipynb 5
+def _login(connection_config: Dict[str, str]) -> Session:
+    # Pooled sessions are always fresh logins, never the ambient active session
+    connection = object.__new__(SnowparkConnection)
+    connection.connection_config = dict(connection_config)
+    return connection._create_new_session()
+
+def _pool_key(connection_config: Dict[str, str]) -> str:
+    return json.dumps(dict(connection_config), sort_keys=True, default=str)
+
+class SessionPool:
+    def __init__(self, factory: Callable[[Dict[str, str]], Session] = _login, max_size: int = 4,
+                 idle_timeout: float = 600, health_check_interval: float = 60):
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self._idle = {}    # key -> [(session, returned_at)]
+        self._in_use = {}  # key -> number of borrowed sessions
+        self._cond = threading.Condition()
+        self._keep_alive = None
+
+    def _healthy(self, session: Session) -> bool:
+        try:
+            session.sql("SELECT 1").collect()
+            return True
+        except Exception as e:
+            logging.warning(f"Discarding unhealthy pooled session: {e}")
+            return False
+
+    def _close(self, session: Session) -> None:
+        try:
+            session.close()
+        except Exception as e:
+            logging.warning(f"Error closing pooled session: {e}")
+
+    def acquire(self, connection_config: Dict[str, str], timeout: Optional[float] = None) -> Session:
+        key = _pool_key(connection_config)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            session = None
+            with self._cond:
+                while True:
+                    idle = self._idle.setdefault(key, [])
+                    # The slot is reserved before leaving the lock, whether it holds an idle session or a new login
+                    if idle or self._in_use.get(key, 0) < self.max_size:
+                        self._in_use[key] = self._in_use.get(key, 0) + 1
+                        if idle:
+                            session, returned_at = idle.pop()
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No pooled session available within {timeout} seconds.")
+                    self._cond.wait(remaining)
+
+            if session is None:
+                break
+            # Only sessions that sat idle for a while are pinged before reuse, outside the lock
+            if time.monotonic() - returned_at < self.health_check_interval or self._healthy(session):
+                return session
+            self._close(session)
+            self._free_slot(key)
+
+        # Log in outside the lock so slow logins don't block other borrowers
+        try:
+            return self.factory(connection_config)
+        except Exception:
+            self._free_slot(key)
+            raise
+
+    def _free_slot(self, key) -> None:
+        with self._cond:
+            self._in_use[key] = max(self._in_use.get(key, 0) - 1, 0)
+            self._cond.notify()
+
+    def release(self, connection_config: Dict[str, str], session: Session) -> None:
+        key = _pool_key(connection_config)
+        with self._cond:
+            self._in_use[key] = max(self._in_use.get(key, 0) - 1, 0)
+            self._idle.setdefault(key, []).append((session, time.monotonic()))
+            self._cond.notify()
+        self.evict_idle()
+
+    @contextmanager
+    def session(self, connection_config: Dict[str, str], timeout: Optional[float] = None):
+        session = self.acquire(connection_config, timeout)
+        try:
+            yield session
+        finally:
+            self.release(connection_config, session)
+
+    def evict_idle(self) -> int:
+        now, evicted = time.monotonic(), []
+        with self._cond:
+            for key, idle in self._idle.items():
+                evicted += [s for s, returned_at in idle if now - returned_at > self.idle_timeout]
+                idle[:] = [(s, returned_at) for s, returned_at in idle if now - returned_at <= self.idle_timeout]
+        for session in evicted:
+            self._close(session)
+        return len(evicted)
+
+    def keep_alive(self, interval: float = 300) -> None:
+        "Start a daemon thread that pings idle sessions and evicts expired ones every `interval` seconds."
+        if self._keep_alive is not None:
+            return
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.evict_idle()
+                # Take the idle sessions out of the pool while pinging so no borrower gets one mid-check
+                with self._cond:
+                    idle = [(key, entry) for key, entries in self._idle.items() for entry in entries]
+                    for key, entries in self._idle.items():
+                        self._in_use[key] = self._in_use.get(key, 0) + len(entries)
+                        entries.clear()
+                for key, (session, returned_at) in idle:
+                    if self._healthy(session):
+                        with self._cond:
+                            self._in_use[key] = max(self._in_use.get(key, 0) - 1, 0)
+                            self._idle.setdefault(key, []).append((session, returned_at))
+                            self._cond.notify()
+                    else:
+                        self._close(session)
+                        self._free_slot(key)
+
+        self._keep_alive = (threading.Thread(target=run, daemon=True), stop)
+        self._keep_alive[0].start()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {'idle': sum(len(v) for v in self._idle.values()), 'in_use': sum(self._in_use.values())}
+
+    def close_all(self) -> None:
+        if self._keep_alive is not None:
+            self._keep_alive[1].set()
+            self._keep_alive = None
+        with self._cond:
+            sessions = [s for idle in self._idle.values() for s, _ in idle]
+            self._idle.clear()
+        for session in sessions:
+            self._close(session)
+
+_session_pool = SessionPool()
+
+def get_session_pool() -> SessionPool:
+    "The process-wide pool used when a `SnowparkConnection` is created with `pool=get_session_pool()`."
+    return _session_pool
@@ -3,11 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_cortex_forecast.ipynb.
 
 # %% auto 0
-__all__ = ['SnowflakeMLForecast']
+__all__ = ['RESULT_FORMATS', 'ASYNC_RESULT_TYPES', 'PLAN_CACHE_SIZE', 'register_result_format', 'minmax_downsample',
+           'ForecastPlan', 'clear_plan_cache', 'LazyCharts', 'SnowflakeMLForecast']
 
 # %% ../nbs/01_cortex_forecast.ipynb 4
 import yaml
+import json
 import random
+import hashlib
 import string
 import logging
 import numpy as np
@@ -16,19 +19,241 @@ import altair as alt
 import logging
 import numpy as np
 import time
+import asyncio
+import threading
 import snowflake.snowpark._internal.utils as snowpark_utils
 
-from typing import Union, Dict
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Union, Dict, Callable, Optional, List, Tuple
 from datetime import datetime
 from .connection import SnowparkConnection
-from snowflake.snowpark.exceptions import SnowparkSQLException
+from .cache import get_query_cache
+from .tracing import RunReport, traced_step
 
 logging.getLogger('snowflake.snowpark').setLevel(logging.WARNING)
 
 # %% ../nbs/01_cortex_forecast.ipynb 5
+def _fetch_arrow(df) -> pd.DataFrame:
+    # Single Arrow result set converted column-wise by the connector
+    return df.to_pandas()
+
+def _fetch_batches(df) -> pd.DataFrame:
+    # Arrow record batches, each converted to pandas as it arrives
+    batches = list(df.to_pandas_batches())
+    if not batches:
+        return pd.DataFrame()
+    return pd.concat(batches, ignore_index=True)
+
+def _fetch_rows(df) -> pd.DataFrame:
+    # Legacy path: one Row object per record, then re-boxed by pandas
+    return pd.DataFrame(df.collect())
+
+RESULT_FORMATS: Dict[str, Callable] = {
+    'arrow': _fetch_arrow,
+    'batches': _fetch_batches,
+    'rows': _fetch_rows,
+}
+
+def register_result_format(name: str, fetcher: Callable) -> None:
+    """Register `fetcher(snowpark_df) -> pd.DataFrame` under `name` for use as a `result_format`."""
+    RESULT_FORMATS[name] = fetcher
+
+# `AsyncJob.result` types used when a result format is fetched from an async query
+ASYNC_RESULT_TYPES = {'arrow': 'pandas', 'batches': 'pandas_batches', 'rows': 'row'}
+
+def _async_result_to_pandas(job, result_format: str) -> pd.DataFrame:
+    result_type = ASYNC_RESULT_TYPES.get(result_format, 'pandas')
+    result = job.result(result_type)
+    if result_type == 'pandas_batches':
+        batches = list(result)
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+    if result_type == 'row':
+        return pd.DataFrame(result)
+    return result
+
+def _normalize_series_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # Diagnostics return upper-case columns and the SERIES VARIANT as a JSON-quoted string
+    df = df.rename(columns=str.upper)
+    if 'SERIES' in df.columns:
+        df = df.assign(SERIES=df['SERIES'].astype(str).str.strip('"'))
+    if 'METRIC_VALUE' in df.columns:
+        df = df.assign(METRIC_VALUE=pd.to_numeric(df['METRIC_VALUE'], errors='coerce'))
+    return df
+
+def minmax_downsample(df: pd.DataFrame, value_col: str, max_points: Optional[int], by: Optional[List[str]] = None,
+                      segment: Optional[str] = None) -> pd.DataFrame:
+    """Keep at most about `max_points` rows per `by` group using min/max bucketing.
+
+    Rows must already be in time order within each group. Each group's budget is split across its
+    `segment` values (e.g. historic vs forecast) in proportion to their size, with an even share as
+    the floor for short segments; every segment is cut
+    into equal-count buckets and only the first, last, minimum and maximum rows of each bucket are
+    kept, so peaks and the segment end points survive. Groups under the budget are left untouched.
+    """
+    if not max_points or df.empty:
+        return df
+    keys = list(by or []) + ([segment] if segment else [])
+    if keys:
+        segments = df.groupby(keys, sort=False, observed=True)
+        segment_id = segments.ngroup().to_numpy()
+        position = segments.cumcount().to_numpy()
+        segment_size = segments[value_col].transform('size').to_numpy()
+    else:
+        segment_id = np.zeros(len(df), dtype=np.int64)
+        position = np.arange(len(df))
+        segment_size = np.full(len(df), len(df))
+    groups = df.groupby(list(by), sort=False, observed=True) if by else None
+    group_size = groups[value_col].transform('size').to_numpy() if by else np.full(len(df), len(df))
+    if group_size.max() <= max_points:
+        return df
+    n_segments = (groups[segment].transform('nunique').to_numpy() if by and segment
+                  else np.full(len(df), df[segment].nunique() if segment else 1))
+
+    # Four rows survive per bucket, so a segment gets a quarter of its share of the budget as buckets;
+    # short segments such as the forecast horizon are guaranteed an even share so they are not flattened
+    n_buckets = np.maximum((max_points * segment_size) // (4 * group_size),
+                           np.minimum(segment_size, max_points // (4 * n_segments)))
+    n_buckets = np.maximum(n_buckets, 1)
+    bucket = np.minimum(position * n_buckets // segment_size, n_buckets - 1)
+    key = segment_id.astype(np.int64) * max_points + bucket
+
+    values = df[value_col].to_numpy(dtype=float)
+    by_value = np.lexsort((values, key))
+    by_position = np.lexsort((position, key))
+    keep = group_size <= max_points
+    for order in (by_value, by_position):
+        k = key[order]
+        edges = np.r_[True, k[1:] != k[:-1]]
+        keep[order[edges | np.r_[edges[1:], True]]] = True
+    return df[keep]
+
+@dataclass
+class ForecastPlan:
+    """Ordered `(step, sql)` statements for one or more forecasts, compiled without running anything."""
+    statements: List[Tuple[str, str]]
+    config_hash: str
+    model_names: List[str]
+    cached: bool = False
+
+    def __len__(self):
+        return len(self.statements)
+
+    def sql(self, step: Optional[str] = None) -> List[str]:
+        return [sql for s, sql in self.statements if step is None or s == step]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(self.statements, columns=['step', 'sql'])
+
+    def to_script(self) -> str:
+        # One Snowflake Scripting block, so the whole pipeline costs a single round-trip;
+        # the fetch (if planned) becomes the block's result set
+        body = [f"    {sql.strip().rstrip(';')};" for step, sql in self.statements if step != 'fetch']
+        fetch = self.sql('fetch')
+        if len(fetch) > 1:
+            raise ValueError("A plan script can return at most one fetch result.")
+        if fetch:
+            body.append(f"    LET res RESULTSET := ({fetch[0].strip().rstrip(';')});")
+            body.append("    RETURN TABLE(res);")
+        else:
+            body.append("    RETURN 'Plan executed successfully.';")
+        return "EXECUTE IMMEDIATE $$\nBEGIN\n" + "\n".join(body) + "\nEND;\n$$"
+
+# Compiled plan templates keyed on a hash of the config; object names are filled in per model
+PLAN_CACHE_SIZE = 128
+_PLAN_MODEL = '__CORTEX_FORECAST_MODEL__'
+_PLAN_TABLE = '__CORTEX_FORECAST_TRAINING_TABLE__'
+_plan_cache = OrderedDict()
+_plan_lock = threading.Lock()
+
+def clear_plan_cache() -> None:
+    with _plan_lock:
+        _plan_cache.clear()
+
+class LazyCharts(Mapping):
+    """Per-series charts built on first access from one series-sorted chart frame.
+
+    Series are located by row offsets into the shared frame, so nothing is copied or rendered
+    until a chart is requested through indexing, `page` or iteration.
+    """
+    def __init__(self, model, df: pd.DataFrame, max_historic_date, series_col: str, ts_col: str,
+                 order: Optional[List] = None):
+        key = series_col.upper()
+        if not isinstance(df[key].dtype, pd.CategoricalDtype):
+            df = df.assign(**{key: df[key].astype('category')})
+        if not df[key].cat.codes.is_monotonic_increasing:
+            df = df.sort_values([key, ts_col], kind='stable', ignore_index=True)
+        codes = df[key].cat.codes.to_numpy()
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=int)
+        stops = np.r_[starts[1:], len(codes)]
+        names = df[key].iloc[starts].tolist()
+        self._offsets = dict(zip(names, zip(starts.tolist(), stops.tolist())))
+        self.series = names
+        if order is not None:
+            ordered = [series for series in order if series in self._offsets]
+            seen = set(ordered)
+            self.series = ordered + [series for series in names if series not in seen]
+        self.df, self.model, self.max_historic_date, self.ts_col = df, model, max_historic_date, ts_col
+        self._charts = {}
+
+    def __getitem__(self, series):
+        if series not in self._charts:
+            start, stop = self._offsets[series]
+            self._charts[series] = self.model.create_single_chart(
+                self.df.iloc[start:stop], self.max_historic_date, series, self.ts_col)
+        return self._charts[series]
+
+    def __iter__(self):
+        return iter(self.series)
+
+    def __len__(self):
+        return len(self.series)
+
+    def search(self, text: Optional[str] = None) -> List:
+        "Series whose name contains `text` (case-insensitive), in display order."
+        if not text:
+            return list(self.series)
+        text = str(text).lower()
+        return [series for series in self.series if text in str(series).lower()]
+
+    def n_pages(self, page_size: int = 10, search: Optional[str] = None) -> int:
+        return max(1, -(-len(self.search(search)) // page_size))
+
+    def page_series(self, page: int = 1, page_size: int = 10, search: Optional[str] = None) -> List:
+        "Series on the 1-based `page` after filtering by `search`."
+        return self.search(search)[(page - 1) * page_size:page * page_size]
+
+    def page(self, page: int = 1, page_size: int = 10, search: Optional[str] = None) -> Dict:
+        "Build and return the charts on the 1-based `page`."
+        return {series: self[series] for series in self.page_series(page, page_size, search)}
+
+    def frame(self, series: List) -> pd.DataFrame:
+        "Rows of the shared chart frame for `series`, without scanning the series column."
+        ranges = [np.arange(*self._offsets[name]) for name in series if name in self._offsets]
+        return self.df.iloc[np.concatenate(ranges) if ranges else []]
+
+# %% ../nbs/01_cortex_forecast.ipynb 6
 class SnowflakeMLForecast(SnowparkConnection):
-    def __init__(self, config: Union[str, Dict], connection_config=None, is_streamlit=False):
-        super().__init__(connection_config=connection_config)
+    PIPELINE_STEPS = ('training_table', 'model', 'forecast', 'fetch')
+    PLAN_STEPS = ('tags',) + PIPELINE_STEPS
+    WATERMARK_TABLE = 'CORTEX_FORECAST_WATERMARKS'
+    REGISTRY_TABLE = 'CORTEX_FORECAST_MODELS'
+    COMMENT_MARKER = '[cortex_forecast]'
+    DATA_VERSIONS = ('stats', 'last_change', 'none')
+    REUSE_DEFAULTS = {'enabled': True, 'data_version': 'stats', 'max_age_days': None, 'keep_models': None}
+    PROCEDURE_NAME = 'CORTEX_FORECAST_RUN'
+    CHART_VALUE_COLUMNS = ('FORECAST', 'LOWER_BOUND', 'UPPER_BOUND')
+    WRITE_MODES = ('append', 'merge')
+    CHART_DEFAULTS = {'chart_mode': 'lazy', 'page_size': 10, 'order_by': 'name', 'error_metric': 'SMAPE',
+                      'facet_columns': 2, 'max_points': 1000}
+
+    def __init__(self, config: Union[str, Dict], connection_config=None, is_streamlit=False, result_format='arrow', session=None, pool=None):
+        super().__init__(connection_config=connection_config, session=session, pool=pool)
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"Unknown result_format '{result_format}'. Choose from {sorted(RESULT_FORMATS)}.")
+        self.result_format = result_format
         self.config = self._load_config(config)
         self.model_name = self._generate_unique_model_name()
         self.training_data_query = None
@@ -36,6 +261,18 @@ class SnowflakeMLForecast(SnowparkConnection):
         self.database = self.config['input_data'].get('database', self.connection_config.get('database'))
         self.schema = self.config['input_data'].get('schema', self.connection_config.get('schema'))
         self.temp_table_name = None
+        self.training_window = None
+        self.shard = None
+        self.series_pruning = None
+        self.forecast_query_id = None
+        self.reused_model = False
+        self._data_version = None
+        self._forecast_job = None
+        self.query_ids = {}
+        self._plan_only = False
+        self.report = RunReport(self.model_name, warehouse=self.connection_config.get('warehouse'),
+                                **(self.config.get('tracing') or {}))
+        self.progress = {step: {'status': 'pending', 'query_id': None} for step in self.PIPELINE_STEPS}
 
     def _load_config(self, config: Union[str, Dict]) -> Dict:
         if isinstance(config, str):
@@ -63,13 +300,11 @@ class SnowflakeMLForecast(SnowparkConnection):
         else:
             return f"{self.database}.{self.schema}.{object_name}"
 
-    def _generate_input_data_sql(self):
-        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+    def _training_select_clause(self):
         timestamp_col = self.config['input_data']['timestamp_column']
         target_col = self.config['input_data']['target_column']
         series_col = self.config['input_data'].get('series_column')
         exogenous_cols = self.config['input_data'].get('exogenous_columns') or []
-        training_days = self.config['forecast_config'].get('training_days')
 
         # Always include timestamp, target, and series (if present) columns
         base_columns = [f"TO_TIMESTAMP_NTZ({timestamp_col}) AS {timestamp_col}",
@@ -83,23 +318,150 @@ class SnowflakeMLForecast(SnowparkConnection):
         else:
             exclude_cols = [timestamp_col, target_col]
             select_clause = f"SELECT {', '.join(base_columns)}, * EXCLUDE ({', '.join(exclude_cols)})"
+        return select_clause
+
+    def resolve_training_window(self, max_timestamp=None):
+        # Resolves the training_days window to literal bounds with a single MAX() query,
+        # or none at all when a cached max timestamp is passed in
+        training_days = self.config['forecast_config'].get('training_days')
+        if not training_days:
+            self.training_window = None
+            return None
+
+        if max_timestamp is None:
+            table = self.get_fully_qualified_name(self.config['input_data']['table'])
+            timestamp_col = self.config['input_data']['timestamp_column']
+            # MAX over the raw column can be answered from micro-partition metadata. It is fetched as a
+            # frame because Rows hold datetime objects, which drop the nanoseconds
+            result = self.fetch_dataframe(f"SELECT MAX({timestamp_col}) AS MAX_TS FROM {table}", result_format='arrow')
+            max_timestamp = result.iloc[0, 0] if len(result) else None
+            if max_timestamp is None or pd.isna(max_timestamp):
+                self.training_window = None
+                return None
+
+        # An aware MAX keeps its offset so the bounds compare against the same instants as the column
+        end = pd.Timestamp(max_timestamp)
+        self.training_window = (end - pd.Timedelta(days=training_days), end)
+        return self.training_window
+
+    def _timestamp_literal(self, ts):
+        # Full nanosecond precision, typed TIMESTAMP_TZ with its offset when the bound is tz-aware
+        ts = pd.Timestamp(ts)
+        return f"'{ts.isoformat(timespec='nanoseconds')}'::TIMESTAMP_{'NTZ' if ts.tzinfo is None else 'TZ'}(9)"
+
+    def _training_window_bounds(self):
+        if self.training_window is not None:
+            return tuple(self._timestamp_literal(ts) for ts in self.training_window)
+        training_days = self.config['forecast_config'].get('training_days')
+        if not (self._plan_only and training_days):
+            return None
+        # While planning the bounds are left to the server; a scalar subquery costs the literal
+        # bounds' partition pruning, so pass `max_timestamp` to `plan` when it is known
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        end = f"(SELECT MAX({self.config['input_data']['timestamp_column']}) FROM {table})"
+        return f"DATEADD(day, -{int(training_days)}, {end})", end
+
+    def _training_window_predicate(self):
+        bounds = self._training_window_bounds()
+        if bounds is None:
+            return None
+        timestamp_col = self.config['input_data']['timestamp_column']
+        return f"{timestamp_col} BETWEEN {bounds[0]} AND {bounds[1]}"
+
+    def _shard_predicate(self, index: int, count: int, column: Optional[str] = None):
+        # Hash of the series as a string, so the training rows and the forecast's VARIANT series agree
+        column = column or self.config['input_data']['series_column']
+        return f"MOD(ABS(HASH(CAST({column} AS STRING))), {int(count)}) = {int(index)}"
+
+    def _series_filter(self):
+        if not self.config['input_data'].get('series_column'):
+            return {}
+        return {k: v for k, v in (self.config['forecast_config'].get('series_filter') or {}).items() if v is not None}
+
+    def _series_filter_ctes(self):
+        # Flags every series with the first rule that prunes it, or 'kept'
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        timestamp_col = self.config['input_data']['timestamp_column']
+        target_col = self.config['input_data']['target_column']
+        series_col = self.config['input_data']['series_column']
+        series_filter = self._series_filter()
+        window_predicate = self._training_window_predicate()
+
+        rules = []
+        if 'min_history' in series_filter:
+            rules.append(f"WHEN n_obs < {int(series_filter['min_history'])} THEN 'min_history'")
+        if 'max_staleness_days' in series_filter:
+            rules.append(f"WHEN last_ts < DATEADD(day, -{int(series_filter['max_staleness_days'])}, "
+                         f"(SELECT MAX(last_ts) FROM series_stats)) THEN 'max_staleness'")
+        early_reason = f"CASE {' '.join(rules)} END" if rules else "CAST(NULL AS STRING)"
+        if 'top_n' in series_filter:
+            volume_reason = (f"CASE WHEN ROW_NUMBER() OVER (PARTITION BY early_reason IS NULL ORDER BY volume DESC) "
+                             f"> {int(series_filter['top_n'])} THEN 'top_n' ELSE 'kept' END")
+        else:
+            volume_reason = "'kept'"
+
+        return f"""
+        series_stats AS (
+            SELECT {series_col}, COUNT(*) AS n_obs, MAX({timestamp_col}) AS last_ts, SUM({target_col}) AS volume
+            FROM {table}
+            {f"WHERE {window_predicate}" if window_predicate else ""}
+            GROUP BY {series_col}
+        ),
+        series_ranked AS (
+            SELECT *, {early_reason} AS early_reason
+            FROM series_stats
+        ),
+        series_flags AS (
+            SELECT {series_col}, n_obs, last_ts, volume, COALESCE(early_reason, {volume_reason}) AS reason
+            FROM series_ranked
+        )"""
+
+    def series_pruning_report(self):
+        if not self._series_filter():
+            self.display("No series_filter configured; no series are pruned.", content_type="text")
+            return None
+        if self.training_window is None:
+            self.resolve_training_window()
+        query = f"""
+        WITH {self._series_filter_ctes()}
+        SELECT reason AS REASON, COUNT(*) AS SERIES_COUNT, SUM(n_obs) AS ROW_COUNT
+        FROM series_flags
+        GROUP BY reason
+        ORDER BY SERIES_COUNT DESC
+        """
+        self.series_pruning = self.fetch_dataframe(query)
+        self.display("Series pruning report:", content_type="text")
+        self.display(self.series_pruning, content_type="dataframe")
+        return self.series_pruning
+
+    def _generate_input_data_sql(self):
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        if self.training_window is None and not self._plan_only:
+            self.resolve_training_window()
+        window_predicate = self._training_window_predicate()
+        select_clause = self._training_select_clause()
+        series_filter = self._series_filter()
 
         # Generate a random name for the temporary table work around in SIS creation process
         self.temp_table_name = snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.TABLE)
 
+        predicates = [window_predicate] if window_predicate else []
+        if self.shard is not None:
+            predicates.append(self._shard_predicate(*self.shard))
+        if series_filter:
+            series_col = self.config['input_data']['series_column']
+            predicates.append(f"{series_col} IN (SELECT {series_col} FROM series_flags WHERE reason = 'kept')")
+
         sql = f"""
         CREATE OR REPLACE TEMPORARY TABLE {self.temp_table_name} AS
+        {f"WITH {self._series_filter_ctes()}" if series_filter else ""}
         {select_clause}
         FROM {table}
         """
 
-        if training_days:
+        if predicates:
             sql += f"""
-            WHERE TO_TIMESTAMP_NTZ({timestamp_col}) 
-            BETWEEN 
-            DATEADD(day, -{training_days}, (SELECT MAX({timestamp_col}) FROM {table})) 
-            AND 
-            (SELECT MAX({timestamp_col}) FROM {table})
+            WHERE {' AND '.join(predicates)}
             """
 
         sql += ";"
@@ -109,6 +471,86 @@ class SnowflakeMLForecast(SnowparkConnection):
         self.display(sql, content_type="code", language="sql")
         return sql
 
+    def _incremental_training_table_name(self):
+        # The persistent training table is versioned by a hash of everything that shapes its rows
+        input_data = self.config['input_data']
+        key = {
+            'table': self.get_fully_qualified_name(input_data['table']).upper(),
+            'timestamp_column': input_data['timestamp_column'],
+            'target_column': input_data['target_column'],
+            'series_column': input_data.get('series_column'),
+            'exogenous_columns': input_data.get('exogenous_columns') or [],
+            # The window's DELETE trims the table, so configs with different windows can't share one
+            'training_days': self.config['forecast_config'].get('training_days'),
+        }
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:12].upper()
+        return self.get_fully_qualified_name(f"CORTEX_FORECAST_TRAIN_{digest}")
+
+    def _generate_incremental_input_data_sql(self):
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        timestamp_col = self.config['input_data']['timestamp_column']
+        if self.training_window is None and not self._plan_only:
+            self.resolve_training_window()
+        select_clause = self._training_select_clause()
+        train_table = self._incremental_training_table_name()
+        if self._series_filter():
+            logging.warning("series_filter is not applied in incremental_training mode; the persistent table keeps every series.")
+        watermark_table = self.get_fully_qualified_name(self.WATERMARK_TABLE)
+
+        statements = [
+            f"""
+        CREATE TABLE IF NOT EXISTS {watermark_table} (
+            TRAINING_TABLE STRING, SOURCE_TABLE STRING, WATERMARK TIMESTAMP_NTZ, UPDATED_AT TIMESTAMP_NTZ
+        );""",
+            f"""
+        CREATE TABLE IF NOT EXISTS {train_table} AS
+        {select_clause}
+        FROM {table}
+        WHERE 1 = 0;""",
+            # Only rows newer than the recorded watermark are read from the source
+            f"""
+        INSERT INTO {train_table}
+        {select_clause}
+        FROM {table}
+        WHERE {timestamp_col} > COALESCE(
+            (SELECT MAX(WATERMARK) FROM {watermark_table} WHERE TRAINING_TABLE = '{train_table}'),
+            '1900-01-01'::TIMESTAMP_NTZ
+        );""",
+        ]
+
+        window_bounds = self._training_window_bounds()
+        if window_bounds is not None:
+            statements.append(f"""
+        DELETE FROM {train_table}
+        WHERE {timestamp_col} < {window_bounds[0]};""")
+
+        statements.append(f"""
+        MERGE INTO {watermark_table} w
+        USING (SELECT MAX({timestamp_col}) AS WATERMARK FROM {train_table}) t
+        ON w.TRAINING_TABLE = '{train_table}'
+        WHEN MATCHED THEN UPDATE SET WATERMARK = t.WATERMARK, UPDATED_AT = CURRENT_TIMESTAMP()
+        WHEN NOT MATCHED THEN INSERT (TRAINING_TABLE, SOURCE_TABLE, WATERMARK, UPDATED_AT)
+            VALUES ('{train_table}', '{table}', t.WATERMARK, CURRENT_TIMESTAMP());""")
+
+        self.temp_table_name = train_table
+        self.training_data_query = "\n".join(statements)
+        self.display("Generated SQL:", content_type="text")
+        self.display(self.training_data_query, content_type="code", language="sql")
+        return statements
+
+    def _training_table_statements(self):
+        if self.config['forecast_config'].get('incremental_training'):
+            return self._generate_incremental_input_data_sql()
+        return [self._generate_input_data_sql()]
+
+    def get_training_watermark(self):
+        watermark_table = self.get_fully_qualified_name(self.WATERMARK_TABLE)
+        result = self.run_command(f"""
+        SELECT MAX(WATERMARK) FROM {watermark_table}
+        WHERE TRAINING_TABLE = '{self._incremental_training_table_name()}'
+        """)
+        return result[0][0] if result else None
+
     def _generate_create_model_sql(self):
         input_data = f"SYSTEM$REFERENCE('TABLE', '{self.temp_table_name}')"
         timestamp_col = self.config['input_data']['timestamp_column']
@@ -142,14 +584,12 @@ class SnowflakeMLForecast(SnowparkConnection):
         sql = sql.rstrip(',')  # Clean up trailing commas
         sql += ")"
         tags = self.config['model'].get('tags')
-        comment = self.config['model'].get('comment')
         
         if tags:
             tag_str = ", ".join([f"{k} = '{v}'" for k, v in tags.items()])
             sql += f" WITH TAG ({tag_str})"
         
-        if comment:
-            sql += f" COMMENT = '{comment}'"
+        sql += f" COMMENT = '{self._model_comment()}'"
         
         sql += ";"
 
@@ -158,6 +598,11 @@ class SnowflakeMLForecast(SnowparkConnection):
         self.create_model_query_text = sql
         return sql
 
+    def _model_comment(self):
+        # The marker lets `ForecastGC` find the models this package created, whatever they are named
+        comment = self.config['model'].get('comment')
+        return f"{comment} {self.COMMENT_MARKER}" if comment else self.COMMENT_MARKER
+
     def _format_value(self, value):
         if value is None:
             return "NULL"
@@ -169,7 +614,8 @@ class SnowflakeMLForecast(SnowparkConnection):
             return f"'{value}'"
         return str(value)
 
-    def _generate_forecast_sql(self):
+    def _generate_forecast_sql(self, output_model_name: Optional[str] = None):
+        # Always an INSERT or MERGE; `_output_table_statements` declares the table before it runs
         try:
             forecast_days = self.config['forecast_config'].get('forecast_days')
             output_table = self.get_fully_qualified_name(self.config['output']['table'])
@@ -179,22 +625,9 @@ class SnowflakeMLForecast(SnowparkConnection):
             prediction_interval = evaluation_config.get('prediction_interval', 0.95)
             series_col = self.config['input_data'].get('series_column')
             timestamp_col = self.config['input_data']['timestamp_column']
+            merge = self._output_write_mode() == 'merge'
 
-            # Check if the table exists
-            check_table_sql = f"""
-            SELECT COUNT(*) 
-            FROM {self.database}.INFORMATION_SCHEMA.TABLES 
-            WHERE TABLE_SCHEMA = '{self.schema}' 
-            AND TABLE_NAME = '{self.config['output']['table']}'
-            """
-            table_exists = self.session.sql(check_table_sql).collect()[0][0] > 0
-
-            if table_exists:
-                sql = f"INSERT INTO {output_table} "
-            else:
-                sql = f"CREATE OR REPLACE TABLE {output_table} AS "
-
-            sql += "SELECT "
+            sql = "SELECT "
 
             if series_col:
                 sql += f"series::string as {series_col}, "
@@ -204,14 +637,19 @@ class SnowflakeMLForecast(SnowparkConnection):
                 CASE WHEN forecast < 0 THEN 0 ELSE forecast END AS forecast,
                 CASE WHEN lower_bound < 0 THEN 0 ELSE lower_bound END AS lower_bound,
                 CASE WHEN upper_bound < 0 THEN 0 ELSE upper_bound END AS upper_bound,
-                '{self.model_name}' AS model_name,
+                '{output_model_name or self.model_name}' AS model_name,
                 CURRENT_TIMESTAMP() AS creation_date,
                 '{self.config['model']['comment']}' AS model_comment
             FROM
                 TABLE({self.get_fully_qualified_name(self.model_name)}!FORECAST(
             """
 
-            if input_data_table:
+            if input_data_table and self.shard is not None:
+                # A shard's model only knows its own series, so the future exogenous rows are cut the same way
+                sql += f"""
+                INPUT_DATA => SYSTEM$QUERY_REFERENCE('SELECT * FROM {input_data_table} WHERE {self._shard_predicate(*self.shard)}'),
+                TIMESTAMP_COLNAME => '{timestamp_col}',\n"""
+            elif input_data_table:
                 sql += f"""
                 INPUT_DATA => SYSTEM$REFERENCE('TABLE', '{input_data_table}'),
                 TIMESTAMP_COLNAME => '{timestamp_col}',\n"""
@@ -224,7 +662,20 @@ class SnowflakeMLForecast(SnowparkConnection):
             if forecast_days is not None:
                 sql += f", FORECASTING_PERIODS => {forecast_days}"
             
-            sql += "));"
+            sql += "))"
+
+            if merge:
+                # Upserts keyed on (model_name, series, ts), so re-running a model never duplicates rows
+                columns = [name for name, _ in self._output_columns()]
+                key = [col for col in columns if col in ('MODEL_NAME', timestamp_col, series_col)]
+                sql = f"""
+            MERGE INTO {output_table} t
+            USING ({sql}) s
+            ON {' AND '.join(f't.{col} = s.{col}' for col in key)}
+            WHEN MATCHED THEN UPDATE SET {', '.join(f'{col} = s.{col}' for col in columns if col not in key)}
+            WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({', '.join(f's.{col}' for col in columns)});"""
+            else:
+                sql = f"INSERT INTO {output_table} {sql};"
 
             self.display("Generated Forecast SQL:", content_type="text")
             self.display(sql, content_type="code", language="sql")
@@ -235,60 +686,514 @@ class SnowflakeMLForecast(SnowparkConnection):
             self.display(f"KeyError encountered: {e}", content_type="text")
             raise e
 
-    def run_query(self, query):
-        df = self.session.sql(query).to_pandas() if self.session else None
+    def _output_write_mode(self):
+        mode = self.config['output'].get('write_mode') or 'append'
+        if mode not in self.WRITE_MODES:
+            raise ValueError(f"Unknown output write_mode '{mode}'. Choose from {list(self.WRITE_MODES)}.")
+        return mode
+
+    def _output_columns(self):
+        # In the order the forecast select produces them
+        series_col = self.config['input_data'].get('series_column')
+        timestamp_col = self.config['input_data']['timestamp_column']
+        return ([(series_col, 'STRING')] if series_col else []) + [
+            (timestamp_col, 'TIMESTAMP_NTZ'), ('FORECAST', 'FLOAT'), ('LOWER_BOUND', 'FLOAT'), ('UPPER_BOUND', 'FLOAT'),
+            ('MODEL_NAME', 'STRING'), ('CREATION_DATE', 'TIMESTAMP_LTZ'), ('MODEL_COMMENT', 'STRING')]
+
+    def _output_table_ddl(self):
+        # Declared up front so no existence check is needed; clustered for the per-model reads
+        output_table = self.get_fully_qualified_name(self.config['output']['table'])
+        timestamp_col = self.config['input_data']['timestamp_column']
+        columns = ', '.join(f"{name} {data_type}" for name, data_type in self._output_columns())
+        return f"CREATE TABLE IF NOT EXISTS {output_table} ({columns}) CLUSTER BY (MODEL_NAME, {timestamp_col});"
+
+    def _model_family_pattern(self):
+        # Matches every name `_generate_unique_model_name` can produce for this config
+        return f"{self.config['model']['name']}_[0-9]{{8}}_[a-z]{{5}}"
+
+    def _retention_sql(self, keep_versions: int):
+        # Runs before the write, so the model being written counts as one of the kept versions
+        output_table = self.get_fully_qualified_name(self.config['output']['table'])
+        family = f"RLIKE(MODEL_NAME, '{self._model_family_pattern()}') AND MODEL_NAME <> '{self.model_name}'"
+        return f"""
+        DELETE FROM {output_table}
+        WHERE {family}
+        AND MODEL_NAME NOT IN (
+            SELECT MODEL_NAME FROM {output_table}
+            WHERE {family}
+            GROUP BY MODEL_NAME
+            ORDER BY MAX(CREATION_DATE) DESC
+            LIMIT {max(int(keep_versions) - 1, 0)}
+        );"""
+
+    def _output_table_statements(self):
+        # Run before every forecast write. The table is always declared with IF NOT EXISTS, so concurrent
+        # writers never race on an existence check and an existing table is never replaced
+        keep_versions = self.config['output'].get('keep_versions')
+        statements = [self._output_table_ddl()]
+        if keep_versions:
+            statements.append(self._retention_sql(keep_versions))
+        if self.reused_model:
+            # A reused model rewrites its own rows instead of appending a second copy
+            output_table = self.get_fully_qualified_name(self.config['output']['table'])
+            statements.append(f"DELETE FROM {output_table} WHERE MODEL_NAME = '{self.model_name}';")
+        return statements
+
+    @contextmanager
+    def _planning(self):
+        # SQL generators skip their round-trips and display output while this is set
+        self._plan_only = True
+        try:
+            yield
+        finally:
+            self._plan_only = False
+
+    def _plan_key(self, max_timestamp, steps):
+        payload = {
+            'config': self.config, 'database': self.database, 'schema': self.schema, 'steps': list(steps),
+            'max_timestamp': None if max_timestamp is None else str(pd.Timestamp(max_timestamp)),
+            # Both change the compiled statements: the shard's filter and the reused model's output DELETE
+            'shard': self.shard, 'reused_model': self.reused_model,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _compile_plan(self, max_timestamp, steps):
+        statements = []
+        with self._planning():
+            if 'tags' in steps:
+                statements += [('tags', self._create_tag_sql(name, comment, if_not_exists=True))
+                               for name, comment in (self.config['model'].get('tags') or {}).items()]
+            if 'training_table' in steps:
+                self.training_window = None
+                if max_timestamp is not None:
+                    self.resolve_training_window(max_timestamp)
+                statements += [('training_table', sql) for sql in self._training_table_statements()]
+            if 'model' in steps:
+                statements.append(('model', self._generate_create_model_sql()))
+            if 'forecast' in steps:
+                statements += [('forecast', sql) for sql in self._output_table_statements()]
+                statements.append(('forecast', self._generate_forecast_sql()))
+            if 'fetch' in steps:
+                statements.append(('fetch', self._fetch_forecast_sql()))
+
+        def template(sql):
+            sql = sql.replace(self.model_name, _PLAN_MODEL)
+            return sql.replace(self.temp_table_name, _PLAN_TABLE) if self.temp_table_name else sql
+        return {'statements': [(step, template(sql)) for step, sql in statements],
+                'training_window': self.training_window}
+
+    def plan(self, max_timestamp=None, steps: Optional[Tuple[str, ...]] = None) -> ForecastPlan:
+        """Compile the pipeline's statements without running any of them.
+
+        With `max_timestamp` the training window uses literal bounds; otherwise its bounds are
+        subqueries evaluated by the server. Plans are cached per config, and each call fills in this
+        model's name and a fresh training table name.
+        """
+        steps = tuple(steps or self.PLAN_STEPS)
+        unknown = set(steps) - set(self.PLAN_STEPS)
+        if unknown:
+            raise ValueError(f"Unknown plan steps {sorted(unknown)}. Choose from {list(self.PLAN_STEPS)}.")
+        if 'training_table' not in steps and 'model' in steps and self.temp_table_name is None:
+            raise ValueError("Planning without the training_table step needs an existing temp_table_name.")
+
+        key = self._plan_key(max_timestamp, steps)
+        with _plan_lock:
+            entry = _plan_cache.get(key)
+            if entry is not None:
+                _plan_cache.move_to_end(key)
+        cached = entry is not None
+        if not cached:
+            entry = self._compile_plan(max_timestamp, steps)
+            with _plan_lock:
+                _plan_cache[key] = entry
+                while len(_plan_cache) > PLAN_CACHE_SIZE:
+                    _plan_cache.popitem(last=False)
+
+        if 'training_table' in steps:
+            self.training_window = entry['training_window']
+            self.temp_table_name = (self._incremental_training_table_name()
+                                    if self.config['forecast_config'].get('incremental_training')
+                                    else snowpark_utils.random_name_for_temp_object(snowpark_utils.TempObjectType.TABLE))
+        statements = [(step, sql.replace(_PLAN_MODEL, self.model_name).replace(_PLAN_TABLE, self.temp_table_name or ''))
+                      for step, sql in entry['statements']]
+        if 'training_table' in steps:
+            self.training_data_query = "\n".join(sql for step, sql in statements if step == 'training_table')
+        return ForecastPlan(statements, key, [self.model_name], cached)
+
+    def run_plan(self, plan: Optional[ForecastPlan] = None) -> pd.DataFrame:
+        # The whole plan is one request; its result is the planned fetch, if any
+        plan = plan or self.plan()
+        with self.report.step('plan'):
+            df = self.fetch_dataframe(plan.to_script())
+        for _, sql in plan.statements:
+            get_query_cache().invalidate_after(sql)
+        return df
+
+    @traced_step('procedure')
+    def run_procedure(self, procedure: Optional[str] = None) -> Dict:
+        """Run the whole pipeline server-side with one `CALL` and return the procedure's summary.
+
+        The procedure is created by `cortex_forecast.procedure.deploy_procedure`; afterwards
+        `fetch_forecast` reads this model's rows as usual.
+        """
+        config = json.dumps(self.config, default=str)
+        if '$$' in config:
+            raise ValueError("Configs containing '$$' cannot be passed to the procedure.")
+        result = self.run_command(f"CALL {procedure or self.PROCEDURE_NAME}(PARSE_JSON($${config}$$), '{self.model_name}')")
+        summary = result[0][0]
+        summary = json.loads(summary) if isinstance(summary, str) else summary
+        self.temp_table_name = summary.get('training_table')
+        return summary
+
+    def fetch_dataframe(self, query, result_format: Optional[str] = None) -> pd.DataFrame:
+        fetcher = RESULT_FORMATS[result_format or self.result_format]
+        with self.report.span('query', query, self.session) as span:
+            df = fetcher(self.session.sql(query))
+            span.rows = len(df)
+        return df
+
+    def run_query(self, query, result_format: Optional[str] = None):
+        df = self.fetch_dataframe(query, result_format) if self.session else None
         return df
 
     def run_command(self, query):
-        result = self.session.sql(query).collect() if self.session else None
+        with self.report.span('command', query, self.session) as span:
+            result = self.session.sql(query).collect() if self.session else None
+            span.rows = len(result) if result is not None else None
+        get_query_cache().invalidate_after(query)
         return result
 
-    def create_and_run_forecast(self):
-        self.create_tags()
+    def training_data_key(self):
+        # Configs with the same key produce identical training tables and can share one
+        input_data = self.config['input_data']
+        return (
+            self.get_fully_qualified_name(input_data['table']).upper(),
+            input_data['timestamp_column'].upper(),
+            input_data['target_column'].upper(),
+            (input_data.get('series_column') or '').upper(),
+            tuple(col.upper() for col in input_data.get('exogenous_columns') or []),
+            self.config['forecast_config'].get('training_days'),
+            tuple(sorted(self._series_filter().items())),
+            bool(self.config['forecast_config'].get('incremental_training')),
+            self.shard,
+        )
 
-        self.display("Step 1/4: Creating training table...", content_type="text")
-        sql = self._generate_input_data_sql()
-        self.run_command(sql)
+    @traced_step('training_table')
+    def create_training_table(self):
+        for sql in self._training_table_statements():
+            self.run_command(sql)
+        if self._series_filter() and not self.config['forecast_config'].get('incremental_training'):
+            self.series_pruning_report()
 
-        self.display("Step 2/4: Creating forecast model...", content_type="text")
+    @traced_step('model')
+    def create_model(self):
         sql = self._generate_create_model_sql()
         self.run_command(sql)
 
-        self.display("Step 3/4: Generating forecasts...", content_type="text")
+    def prepare_output(self):
+        "Declare the output table and apply its retention and reuse DELETEs ahead of the forecast insert."
+        for sql in self._output_table_statements():
+            self.run_command(sql)
+
+    @traced_step('forecast')
+    def run_forecast(self, wait=True, prepare=True):
+        if prepare:
+            self.prepare_output()
         sql = self._generate_forecast_sql()
-        self.run_command(sql)
+        self._forecast_job = self.run_command_async(sql)
+        self.forecast_query_id = self._forecast_job.query_id
+        if wait:
+            self.wait_for_forecast()
+
+    def wait_for_forecast(self, timeout: Optional[float] = None, poll_interval: float = 0.5):
+        if self.forecast_query_id is None:
+            raise RuntimeError("No forecast has been submitted yet. Call run_forecast() first.")
+        job = self._forecast_job or self.session.create_async_job(self.forecast_query_id)
+        if timeout is not None:
+            start = time.monotonic()
+            while not job.is_done():
+                if time.monotonic() - start > timeout:
+                    raise TimeoutError(f"Forecast query {self.forecast_query_id} still running after {timeout} seconds.")
+                time.sleep(poll_interval)
+        # Blocks until the insert finishes and surfaces its server-side error, if any
+        try:
+            job.result('no_result')
+        except Exception as e:
+            self.report.finish_query(self.forecast_query_id, error=e)
+            raise
+        self.report.finish_query(self.forecast_query_id)
+
+    def _reuse_settings(self):
+        reuse = self.config['model'].get('reuse')
+        if not reuse:
+            return None
+        settings = {**self.REUSE_DEFAULTS, **(reuse if isinstance(reuse, dict) else {})}
+        if settings['data_version'] not in self.DATA_VERSIONS:
+            raise ValueError(f"Unknown reuse data_version '{settings['data_version']}'. Choose from {list(self.DATA_VERSIONS)}.")
+        return settings if settings['enabled'] else None
+
+    def model_fingerprint(self):
+        "Hash of everything that changes the trained model; forecast-only settings are left out."
+        forecast_config = {k: v for k, v in self.config['forecast_config'].items() if k not in ('forecast_days', 'table')}
+        payload = {
+            'input_data': {**self.config['input_data'], 'table': self.get_fully_qualified_name(self.config['input_data']['table']).upper()},
+            'forecast_config': forecast_config,
+            'shard': self.shard,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:16].upper()
+
+    def source_data_version(self):
+        "`(version, max_timestamp)` of the input table under the `model.reuse.data_version` policy, in one query."
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        timestamp_col = self.config['input_data']['timestamp_column']
+        policy = (self._reuse_settings() or self.REUSE_DEFAULTS)['data_version']
+        # Row count and MAX are answered from micro-partition metadata; the commit time from table metadata
+        version = {'stats': 'COUNT(*)', 'last_change': f"SYSTEM$LAST_CHANGE_COMMIT_TIME('{table}')", 'none': "''"}[policy]
+        # Fetched as a frame, like `resolve_training_window`, so the MAX keeps its nanoseconds
+        row = self.fetch_dataframe(f"SELECT {version} AS VERSION, MAX({timestamp_col}) AS MAX_TS FROM {table}",
+                                   result_format='arrow').iloc[0]
+        max_timestamp = None if pd.isna(row.iloc[1]) else row.iloc[1]
+        if policy == 'stats':
+            return f"{row.iloc[0]}@{pd.Timestamp(max_timestamp) if max_timestamp is not None else ''}", max_timestamp
+        return '' if pd.isna(row.iloc[0]) else str(row.iloc[0]), max_timestamp
+
+    def _registry_ddl(self):
+        return f"""
+        CREATE TABLE IF NOT EXISTS {self.get_fully_qualified_name(self.REGISTRY_TABLE)} (
+            MODEL_NAME STRING, MODEL_FAMILY STRING, FINGERPRINT STRING, DATA_VERSION STRING,
+            TRAINING_END TIMESTAMP_NTZ, CREATED_AT TIMESTAMP_NTZ, LAST_USED_AT TIMESTAMP_NTZ
+        )"""
+
+    def find_registered_model(self, data_version: str):
+        "Newest registered model with this fingerprint and data version that the staleness policy still allows."
+        settings = self._reuse_settings() or self.REUSE_DEFAULTS
+        max_age = settings['max_age_days']
+        age_predicate = f"AND CREATED_AT >= DATEADD(day, -{int(max_age)}, CURRENT_TIMESTAMP())" if max_age else ""
+        self.run_command(self._registry_ddl())
+        df = self.fetch_dataframe(f"""
+        SELECT MODEL_NAME FROM {self.get_fully_qualified_name(self.REGISTRY_TABLE)}
+        WHERE FINGERPRINT = '{self.model_fingerprint()}' AND DATA_VERSION = '{data_version.replace("'", "''")}'
+        {age_predicate}
+        ORDER BY CREATED_AT DESC
+        LIMIT 1
+        """)
+        return df.iloc[0, 0] if len(df) else None
+
+    def reuse_registered_model(self):
+        """Switch to a registered model trained on the same config and source data, if `model.reuse` is set.
+
+        Returns True when a model was found; the training table and model steps can then be skipped.
+        """
+        if not self._reuse_settings():
+            return False
+        self._data_version, max_timestamp = self.source_data_version()
+        # The same MAX() bounds the training window, whether the model is reused or retrained
+        self.resolve_training_window(max_timestamp)
+        registered = self.find_registered_model(self._data_version)
+        if registered is None:
+            return False
+        self.model_name = self.report.name = registered
+        self.reused_model = True
+        self.run_command(f"""
+        UPDATE {self.get_fully_qualified_name(self.REGISTRY_TABLE)} SET LAST_USED_AT = CURRENT_TIMESTAMP()
+        WHERE MODEL_NAME = '{registered}'""")
+        self.display(f"Reusing model {registered}: config and source data are unchanged.", content_type="text")
+        return True
+
+    def register_model(self):
+        "Record the trained model for reuse and, when `keep_models` is set, drop all but the newest N with the same fingerprint."
+        settings = self._reuse_settings()
+        if not settings or self.reused_model:
+            return
+        if self._data_version is None:
+            self._data_version = self.source_data_version()[0]
+        registry = self.get_fully_qualified_name(self.REGISTRY_TABLE)
+        fingerprint = self.model_fingerprint()
+        training_end = self._timestamp_literal(self.training_window[1]) if self.training_window else 'NULL'
+        self.run_command(self._registry_ddl())
+        self.run_command(f"""
+        INSERT INTO {registry} (MODEL_NAME, MODEL_FAMILY, FINGERPRINT, DATA_VERSION, TRAINING_END, CREATED_AT, LAST_USED_AT)
+        SELECT '{self.model_name}', '{self.config['model']['name']}', '{fingerprint}',
+            '{self._data_version.replace("'", "''")}', {training_end}, CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP()""")
+
+        keep = settings['keep_models']
+        if keep is None:
+            return
+        expired = self.fetch_dataframe(f"""
+        SELECT MODEL_NAME FROM {registry}
+        WHERE FINGERPRINT = '{fingerprint}'
+        QUALIFY ROW_NUMBER() OVER (ORDER BY CREATED_AT DESC) > {max(int(keep), 1)}
+        """)
+        for name in expired.iloc[:, 0] if len(expired) else []:
+            self.run_command(f"DROP SNOWFLAKE.ML.FORECAST IF EXISTS {self.get_fully_qualified_name(name)}")
+            self.run_command(f"DELETE FROM {registry} WHERE MODEL_NAME = '{name}'")
+
+    def create_and_run_forecast(self):
+        self.create_tags()
+
+        if self.reuse_registered_model():
+            self.display("Steps 1-2/4: Skipped, the registered model is reused.", content_type="text")
+        else:
+            self.display("Step 1/4: Creating training table...", content_type="text")
+            self.create_training_table()
+
+            self.display("Step 2/4: Creating forecast model...", content_type="text")
+            self.create_model()
+            self.register_model()
+
+        self.display("Step 3/4: Generating forecasts...", content_type="text")
+        self.run_forecast()
 
         self.display("Step 4/4: Fetching forecast results...", content_type="text")
+        return self.fetch_forecast()
+
+    def _fetch_forecast_sql(self):
         output_table = self.get_fully_qualified_name(self.config['output']['table'])
-        fetch_sql = f"SELECT * FROM {output_table} ORDER BY {self.config['input_data']['timestamp_column']}"
-        
-        max_retries = 5
-        retry_delay = 2  # seconds
+        return f"""
+        SELECT *
+        FROM {output_table}
+        WHERE model_name = '{self.model_name}'
+        ORDER BY {self.config['input_data']['timestamp_column']}
+        """
 
-        for attempt in range(max_retries):
-            try:
-                forecast_data = self.run_query(fetch_sql)
-                return forecast_data
-            except SnowparkSQLException as e:
-                if "Object does not exist or not authorized" in str(e) and attempt < max_retries - 1:
-                    self.display(f"Table not ready, retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{max_retries})", content_type="text")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    raise
+    @traced_step('fetch')
+    def fetch_forecast(self):
+        # Readiness is keyed on the forecast insert's query ID instead of retrying the fetch
+        if self.forecast_query_id is not None:
+            self.wait_for_forecast()
+        return self.run_query(self._fetch_forecast_sql())
 
-        raise Exception(f"Failed to fetch forecast results after {max_retries} attempts.")
+    def iter_forecast(self):
+        # Yields pandas batches as they arrive so callers can render before the full result is fetched
+        if self.forecast_query_id is not None:
+            self.wait_for_forecast()
+        yield from self.session.sql(self._fetch_forecast_sql()).to_pandas_batches()
 
-    def cleanup(self):
-        self.display("Cleaning up temporary tables and models...", content_type="text")
-        cleanup_commands = f"""
-        DROP TABLE IF EXISTS {self.get_fully_qualified_name(self.model_name + '_train')};
-        DROP TABLE IF EXISTS {self.get_fully_qualified_name(self.config['output']['table'])};
+    def _local_training_sql(self, max_series: Optional[int] = None):
+        table = self.get_fully_qualified_name(self.config['input_data']['table'])
+        timestamp_col = self.config['input_data']['timestamp_column']
+        target_col = self.config['input_data']['target_column']
+        series_col = self.config['input_data'].get('series_column')
+        if self.training_window is None:
+            self.resolve_training_window()
+        predicates = [p for p in [self._training_window_predicate()] if p]
+        if series_col and max_series:
+            predicates.append(f"{series_col} IN (SELECT DISTINCT {series_col} FROM {table} LIMIT {int(max_series)})")
+        return f"""
+        SELECT {timestamp_col}, {target_col}{f", {series_col}" if series_col else ""}
+        FROM {table}
+        {f"WHERE {' AND '.join(predicates)}" if predicates else ""}
         """
-        for command in cleanup_commands.split(';'):
-            if command.strip():
-                self.run_command(command)
 
+    def local_forecast(self, method: str = 'seasonal_naive', data: Optional[pd.DataFrame] = None,
+                       max_series: Optional[int] = None, **params) -> pd.DataFrame:
+        """Forecast with a NumPy baseline from `cortex_forecast.local` instead of a Cortex model.
+
+        Reads the training window (optionally only `max_series` series) with one query unless `data` is given,
+        and returns rows shaped like the forecast insert. Nothing is written to the output table.
+        """
+        from .local import LocalForecaster
+        if data is None:
+            data = self.fetch_dataframe(self._local_training_sql(max_series))
+        forecaster = LocalForecaster.from_config(self.config, method=method, model_name=self.model_name, **params)
+        return forecaster.fit(data).forecast()
+
+    def local_backtest(self, method: str = 'seasonal_naive', data: Optional[pd.DataFrame] = None,
+                       max_series: Optional[int] = None, n_jobs: int = 1, **params) -> pd.DataFrame:
+        """Rolling-origin metrics for a local baseline, split with the config's `evaluation_config`.
+
+        Returns rows shaped like `SHOW_EVALUATION_METRICS`, so `evaluation_metrics_table` applies unchanged.
+        """
+        from .local import LocalForecaster
+        if data is None:
+            data = self.fetch_dataframe(self._local_training_sql(max_series))
+        forecaster = LocalForecaster.from_config(self.config, method=method, model_name=self.model_name, **params)
+        return forecaster.backtest(data, n_jobs=n_jobs)
+
+    def run_command_async(self, query):
+        job = self.session.sql(query).collect_nowait()
+        # Closed by whoever waits on the job: `wait_for_forecast` or `_run_step_async`
+        self.report.start('async', query, job.query_id)
+        get_query_cache().invalidate_after(query)
+        return job
+
+    def _set_progress(self, step, status, query_id=None, on_progress=None):
+        self.progress[step] = {'status': status, 'query_id': query_id or self.progress[step]['query_id']}
+        if on_progress:
+            on_progress(step, self.progress[step])
+
+    async def _run_step_async(self, step, query, poll_interval, on_progress):
+        job = self.run_command_async(query)
+        self._set_progress(step, 'running', job.query_id, on_progress)
+        try:
+            while not job.is_done():
+                await asyncio.sleep(poll_interval)
+            # Surfaces the server-side error, if any, for failed statements
+            if step != 'fetch':
+                job.result('no_result')
+        except Exception as e:
+            self.report.finish_query(job.query_id, error=e)
+            self._set_progress(step, 'failed', on_progress=on_progress)
+            raise
+        self.report.finish_query(job.query_id)
+        self._set_progress(step, 'done', on_progress=on_progress)
+        return job
+
+    async def create_and_run_forecast_async(self, poll_interval: float = 1.0, on_progress: Optional[Callable] = None):
+        # Same pipeline as `create_and_run_forecast`, but each statement is submitted with
+        # `collect_nowait()` and awaited by polling, so no thread is held while it runs.
+        # The few short synchronous queries (tags, the window's MAX(), registry lookups) run in a
+        # worker thread so they never block the event loop
+        await asyncio.to_thread(self.create_tags)
+
+        if await asyncio.to_thread(self.reuse_registered_model):
+            self.display("Steps 1-2/4: Skipped, the registered model is reused.", content_type="text")
+            for step in ('training_table', 'model'):
+                self._set_progress(step, 'skipped', on_progress=on_progress)
+        else:
+            self.display("Step 1/4: Creating training table...", content_type="text")
+            with self.report.step('training_table'):
+                if self.training_window is None:
+                    await asyncio.to_thread(self.resolve_training_window)
+                for sql in self._training_table_statements():
+                    await self._run_step_async('training_table', sql, poll_interval, on_progress)
+                # Same report as `create_training_table`
+                if self._series_filter() and not self.config['forecast_config'].get('incremental_training'):
+                    await asyncio.to_thread(self.series_pruning_report)
+
+            self.display("Step 2/4: Creating forecast model...", content_type="text")
+            with self.report.step('model'):
+                await self._run_step_async('model', self._generate_create_model_sql(), poll_interval, on_progress)
+            await asyncio.to_thread(self.register_model)
+
+        self.display("Step 3/4: Generating forecasts...", content_type="text")
+        with self.report.step('forecast'):
+            prepare = self._output_table_statements()
+            for sql in prepare:
+                await self._run_step_async('forecast', sql, poll_interval, on_progress)
+            sql = self._generate_forecast_sql()
+            self._forecast_job = await self._run_step_async('forecast', sql, poll_interval, on_progress)
+        self.forecast_query_id = self._forecast_job.query_id
+
+        self.display("Step 4/4: Fetching forecast results...", content_type="text")
+        with self.report.step('fetch'):
+            job = await self._run_step_async('fetch', self._fetch_forecast_sql(), poll_interval, on_progress)
+            return _async_result_to_pandas(job, self.result_format)
+
+    def cleanup(self):
+        self.display("Cleaning up temporary tables and models...", content_type="text")
+        cleanup_commands = [f"DROP SNOWFLAKE.ML.FORECAST IF EXISTS {self.get_fully_qualified_name(self.model_name)}"]
+        if self._reuse_settings():
+            cleanup_commands.append(self._registry_ddl())
+            cleanup_commands.append(f"DELETE FROM {self.get_fully_qualified_name(self.REGISTRY_TABLE)} WHERE MODEL_NAME = '{self.model_name}'")
+        # Persistent incremental training tables are shared between runs and left to `ForecastGC`
+        if self.temp_table_name and not self.config['forecast_config'].get('incremental_training'):
+            cleanup_commands.append(f"DROP TABLE IF EXISTS {self.temp_table_name}")
+        cleanup_commands.append(f"DROP TABLE IF EXISTS {self.get_fully_qualified_name(self.config['output']['table'])}")
+        for command in cleanup_commands:
+            self.run_command(command)
+
+    @traced_step('tags')
     def create_tags(self):
         tags = self.config['model'].get('tags')
         if not tags:
@@ -296,7 +1201,7 @@ class SnowflakeMLForecast(SnowparkConnection):
             return
 
         for tag_name, tag_comment in tags.items():
-            create_tag_sql = f"CREATE TAG {tag_name} COMMENT = 'Specifies the {tag_comment.lower()}';"
+            create_tag_sql = self._create_tag_sql(tag_name, tag_comment)
             try:
                 self.display(f"Attempting to create tag: {tag_name}", content_type="text")
                 self.run_command(create_tag_sql)
@@ -308,12 +1213,22 @@ class SnowflakeMLForecast(SnowparkConnection):
                     self.display(f"Error creating tag '{tag_name}': {e}", content_type="text")
 
 
+    def _create_tag_sql(self, tag_name, tag_comment, if_not_exists=False):
+        return f"CREATE TAG {'IF NOT EXISTS ' if if_not_exists else ''}{tag_name} COMMENT = 'Specifies the {tag_comment.lower()}';"
+
     def get_training_data_query(self):
         if self.training_data_query is None:
             self.display("Training data query has not been generated yet.", content_type="text")
         return self.training_data_query
 
     def load_historic_actuals(self, historical_steps_back: int):
+        query = self._historic_actuals_sql(historical_steps_back)
+        self.display("Executing historic actuals query:", content_type="text")
+        self.display(query, content_type="code", language="sql")
+        
+        return self.fetch_dataframe(query)
+
+    def _historic_actuals_sql(self, historical_steps_back: int):
         table = self.get_fully_qualified_name(self.config['input_data']['table'])
         timestamp_col = self.config['input_data']['timestamp_column']
         target_col = self.config['input_data']['target_column']
@@ -323,6 +1238,10 @@ class SnowflakeMLForecast(SnowparkConnection):
         if series_col:
             columns.append(series_col)
 
+        # Reuse the resolved training window so the scan is pruned to the trained range
+        window_predicate = self._training_window_predicate()
+        where_clause = f"WHERE {window_predicate}" if window_predicate else ""
+
         if series_col:
             query = f"""
             WITH ranked_data AS (
@@ -330,6 +1249,7 @@ class SnowflakeMLForecast(SnowparkConnection):
                     {', '.join(columns)},
                     ROW_NUMBER() OVER (PARTITION BY {series_col} ORDER BY {timestamp_col} DESC) as rn
                 FROM {table}
+                {where_clause}
             )
             SELECT {', '.join(columns)}
             FROM ranked_data
@@ -340,20 +1260,45 @@ class SnowflakeMLForecast(SnowparkConnection):
             query = f"""
             SELECT {', '.join(columns)}
             FROM {table}
+            {where_clause}
             ORDER BY {timestamp_col} DESC
             LIMIT {historical_steps_back}
             """
+        return query
 
-        self.display("Executing historic actuals query:", content_type="text")
-        self.display(query, content_type="code", language="sql")
-        
-        df_actuals = self.session.sql(query).collect()
-        return pd.DataFrame(df_actuals)
+    def _diagnostics_sql(self):
+        model = self.get_fully_qualified_name(self.model_name)
+        return {
+            'feature_importance': f"CALL {model}!EXPLAIN_FEATURE_IMPORTANCE();",
+            'metrics': f"CALL {model}!SHOW_EVALUATION_METRICS();",
+        }
 
-    def generate_forecast_and_visualization(self, show_historical=True, historical_steps_back=21):
+    def fetch_dataframes(self, queries: Dict[str, str], result_format: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Submit every query in `queries` before waiting on any, returning the frames under the same keys.
+
+        The statements run concurrently in the warehouse; their query IDs are kept in `self.query_ids`.
+        """
+        jobs = {name: self.session.sql(query).collect_nowait() for name, query in queries.items()}
+        self.query_ids.update({name: job.query_id for name, job in jobs.items()})
+        for name, job in jobs.items():
+            self.report.start('async', queries[name], job.query_id)
+        frames = {}
+        for name, job in jobs.items():
+            try:
+                frames[name] = _async_result_to_pandas(job, result_format or self.result_format)
+            except Exception as e:
+                self.report.finish_query(job.query_id, error=e)
+                raise
+            self.report.finish_query(job.query_id, rows=len(frames[name]))
+        return frames
+
+    @traced_step('visualization')
+    def generate_forecast_and_visualization(self, show_historical=True, historical_steps_back=21, chart_mode=None,
+                                            page=1, page_size=None, search=None, order_by=None, max_points=None):
+        settings = self.chart_settings(chart_mode=chart_mode, page_size=page_size, order_by=order_by,
+                                       max_points=max_points)
         series_col = self.config['input_data'].get('series_column')
         timestamp_col = self.config['input_data']['timestamp_column']
-        target_col = self.config['input_data']['target_column']
         output_table = self.get_fully_qualified_name(self.config['output']['table'])
 
         # Fetch forecast data
@@ -366,84 +1311,138 @@ class SnowflakeMLForecast(SnowparkConnection):
         if series_col:
             forecast_query += f", {series_col}"
 
+        actuals_query = self._historic_actuals_sql(historical_steps_back)
+
         self.display("Executing forecast query:", content_type="text")
         self.display(forecast_query, content_type="code", language="sql")
-        
-        df_forecast = self.session.sql(forecast_query).collect()
-        df_forecast = pd.DataFrame(df_forecast)
+        self.display("Executing historic actuals query:", content_type="text")
+        self.display(actuals_query, content_type="code", language="sql")
+
+        # Forecast, actuals and the model diagnostics are independent, so they run concurrently
+        frames = self.fetch_dataframes({'forecast': forecast_query, 'actuals': actuals_query, **self._diagnostics_sql()})
+        df_forecast, df_actuals = frames['forecast'], frames['actuals']
         
         self.display("Forecast data preview (last 5 rows):", content_type="text")
         self.display(df_forecast.tail(), content_type="dataframe")
 
-        # Fetch and prepare historical data
-        df_actuals = self.load_historic_actuals(historical_steps_back)
         self.display("Historical data preview (last 5 rows):", content_type="text")
         self.display(df_actuals.tail(), content_type="dataframe")
 
-        # Ensure column names are consistent
-        df_forecast.columns = df_forecast.columns.str.upper()
-        df_actuals.columns = df_actuals.columns.str.upper()
-
-        # Identify key columns
-        ts_col = next(col for col in df_forecast.columns if col in [timestamp_col.upper(), 'TS', 'TIMESTAMP', 'DATE'])
-        forecast_col = next(col for col in df_forecast.columns if col in ['FORECAST', 'PREDICTION'])
-        lower_bound_col = next(col for col in df_forecast.columns if col in ['LOWER_BOUND', 'LOWER'])
-        upper_bound_col = next(col for col in df_forecast.columns if col in ['UPPER_BOUND', 'UPPER'])
-
         try:
-            self.display('Getting historical max date', content_type="text")
-            max_historic_date = df_actuals[ts_col].max()
-            self.display(f"Max historical date: {max_historic_date}", content_type="text")
+            df_combined, ts_col = self.prepare_chart_data(df_forecast, df_actuals if show_historical else None)
 
-            # Prepare forecast data
-            df_forecast['TYPE'] = 'Forecast'
-            df_forecast[lower_bound_col] = np.maximum(df_forecast[lower_bound_col], 0)
-            df_forecast[upper_bound_col] = np.maximum(df_forecast[upper_bound_col], 0)
-            df_forecast[forecast_col] = np.maximum(df_forecast[forecast_col], 0)
-
-            # Prepare historical data
-            df_actuals['TYPE'] = 'Historic'
-            df_actuals[forecast_col] = df_actuals[target_col.upper()]
-            df_actuals[lower_bound_col] = np.NaN
-            df_actuals[upper_bound_col] = np.NaN
-
-            # Combine data
-            if show_historical:
-                df_combined = pd.concat([df_forecast, df_actuals], ignore_index=True)
+            self.display('Getting historical max date', content_type="text")
+            if self.training_window is not None:
+                max_historic_date = self.training_window[1]
             else:
-                df_combined = df_forecast
+                max_historic_date = pd.to_datetime(df_actuals.rename(columns=str.upper)[ts_col]).max()
+            self.display(f"Max historical date: {max_historic_date}", content_type="text")
 
-            # Melt the dataframe
-            id_vars = [ts_col, 'TYPE']
-            if series_col:
-                id_vars.append(series_col.upper())
+            # Bound the points embedded per chart regardless of the data's granularity
+            n_rows = len(df_combined)
+            df_combined = minmax_downsample(df_combined, 'FORECAST', settings['max_points'],
+                                            by=[series_col.upper()] if series_col else None, segment='TYPE')
+            if len(df_combined) < n_rows:
+                self.display(f"Downsampled chart data from {n_rows} to {len(df_combined)} rows "
+                             f"(max {settings['max_points']} points per chart)", content_type="text")
 
-            df_melted = df_combined.melt(id_vars=id_vars, 
-                                        value_vars=[forecast_col, lower_bound_col, upper_bound_col], 
-                                        var_name='VALUE_TYPE', value_name='VOLUME')
-            
-            df_melted = df_melted.dropna(subset=['VOLUME'])
-            
             self.display("Combined data preview (last 5 rows):", content_type="text")
-            self.display(df_melted.tail(), content_type="dataframe")
+            self.display(df_combined.tail(), content_type="dataframe")
 
             # Create and display charts
-            charts = self.create_altair_visualization(df_melted, max_historic_date, series_col, ts_col)
-            self.display_charts(charts, series_col)
+            if series_col and settings['chart_mode'] != 'all':
+                order = (self.series_error_ranking(settings['error_metric'], frames['metrics'])
+                         if settings['order_by'] == 'error' else None)
+                charts = LazyCharts(self, df_combined, max_historic_date, series_col, ts_col, order=order)
+                n_pages = charts.n_pages(settings['page_size'], search)
+                self.display(f"Page {page} of {n_pages} ({len(charts.search(search))} series)", content_type="text")
+                if settings['chart_mode'] == 'facet':
+                    selected = charts.page_series(page, settings['page_size'], search)
+                    self.display(self.create_faceted_chart(charts.frame(selected), max_historic_date, series_col, ts_col,
+                                                           columns=settings['facet_columns']), content_type="chart")
+                else:
+                    self.display_charts(charts.page(page, settings['page_size'], search), series_col)
+            else:
+                charts = self.create_altair_visualization(df_combined, max_historic_date, series_col, ts_col)
+                self.display_charts(charts, series_col)
 
             # Display key data aspects
-            self.show_key_data_aspects(series_col)
+            self.show_key_data_aspects(series_col, frames['feature_importance'], frames['metrics'])
+            return charts
 
-        except KeyError as e:
+        except (KeyError, StopIteration) as e:
             self.display(f"KeyError encountered: {e}", content_type="text")
 
+    def chart_settings(self, **overrides):
+        "Chart options from the `visualization` config section, with non-None `overrides` applied."
+        settings = {**self.CHART_DEFAULTS, **(self.config.get('visualization') or {})}
+        settings.update({key: value for key, value in overrides.items() if value is not None})
+        if settings['chart_mode'] not in ('all', 'lazy', 'facet'):
+            raise ValueError(f"Unknown chart_mode {settings['chart_mode']!r}; expected 'all', 'lazy' or 'facet'")
+        return settings
+
+    def series_error_ranking(self, metric='SMAPE', metrics=None):
+        "Series ordered worst first by the model's evaluation `metric`."
+        if metrics is None:
+            metrics = self.fetch_dataframe(self._diagnostics_sql()['metrics'])
+        metrics = _normalize_series_frame(metrics)
+        if 'SERIES' not in metrics.columns or metrics.empty:
+            return []
+        metrics = metrics[metrics['ERROR_METRIC'].str.upper() == metric.upper()]
+        return metrics.sort_values('METRIC_VALUE', ascending=False, kind='stable')['SERIES'].tolist()
+
+    def prepare_chart_data(self, df_forecast, df_actuals=None):
+        """Build the wide chart frame (one row per series and timestamp) from forecast and actuals.
+
+        Only the columns the charts need are copied; `TYPE` and the series column are categorical and
+        the frame is sorted by series so each chart is a contiguous slice. Returns `(df, ts_col)`.
+        """
+        series_col = self.config['input_data'].get('series_column')
+        timestamp_col = self.config['input_data']['timestamp_column']
+        target_col = self.config['input_data']['target_column'].upper()
+        series_key = series_col.upper() if series_col else None
+
+        df_forecast = df_forecast.rename(columns=str.upper)
+        ts_col = next(col for col in df_forecast.columns if col in [timestamp_col.upper(), 'TS', 'TIMESTAMP', 'DATE'])
+        forecast_col = next(col for col in df_forecast.columns if col in ['FORECAST', 'PREDICTION'])
+        lower_bound_col = next(col for col in df_forecast.columns if col in ['LOWER_BOUND', 'LOWER'])
+        upper_bound_col = next(col for col in df_forecast.columns if col in ['UPPER_BOUND', 'UPPER'])
+
+        keys = [ts_col] + ([series_key] if series_key else [])
+        value_cols = [forecast_col, lower_bound_col, upper_bound_col]
+        forecast = df_forecast[keys + value_cols].set_axis(keys + list(self.CHART_VALUE_COLUMNS), axis=1)
+        forecast[list(self.CHART_VALUE_COLUMNS)] = forecast[list(self.CHART_VALUE_COLUMNS)].clip(lower=0)
+        forecast['TYPE'] = 'Forecast'
+        frames = [forecast]
+
+        if df_actuals is not None and len(df_actuals):
+            df_actuals = df_actuals.rename(columns=str.upper)
+            actuals = df_actuals[keys].copy()
+            actuals['FORECAST'] = df_actuals[target_col]
+            actuals['LOWER_BOUND'] = np.nan
+            actuals['UPPER_BOUND'] = np.nan
+            actuals['TYPE'] = 'Historic'
+            frames.append(actuals)
+
+        df = pd.concat(frames, ignore_index=True)
+        df[ts_col] = pd.to_datetime(df[ts_col])
+        df['TYPE'] = pd.Categorical(df['TYPE'], categories=['Historic', 'Forecast'])
+        if series_key:
+            df[series_key] = df[series_key].astype('category')
+            df = df.sort_values([series_key, ts_col], kind='stable', ignore_index=True)
+        else:
+            df = df.sort_values(ts_col, kind='stable', ignore_index=True)
+        return df, ts_col
+
+    def iter_chart_series(self, df, series_col):
+        "Yield `(series, frame)` pairs in a single grouped pass over `df`."
+        for series, series_df in df.groupby(series_col.upper(), sort=False, observed=True):
+            yield series, series_df
+
     def create_altair_visualization(self, df, max_historic_date, series_col, ts_col):
         if series_col:
-            charts = {}
-            for series in df[series_col.upper()].unique():
-                series_df = df[df[series_col.upper()] == series]
-                charts[series] = self.create_single_chart(series_df, max_historic_date, series, ts_col)
-            return charts
+            return {series: self.create_single_chart(series_df, max_historic_date, series, ts_col)
+                    for series, series_df in self.iter_chart_series(df, series_col)}
         else:
             return self.create_single_chart(df, max_historic_date, timestamp_col=ts_col)
 
@@ -461,7 +1460,14 @@ class SnowflakeMLForecast(SnowparkConnection):
             fontSize=12
         ).encode(x='x:T', y=alt.value(5), text='label:N')
 
-        line_chart = alt.Chart(df).mark_line(point=True).encode(
+        base = alt.Chart(df)
+        if 'VOLUME' not in df.columns:
+            # Wide frame from prepare_chart_data: fold the value columns client side instead of melting
+            base = base.transform_fold(
+                list(self.CHART_VALUE_COLUMNS), as_=['VALUE_TYPE', 'VOLUME']
+            ).transform_filter('isValid(datum.VOLUME)')
+
+        line_chart = base.mark_line(point=True).encode(
             x=alt.X(f"{timestamp_col}:T", axis=alt.Axis(title="Date")),
             y=alt.Y("VOLUME:Q"),
             color=alt.Color('VALUE_TYPE:N', legend=alt.Legend(title="Forecast Type")),
@@ -479,8 +1485,38 @@ class SnowflakeMLForecast(SnowparkConnection):
 
         return alt.layer(line_chart, max_historic_date_rule, max_historic_date_label)
 
+    def create_faceted_chart(self, df, max_historic_date, series_col, ts_col, columns=2):
+        "One faceted spec for several series; the data is embedded once rather than per chart."
+        base = alt.Chart(df).transform_fold(
+            list(self.CHART_VALUE_COLUMNS), as_=['VALUE_TYPE', 'VOLUME']
+        ).transform_filter('isValid(datum.VOLUME)')
+
+        line_chart = base.mark_line(point=True).encode(
+            x=alt.X(f"{ts_col}:T", axis=alt.Axis(title="Date")),
+            y=alt.Y("VOLUME:Q"),
+            color=alt.Color('VALUE_TYPE:N', legend=alt.Legend(title="Forecast Type")),
+            strokeDash=alt.StrokeDash('TYPE:N', legend=alt.Legend(title="Data Type"))
+        ).properties(width=380, height=200)
+
+        # The rule shares the facet data, so aggregate to a single row per panel before drawing it
+        max_historic_date_rule = alt.Chart(df).transform_aggregate(n='count()').mark_rule(
+            color='orange',
+            strokeDash=[5, 5]
+        ).encode(x=alt.XDatum(pd.Timestamp(max_historic_date).isoformat(), type='temporal'))
+
+        return alt.layer(line_chart, max_historic_date_rule).facet(
+            facet=alt.Facet(f"{series_col.upper()}:N", title=None), columns=columns
+        ).resolve_scale(y='independent').properties(
+            title={
+                "text": ["Forecast and Historic Volume"],
+                "subtitle": ["Comparing forecasted volume with historic data"],
+                "color": "black",
+                "subtitleColor": "gray"
+            }
+        )
+
     def display_charts(self, charts, series_col):
-        if isinstance(charts, dict):
+        if isinstance(charts, Mapping):
             for series, chart in charts.items():
                 self.display(f"Forecast for {series}", content_type="text")
                 self.display(chart, content_type="chart")
@@ -506,40 +1542,63 @@ class SnowflakeMLForecast(SnowparkConnection):
         else:
             display(charts)
 
-    def show_key_data_aspects(self, series_col=None):
-        self.display("Top 10 Feature Importances", content_type="text")
-        feature_importance = f"CALL {self.get_fully_qualified_name(self.model_name)}!EXPLAIN_FEATURE_IMPORTANCE();"
-
+    def show_key_data_aspects(self, series_col=None, feature_importance=None, metrics=None):
+        if feature_importance is None or metrics is None:
+            frames = self.fetch_dataframes(self._diagnostics_sql())
+            feature_importance, metrics = frames['feature_importance'], frames['metrics']
 
-        f_i = self.session.sql(feature_importance).collect()
-        df_fi = pd.DataFrame(f_i)
-        
+        self.display("Top 10 Feature Importances", content_type="text")
+        df_fi = _normalize_series_frame(feature_importance)
         if series_col and 'SERIES' in df_fi.columns:
-            for series in df_fi['SERIES'].unique():
-                series_df = df_fi[df_fi['SERIES'] == series].sort_values('SCORE', ascending=False).head(10)
-                chart = self.create_feature_importance_chart(series_df, series)
-                self.display(f"Feature Importance for {series}", content_type="text")
-                self.display(chart, content_type="chart")
-                self.display(series_df, content_type="dataframe")
+            # One table of the per-series top 10 and one chart of the mean score across series
+            df_fi = df_fi.sort_values(['SERIES', 'SCORE'], ascending=[True, False], kind='stable')
+            df_fi = df_fi.groupby('SERIES', sort=False).head(10).reset_index(drop=True)
+            mean_fi = df_fi.groupby('FEATURE_NAME', as_index=False)['SCORE'].mean().nlargest(10, 'SCORE')
+            self.display(self.create_feature_importance_chart(mean_fi, 'all series (mean)'), content_type="chart")
         else:
             df_fi = df_fi.sort_values('SCORE', ascending=False).head(10)
-            chart = self.create_feature_importance_chart(df_fi)
-            self.display(chart, content_type="chart")
-            self.display(df_fi, content_type="dataframe")
+            self.display(self.create_feature_importance_chart(df_fi), content_type="chart")
+        self.display(df_fi, content_type="dataframe")
 
         self.display("Underlying Model Metrics", content_type="text")
-        metric_call = f"CALL {self.get_fully_qualified_name(self.model_name)}!SHOW_EVALUATION_METRICS();"
-        metrics = self.session.sql(metric_call).collect()
-        metrics = [metric.as_dict() for metric in metrics]
-        metrics_df = pd.DataFrame(metrics)
-        
-        if series_col and 'SERIES' in metrics_df.columns:
-            for series in metrics_df['SERIES'].unique():
-                series_metrics = metrics_df[metrics_df['SERIES'] == series]
-                self.display(f"Metrics for {series}", content_type="text")
-                self.display(series_metrics, content_type="dataframe")
-        else:
-            self.display(metrics_df, content_type="dataframe")
+        self.display(self.evaluation_metrics_table(metrics), content_type="dataframe")
+        if self.config['output'].get('metrics_table'):
+            self.persist_evaluation_metrics(self.query_ids.get('metrics'))
+
+    def evaluation_metrics_table(self, metrics):
+        "`SHOW_EVALUATION_METRICS` output pivoted to one row per series and one column per error metric."
+        metrics = _normalize_series_frame(metrics)
+        if metrics.empty or 'ERROR_METRIC' not in metrics.columns:
+            return metrics
+        index = ['SERIES'] if 'SERIES' in metrics.columns else None
+        return metrics.pivot_table(index=index, columns='ERROR_METRIC', values='METRIC_VALUE',
+                                   aggfunc='first').rename_axis(columns=None)
+
+    def persist_evaluation_metrics(self, query_id=None):
+        """Replace this model's rows in `output.metrics_table` with its evaluation metrics.
+
+        With the `query_id` of an earlier `SHOW_EVALUATION_METRICS` call the rows are copied from its
+        result cache via `RESULT_SCAN`, so the metrics are not recomputed or sent through the client.
+        """
+        table = self.get_fully_qualified_name(self.config['output']['metrics_table'])
+        if query_id is None:
+            # LAST_QUERY_ID() would point at the DDL below, so the call's own query ID is kept
+            job = self.run_command_async(self._diagnostics_sql()['metrics'])
+            job.result('no_result')
+            self.report.finish_query(job.query_id)
+            query_id = job.query_id
+        source = f"TABLE(RESULT_SCAN('{query_id}'))"
+        series_select = "series::string" if self.config['input_data'].get('series_column') else "NULL"
+        for sql in (
+            f"""CREATE TABLE IF NOT EXISTS {table} (
+                model_name STRING, series STRING, error_metric STRING, metric_value FLOAT,
+                standard_deviation FLOAT, creation_date TIMESTAMP_LTZ)""",
+            f"DELETE FROM {table} WHERE model_name = '{self.model_name}'",
+            f"""INSERT INTO {table}
+            SELECT '{self.model_name}', {series_select}, error_metric, metric_value, standard_deviation, CURRENT_TIMESTAMP()
+            FROM {source}""",
+        ):
+            self.run_command(sql)
 
     def create_feature_importance_chart(self, df, series=None):
         title = f"Feature Importance Plot{' for ' + series if series else ''}"
@@ -553,6 +1612,8 @@ class SnowflakeMLForecast(SnowparkConnection):
         )
 
     def display(self, content, content_type="text", **kwargs):
+        if self._plan_only:
+            return
         if self.is_streamlit:
             import streamlit as st
             if content_type == "text":
@@ -0,0 +1,220 @@
+"""Vectorized NumPy baseline forecasts for previews and fallback"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/08_local.ipynb.
+
+# %% auto 0
+__all__ = ['BASELINES', 'EVALUATION_DEFAULTS', 'BACKTEST_METRICS', 'panel_array', 'right_align', 'seasonal_naive',
+           'moving_average', 'exponential_smoothing', 'LocalForecaster', 'rolling_origin_splits']
+
+# %% ../nbs/08_local.ipynb 3
+import warnings
+import numpy as np
+import pandas as pd
+
+from statistics import NormalDist
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+# %% ../nbs/08_local.ipynb 5
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    index = np.where(np.isnan(values), 0, np.arange(values.shape[1]))
+    np.maximum.accumulate(index, axis=1, out=index)
+    return values[np.arange(values.shape[0])[:, None], index]
+
+def panel_array(df: pd.DataFrame, timestamp_column: str, target_column: str, series_column: Optional[str] = None,
+                freq=None) -> Tuple[np.ndarray, pd.Index, pd.DatetimeIndex]:
+    """Pivot a long panel into a `(series, time)` float array on a regular grid; missing steps are NaN."""
+    ts = pd.to_datetime(df[timestamp_column]).to_numpy()
+    codes, series = pd.factorize(df[series_column] if series_column else pd.Series(0, index=df.index), sort=True)
+    times = np.unique(ts)
+    if freq is None:
+        freq = pd.infer_freq(times) if len(times) >= 3 else None
+        freq = freq or (pd.Timedelta(np.median(np.diff(times))) if len(times) > 1 else pd.Timedelta(days=1))
+    grid = pd.date_range(times[0], times[-1], freq=freq)
+    position = grid.get_indexer(ts)
+    on_grid = position >= 0
+    values = np.full((len(series), len(grid)), np.nan)
+    values[codes[on_grid], position[on_grid]] = pd.to_numeric(df[target_column], errors='coerce').to_numpy(dtype=float)[on_grid]
+    return values, pd.Index(series), grid
+
+def right_align(values: np.ndarray, fill: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    "Shift each row so its last observation is in the last column; returns the shifted array and each row's last index."
+    n_steps = values.shape[1]
+    observed = ~np.isnan(values)
+    last = np.where(observed.any(axis=1), n_steps - 1 - np.argmax(observed[:, ::-1], axis=1), -1)
+    source = np.arange(n_steps)[None, :] - (n_steps - 1 - last)[:, None]
+    aligned = np.take_along_axis(values, np.clip(source, 0, n_steps - 1), axis=1)
+    aligned[source < 0] = np.nan
+    return (_forward_fill(aligned) if fill else aligned), last
+
+# %% ../nbs/08_local.ipynb 7
+def _row_std(errors: np.ndarray) -> np.ndarray:
+    counts = np.sum(~np.isnan(errors), axis=1)
+    std = np.nanstd(np.where(counts[:, None] > 1, errors, 0.0), axis=1, ddof=1) if errors.shape[1] > 1 else np.zeros(len(errors))
+    return np.nan_to_num(np.where(counts > 1, std, 0.0))
+
+def seasonal_naive(values: np.ndarray, horizon: int, season: int = 7, **_) -> Tuple[np.ndarray, np.ndarray]:
+    season = max(1, min(season, values.shape[1]))
+    steps = np.arange(horizon)
+    forecast = values[:, values.shape[1] - season + steps % season]
+    sigma = _row_std(values[:, season:] - values[:, :-season])
+    return forecast, sigma[:, None] * np.sqrt(1 + steps // season)[None, :]
+
+def moving_average(values: np.ndarray, horizon: int, window: int = 7, **_) -> Tuple[np.ndarray, np.ndarray]:
+    window = max(1, min(window, values.shape[1]))
+    means = pd.DataFrame(values.T).rolling(window, min_periods=1).mean().to_numpy().T
+    sigma = _row_std(values[:, 1:] - means[:, :-1])
+    forecast = np.repeat(means[:, -1:], horizon, axis=1)
+    return forecast, np.repeat((sigma * np.sqrt(1 + 1 / window))[:, None], horizon, axis=1)
+
+def exponential_smoothing(values: np.ndarray, horizon: int, alpha: float = 0.3, **_) -> Tuple[np.ndarray, np.ndarray]:
+    # Simple exponential smoothing; pandas runs the level recursion for every series in one pass
+    level = pd.DataFrame(values.T).ewm(alpha=alpha, adjust=False, ignore_na=True).mean().to_numpy().T
+    sigma = _row_std(values[:, 1:] - level[:, :-1])
+    forecast = np.repeat(level[:, -1:], horizon, axis=1)
+    return forecast, sigma[:, None] * np.sqrt(1 + np.arange(horizon) * alpha ** 2)[None, :]
+
+BASELINES: Dict[str, Callable] = {
+    'seasonal_naive': seasonal_naive,
+    'exponential_smoothing': exponential_smoothing,
+    'moving_average': moving_average,
+}
+
+# %% ../nbs/08_local.ipynb 9
+class LocalForecaster:
+    def __init__(self, timestamp_column: str = 'TS', target_column: str = 'TARGET', series_column: Optional[str] = None,
+                 method: str = 'seasonal_naive', prediction_interval: float = 0.95, forecast_days: int = 14,
+                 model_name: Optional[str] = None, **params):
+        if method not in BASELINES:
+            raise ValueError(f"Unknown method '{method}'. Choose from {sorted(BASELINES)}.")
+        self.timestamp_column = timestamp_column
+        self.target_column = target_column
+        self.series_column = series_column
+        self.method = method
+        self.prediction_interval = prediction_interval
+        self.forecast_days = forecast_days
+        self.model_name = model_name or f"local_{method}"
+        self.evaluation_config = {}
+        self.params = params
+        self.values = None
+
+    @classmethod
+    def from_config(cls, config: Dict, **kwargs) -> 'LocalForecaster':
+        input_data, forecast_config = config['input_data'], config['forecast_config']
+        evaluation_config = (forecast_config.get('config_object') or {}).get('evaluation_config') or {}
+        settings = {
+            'timestamp_column': input_data['timestamp_column'],
+            'target_column': input_data['target_column'],
+            'series_column': input_data.get('series_column') or None,
+            'prediction_interval': evaluation_config.get('prediction_interval', 0.95),
+            'forecast_days': forecast_config.get('forecast_days') or 14,
+        }
+        forecaster = cls(**{**settings, **kwargs})
+        forecaster.evaluation_config = dict(evaluation_config)
+        return forecaster
+
+    def fit(self, df: pd.DataFrame) -> 'LocalForecaster':
+        columns = {col.upper(): col for col in df.columns}
+        pick = lambda name: columns.get(name.upper(), name) if name else None
+        values, self.series, self.grid = panel_array(df, pick(self.timestamp_column), pick(self.target_column),
+                                                     pick(self.series_column))
+        self.values, self.last = right_align(values)
+        return self
+
+    def forecast(self, periods: Optional[int] = None) -> pd.DataFrame:
+        if self.values is None:
+            raise RuntimeError("Call fit() before forecast().")
+        periods = periods or self.forecast_days
+        point, std = BASELINES[self.method](self.values, periods, **self.params)
+        z = NormalDist().inv_cdf((1 + self.prediction_interval) / 2)
+        keep = ~np.isnan(point[:, 0])
+        # Extending the grid keeps calendar frequencies such as month starts exact
+        extended = pd.date_range(self.grid[0], periods=len(self.grid) + periods, freq=self.grid.freq).to_numpy()
+        out = pd.DataFrame({
+            self.timestamp_column: extended[self.last[keep][:, None] + np.arange(1, periods + 1)[None, :]].ravel(),
+            'FORECAST': np.maximum(point[keep], 0).ravel(),
+            'LOWER_BOUND': np.maximum(point[keep] - z * std[keep], 0).ravel(),
+            'UPPER_BOUND': np.maximum(point[keep] + z * std[keep], 0).ravel(),
+            'MODEL_NAME': self.model_name,
+        })
+        if self.series_column:
+            out.insert(0, self.series_column, np.repeat(self.series[keep].astype(str), periods))
+        return out
+
+    def backtest(self, df: pd.DataFrame, n_jobs: int = 1, **evaluation_config) -> pd.DataFrame:
+        "Rolling-origin metrics per series in the `SHOW_EVALUATION_METRICS` layout; keywords override `evaluation_config`."
+        settings = {**EVALUATION_DEFAULTS, **evaluation_config}
+        settings.update({k: v for k, v in self.evaluation_config.items() if k in EVALUATION_DEFAULTS and k not in evaluation_config})
+        columns = {col.upper(): col for col in df.columns}
+        pick = lambda name: columns.get(name.upper(), name) if name else None
+        values, series, _ = panel_array(df, pick(self.timestamp_column), pick(self.target_column), pick(self.series_column))
+        values, _ = right_align(values, fill=False)
+        splits = rolling_origin_splits(values.shape[1], **settings)
+        args = (splits, settings['gap'] or 0, self.method, self.prediction_interval, self.params)
+
+        if n_jobs > 1 and len(values) > n_jobs:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                chunks = pool.map(_backtest_chunk, np.array_split(values, n_jobs), *(repeat(arg) for arg in args))
+                metrics = np.concatenate(list(chunks), axis=1)
+        else:
+            metrics = _backtest_chunk(values, *args)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            mean = np.nanmean(metrics, axis=0)
+            spread = np.nanstd(metrics, axis=0, ddof=1) if len(splits) > 1 else np.zeros_like(mean)
+        out = pd.DataFrame({
+            'ERROR_METRIC': np.tile(BACKTEST_METRICS, len(series)),
+            'METRIC_VALUE': mean.ravel(),
+            'STANDARD_DEVIATION': spread.ravel(),
+        })
+        if self.series_column:
+            out.insert(0, 'SERIES', np.repeat(series.astype(str), len(BACKTEST_METRICS)))
+        return out
+
+# %% ../nbs/08_local.ipynb 15
+EVALUATION_DEFAULTS = {'n_splits': 2, 'test_size': None, 'gap': 0, 'max_train_size': None}
+BACKTEST_METRICS = ('MAE', 'MAPE', 'MSE', 'SMAPE', 'COVERAGE_INTERVAL')
+
+def rolling_origin_splits(n_steps: int, n_splits: int = 2, test_size: Optional[int] = None, gap: int = 0,
+                          max_train_size: Optional[int] = None) -> List[Tuple[int, int, int]]:
+    "`(train_start, train_end, test_end)` column bounds; the test window is `[train_end + gap, test_end)`."
+    test_size = test_size or n_steps // (n_splits + 1)
+    if test_size < 1 or n_steps - gap - n_splits * test_size < 1:
+        raise ValueError(f"{n_steps} steps are too few for {n_splits} splits of {test_size} with gap {gap}.")
+    splits = []
+    for test_start in range(n_steps - n_splits * test_size, n_steps, test_size):
+        train_end = test_start - gap
+        splits.append((max(0, train_end - max_train_size) if max_train_size else 0, train_end, test_start + test_size))
+    return splits
+
+def _backtest_chunk(values: np.ndarray, splits: List[Tuple[int, int, int]], gap: int, method: str,
+                    prediction_interval: float, params: Dict) -> np.ndarray:
+    "Metrics shaped `(fold, series, metric)` for right-aligned, unfilled `values`."
+    n_series, n_folds = len(values), len(splits)
+    width = max(end - start for start, end, _ in splits)
+    horizon = splits[0][2] - splits[0][1]
+    stacked = np.full((n_folds * n_series, width), np.nan)
+    actual = np.full((n_folds, n_series, horizon), np.nan)
+    for fold, (start, end, test_end) in enumerate(splits):
+        stacked[fold * n_series:(fold + 1) * n_series, width - (end - start):] = values[:, start:end]
+        # Steps inside the gap are forecast but not scored
+        actual[fold, :, gap:] = values[:, end + gap:test_end]
+
+    # Every fold of every series goes through the baseline in one call
+    point, std = BASELINES[method](_forward_fill(stacked), horizon, **params)
+    point, std = point.reshape(n_folds, n_series, horizon), std.reshape(n_folds, n_series, horizon)
+    z = NormalDist().inv_cdf((1 + prediction_interval) / 2)
+    error = actual - point
+    observed = ~np.isnan(actual)
+    with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        metrics = [
+            np.abs(error),
+            np.abs(error / np.where(actual != 0, actual, np.nan)),
+            error ** 2,
+            2 * np.abs(error) / (np.abs(actual) + np.abs(point)),
+            np.where(observed, (actual >= point - z * std) & (actual <= point + z * std), np.nan),
+        ]
+        return np.stack([np.nanmean(metric, axis=2) for metric in metrics], axis=2)
@@ -0,0 +1,94 @@
+"""Run a whole forecast pipeline server-side in one call"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_procedure.ipynb.
+
+# %% auto 0
+__all__ = ['PROCEDURE_PACKAGES', 'run_forecast_procedure', 'procedure_ddl', 'deploy_procedure']
+
+# %% ../nbs/07_procedure.ipynb 3
+import os
+import time
+import zipfile
+import tempfile
+import pandas as pd
+
+from typing import Dict, Iterable, Optional
+from .forecast import SnowflakeMLForecast
+
+# %% ../nbs/07_procedure.ipynb 5
+def _session_scope(session) -> Dict[str, str]:
+    # Defaults for configs that do not name a database or schema; Snowpark returns quoted identifiers
+    scope = {}
+    for key in ('database', 'schema', 'warehouse'):
+        getter = getattr(session, f"get_current_{key}", None)
+        value = getter() if getter else None
+        if value:
+            scope[key] = value.strip('"')
+    return scope
+
+def run_forecast_procedure(session, config: Dict, model_name: Optional[str] = None) -> Dict:
+    "Stored procedure handler: train, score and (optionally) persist metrics for `config`, returning a summary."
+    start = time.perf_counter()
+    model = SnowflakeMLForecast(config, connection_config=_session_scope(session), session=session)
+    if model_name:
+        model.model_name = model.report.name = model_name
+    # One MAX() resolves the window to literal bounds, which prune partitions where a subquery can't
+    window = model.resolve_training_window()
+    model.run_plan(model.plan(max_timestamp=window[1] if window else None,
+                              steps=('tags', 'training_table', 'model', 'forecast')))
+    if model.config['output'].get('metrics_table'):
+        model.persist_evaluation_metrics()
+
+    output_table = model.get_fully_qualified_name(model.config['output']['table'])
+    timestamp_col = model.config['input_data']['timestamp_column']
+    series_col = model.config['input_data'].get('series_column')
+    stats = model.fetch_dataframe(f"""
+    SELECT COUNT(*) AS ROW_COUNT, {f"COUNT(DISTINCT {series_col})" if series_col else "1"} AS SERIES_COUNT,
+           MIN({timestamp_col}) AS START_TS, MAX({timestamp_col}) AS END_TS
+    FROM {output_table}
+    WHERE model_name = '{model.model_name}'
+    """).iloc[0]
+    return {
+        'model_name': model.model_name,
+        'output_table': output_table,
+        'training_table': model.temp_table_name,
+        'rows': int(stats['ROW_COUNT']),
+        'series': int(stats['SERIES_COUNT']),
+        'start': str(stats['START_TS']) if pd.notna(stats['START_TS']) else None,
+        'end': str(stats['END_TS']) if pd.notna(stats['END_TS']) else None,
+        'seconds': time.perf_counter() - start,
+    }
+
+# %% ../nbs/07_procedure.ipynb 7
+PROCEDURE_PACKAGES = ('snowflake-snowpark-python', 'pandas', 'pyyaml', 'altair', 'cryptography')
+
+def procedure_ddl(name: str = SnowflakeMLForecast.PROCEDURE_NAME, imports: Iterable[str] = (),
+                  packages: Iterable[str] = PROCEDURE_PACKAGES, runtime_version: str = '3.11') -> str:
+    imports = ', '.join(f"'{path}'" for path in imports)
+    return f"""CREATE OR REPLACE PROCEDURE {name}(CONFIG VARIANT, MODEL_NAME STRING DEFAULT NULL)
+RETURNS VARIANT
+LANGUAGE PYTHON
+RUNTIME_VERSION = '{runtime_version}'
+PACKAGES = ({', '.join(f"'{package}'" for package in packages)})
+{f"IMPORTS = ({imports})" if imports else ""}
+HANDLER = 'cortex_forecast.procedure.run_forecast_procedure'
+EXECUTE AS CALLER"""
+
+def _package_zip(directory: str) -> str:
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    path = os.path.join(directory, 'cortex_forecast.zip')
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for file_name in sorted(os.listdir(package_dir)):
+            if file_name.endswith('.py'):
+                archive.write(os.path.join(package_dir, file_name), f"cortex_forecast/{file_name}")
+    return path
+
+def deploy_procedure(session, stage: str = 'cortex_forecast_stage', name: str = SnowflakeMLForecast.PROCEDURE_NAME,
+                     upload: bool = True, **ddl_kwargs) -> str:
+    "Create (or replace) the forecast procedure; with `upload=False` the package zip must already be on `stage`."
+    if upload:
+        session.sql(f"CREATE STAGE IF NOT EXISTS {stage}").collect()
+        with tempfile.TemporaryDirectory() as directory:
+            session.file.put(_package_zip(directory), f"@{stage}", auto_compress=False, overwrite=True)
+    session.sql(procedure_ddl(name, imports=[f"@{stage}/cortex_forecast.zip"], **ddl_kwargs)).collect()
+    return name
@@ -0,0 +1,262 @@
+"""Hyperparameter sweeps over the forecast config with early pruning"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/09_sweep.ipynb.
+
+# %% auto 0
+__all__ = ['SWEEP_PATHS', 'SWEEP_METRICS', 'apply_params', 'grid_candidates', 'random_candidates', 'SweepResult', 'ForecastSweep']
+
+# %% ../nbs/09_sweep.ipynb 3
+import math
+import json
+import time
+import random
+import logging
+import itertools
+import pandas as pd
+
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+from .batch import BatchResult, ForecastBatch
+from .forecast import SnowflakeMLForecast
+from .local import LocalForecaster
+
+# %% ../nbs/09_sweep.ipynb 5
+_EVALUATION_PATH = 'forecast_config.config_object.evaluation_config'
+
+SWEEP_PATHS = {
+    'training_days': 'forecast_config.training_days',
+    'forecast_days': 'forecast_config.forecast_days',
+    'n_splits': f'{_EVALUATION_PATH}.n_splits',
+    'gap': f'{_EVALUATION_PATH}.gap',
+    'test_size': f'{_EVALUATION_PATH}.test_size',
+    'max_train_size': f'{_EVALUATION_PATH}.max_train_size',
+    'prediction_interval': f'{_EVALUATION_PATH}.prediction_interval',
+}
+
+SWEEP_METRICS = ('MAE', 'MAPE', 'MSE', 'SMAPE')
+
+
+def _set_path(config: Dict, path: str, value) -> None:
+    node = config
+    *parents, key = SWEEP_PATHS.get(path, path).split('.')
+    for part in parents:
+        if node.get(part) is None:
+            node[part] = {}
+        node = node[part]
+    node[key] = value
+
+
+def apply_params(config: Dict, params: Dict[str, Any]) -> Dict:
+    "Copy of `config` with every `params` value set at its (short or dotted) path."
+    config = deepcopy(config)
+    for path, value in params.items():
+        _set_path(config, path, value)
+    return config
+
+
+def grid_candidates(space: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    "Every combination of the values in `space`."
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_candidates(space: Dict[str, Sequence], n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    "`n` distinct combinations drawn from `space`, or the whole grid when it is no larger."
+    grid = grid_candidates(space)
+    return grid if len(grid) <= n else random.Random(seed).sample(grid, n)
+
+# %% ../nbs/09_sweep.ipynb 8
+@dataclass
+class SweepResult:
+    index: int
+    params: Dict[str, Any]
+    model_name: Optional[str] = None
+    screen_score: Optional[float] = None
+    score: Optional[float] = None
+    rank: Optional[int] = None
+    status: str = 'pending'
+    shared_training_table: bool = False
+    seconds: float = 0.0
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 'done'
+
+
+def _metric_score(metrics: pd.DataFrame, metric: str) -> float:
+    metrics = metrics.rename(columns=str.upper)
+    values = metrics.loc[metrics['ERROR_METRIC'].str.upper() == metric, 'METRIC_VALUE'].astype(float)
+    return float(values.mean()) if len(values) else float('nan')
+
+
+def _score_key(score: Optional[float]):
+    return (score is None or math.isnan(score), score if score is not None else 0.0)
+
+
+class ForecastSweep:
+    LEADERBOARD_TABLE = 'CORTEX_FORECAST_SWEEPS'
+
+    def __init__(self, config: Union[str, Dict], space: Dict[str, Sequence], search: str = 'grid',
+                 n_candidates: Optional[int] = None, seed: int = 0, metric: str = 'SMAPE', screen: Optional[str] = 'local',
+                 screen_method: str = 'seasonal_naive', screen_shards: int = 4, keep: Union[float, int] = 0.5,
+                 max_series: Optional[int] = None, max_workers: int = 4, connection_config=None, session=None,
+                 sweep_name: Optional[str] = None, **forecast_kwargs):
+        if search not in ('grid', 'random'):
+            raise ValueError(f"Unknown search '{search}'; expected 'grid' or 'random'.")
+        if screen not in ('local', 'cortex', None):
+            raise ValueError(f"Unknown screen '{screen}'; expected 'local', 'cortex' or None.")
+        if metric.upper() not in SWEEP_METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Choose from {list(SWEEP_METRICS)}.")
+        self.base = SnowflakeMLForecast(config, connection_config=connection_config, session=session, **forecast_kwargs)
+        if screen == 'cortex' and not self.base.config['input_data'].get('series_column'):
+            raise ValueError("screen='cortex' trains on a hash shard of the series and needs a series_column.")
+        self.session = self.base.session
+        self.candidates = (grid_candidates(space)[:n_candidates] if search == 'grid'
+                           else random_candidates(space, n_candidates or 10, seed))
+        self.metric = metric.upper()
+        self.screen = screen
+        self.screen_method = screen_method
+        self.screen_shards = screen_shards
+        self.keep = keep
+        self.max_series = max_series
+        self.max_workers = max_workers
+        self.sweep_name = sweep_name or self.base.model_name
+        self.forecast_kwargs = forecast_kwargs
+        self.results: List[SweepResult] = []
+
+    def candidate_config(self, params: Dict[str, Any]) -> Dict:
+        config = apply_params(self.base.config, params)
+        # SHOW_EVALUATION_METRICS only has rows for models trained with evaluation on
+        _set_path(config, 'forecast_config.config_object.evaluate', True)
+        return config
+
+    def _candidate_model_name(self, result: SweepResult, screening: bool = False) -> str:
+        return f"{self.sweep_name}_C{result.index:03d}{'_SCREEN' if screening else ''}"
+
+    def _screen_local(self, results: List[SweepResult]):
+        # One read of the widest window; each candidate's own window is cut from it client-side
+        windows = [self.candidate_config(r.params)['forecast_config'].get('training_days') for r in results]
+        reader = SnowflakeMLForecast(apply_params(self.base.config, {'training_days': None if None in windows else max(windows)}),
+                                     connection_config=self.base.connection_config, session=self.session,
+                                     **self.forecast_kwargs)
+        data = reader.fetch_dataframe(reader._local_training_sql(self.max_series))
+        columns = {col.upper(): col for col in data.columns}
+        ts = pd.to_datetime(data[columns[self.base.config['input_data']['timestamp_column'].upper()]])
+        end = ts.max()
+        for result, days in zip(results, windows):
+            start = time.perf_counter()
+            try:
+                window = data[ts >= end - pd.Timedelta(days=days)] if days else data
+                forecaster = LocalForecaster.from_config(self.candidate_config(result.params), method=self.screen_method)
+                result.screen_score = _metric_score(forecaster.backtest(window), self.metric)
+            except Exception as e:
+                logging.error(f"Sweep candidate {result.index} failed its local screen: {e}")
+                result.status, result.error = 'failed', e
+            result.seconds += time.perf_counter() - start
+
+    def _evaluate(self, batch_result: BatchResult, screening: bool) -> float:
+        model = batch_result.model
+        model.create_model()
+        score = _metric_score(model.fetch_dataframe(model._diagnostics_sql()['metrics']), self.metric)
+        if screening:
+            model.run_command(f"DROP SNOWFLAKE.ML.FORECAST IF EXISTS {model.get_fully_qualified_name(model.model_name)}")
+        return score
+
+    def _run_cortex(self, results: List[SweepResult], screening: bool = False):
+        batch = ForecastBatch([self.candidate_config(r.params) for r in results], session=self.session,
+                              connection_config=self.base.connection_config, max_workers=self.max_workers,
+                              **self.forecast_kwargs)
+        for result, model in zip(results, batch.models):
+            model.model_name = model.report.name = self._candidate_model_name(result, screening)
+            if screening:
+                model.shard = (0, self.screen_shards)
+        for result, batch_result in zip(results, batch.run(evaluate=lambda r: self._evaluate(r, screening))):
+            result.seconds += batch_result.timings.get('total', 0.0)
+            result.shared_training_table = batch_result.shared_training_table
+            if batch_result.error is not None:
+                logging.error(f"Sweep candidate {result.index} ({batch_result.model_name}) failed: {batch_result.error}")
+                result.status, result.error = 'failed', batch_result.error
+            elif screening:
+                result.screen_score = batch_result.value
+            else:
+                result.score, result.model_name, result.status = batch_result.value, batch_result.model_name, 'done'
+
+    def _prune(self, results: List[SweepResult]):
+        scored = sorted((r for r in results if r.status == 'pending'), key=lambda r: _score_key(r.screen_score))
+        keep = self.keep if isinstance(self.keep, int) else max(1, math.ceil(len(scored) * self.keep))
+        for result in scored[keep:]:
+            result.status = 'pruned'
+
+    def run(self) -> pd.DataFrame:
+        results = [SweepResult(i, params) for i, params in enumerate(self.candidates)]
+        if self.screen == 'local':
+            self._screen_local(results)
+        elif self.screen == 'cortex':
+            self._run_cortex(results, screening=True)
+        if self.screen:
+            self._prune(results)
+        self._run_cortex([r for r in results if r.status == 'pending'])
+
+        done = sorted((r for r in results if r.ok), key=lambda r: _score_key(r.score))
+        for rank, result in enumerate(done, 1):
+            result.rank = rank
+        self.results = results
+        self.write_leaderboard()
+        return self.leaderboard()
+
+    def best(self) -> SweepResult:
+        ranked = [r for r in self.results if r.rank == 1]
+        if not ranked:
+            raise RuntimeError("No candidate finished; call run() first or check leaderboard() for errors.")
+        return ranked[0]
+
+    def best_model(self) -> SnowflakeMLForecast:
+        "The winning candidate's config, bound to its already trained model."
+        best = self.best()
+        model = SnowflakeMLForecast(self.candidate_config(best.params), connection_config=self.base.connection_config,
+                                    session=self.session, **self.forecast_kwargs)
+        model.model_name = model.report.name = best.model_name
+        return model
+
+    def leaderboard(self) -> pd.DataFrame:
+        names = list(self.candidates[0]) if self.candidates else []
+        df = pd.DataFrame([{
+            'rank': r.rank,
+            'candidate': r.index,
+            **{name: r.params.get(name) for name in names},
+            'model_name': r.model_name,
+            'screen_score': r.screen_score,
+            'score': r.score,
+            'status': r.status,
+            'shared_training_table': r.shared_training_table,
+            'seconds': r.seconds,
+            'error': str(r.error) if r.error else None,
+        } for r in self.results])
+        if df.empty:
+            return df
+        df['rank'] = df['rank'].astype('Int64')
+        order = df['status'].map({'done': 0, 'pruned': 1, 'failed': 2})
+        return (df.assign(_order=order).sort_values(['_order', 'score', 'screen_score', 'candidate'], kind='stable')
+                .drop(columns='_order').reset_index(drop=True))
+
+    def write_leaderboard(self):
+        table = self.base.get_fully_qualified_name(self.LEADERBOARD_TABLE)
+        sql_value = lambda value: 'NULL' if value is None or (isinstance(value, float) and math.isnan(value)) else str(value)
+        quoted = lambda text: 'NULL' if text is None else "'" + str(text)[:1000].replace("'", "''") + "'"
+        rows = [
+            f"({quoted(self.sweep_name)}, {r.index}, {quoted(r.model_name)}, {quoted(json.dumps(r.params, default=str))}, "
+            f"'{self.metric}', {sql_value(r.screen_score)}, {sql_value(r.score)}, {sql_value(r.rank)}, {quoted(r.status)}, "
+            f"{quoted(r.error)}, {r.seconds}, CURRENT_TIMESTAMP())"
+            for r in self.results
+        ]
+        self.base.run_command(f"""
+        CREATE TABLE IF NOT EXISTS {table} (
+            SWEEP_NAME STRING, CANDIDATE INT, MODEL_NAME STRING, PARAMS STRING, ERROR_METRIC STRING,
+            SCREEN_SCORE FLOAT, SCORE FLOAT, RANK INT, STATUS STRING, ERROR STRING, SECONDS FLOAT,
+            CREATED_AT TIMESTAMP_NTZ
+        )""")
+        self.base.run_command(f"DELETE FROM {table} WHERE SWEEP_NAME = '{self.sweep_name}'")
+        if rows:
+            self.base.run_command(f"INSERT INTO {table} VALUES {', '.join(rows)}")
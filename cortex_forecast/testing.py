@@ -0,0 +1,527 @@
+"""Offline stand-ins for Snowpark sessions used by the benchmarks"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_testing.ipynb.
+
+# %% auto 0
+__all__ = ['Response', 'LocalDataFrame', 'LocalAsyncJob', 'LocalQueryHistory', 'LocalSession', 'make_panel', 'make_config',
+           'make_forecast_frame', 'pipeline_session', 'SeasonalNaiveModel', 'DuckDBSession']
+
+# %% ../nbs/02_testing.ipynb 3
+import re
+import json
+import time
+import importlib
+import uuid
+import threading
+import numpy as np
+import pandas as pd
+
+from typing import Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from snowflake.snowpark import Row
+from snowflake.snowpark.query_history import QueryRecord
+
+# %% ../nbs/02_testing.ipynb 5
+Response = Union[pd.DataFrame, Callable[[str, 'LocalSession'], pd.DataFrame]]
+
+class LocalDataFrame:
+    """Lazy result of `LocalSession.sql`, exposing the Snowpark fetch methods used by the package."""
+    def __init__(self, session: 'LocalSession', query: str):
+        self.session = session
+        self.query = query
+
+    def _result(self, query_id: Optional[str] = None) -> pd.DataFrame:
+        return self.session._execute(self.query, query_id)
+
+    def collect(self) -> List[Row]:
+        df = self._result()
+        make_row = Row(*df.columns)
+        return [make_row(*values) for values in df.itertuples(index=False, name=None)]
+
+    def to_pandas(self) -> pd.DataFrame:
+        return self._result().copy()
+
+    def to_pandas_batches(self):
+        df = self._result()
+        batch_size = self.session.batch_size
+        for start in range(0, len(df), batch_size):
+            yield df.iloc[start:start + batch_size].reset_index(drop=True)
+
+    def collect_nowait(self) -> 'LocalAsyncJob':
+        return LocalAsyncJob(self)
+
+
+class LocalAsyncJob:
+    """Mirrors `snowflake.snowpark.AsyncJob`: the statement runs on a background thread."""
+    def __init__(self, df: LocalDataFrame):
+        self.query_id = str(uuid.uuid4())
+        self.query = df.query
+        df.session.jobs[self.query_id] = self
+        self._df = df
+        self._frame = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            self._frame = self._df._result(self.query_id)
+        except Exception as e:
+            self._error = e
+
+    def is_done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def result(self, result_type: str = 'row'):
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if result_type == 'no_result':
+            return None
+        if result_type == 'pandas':
+            return self._frame.copy()
+        if result_type == 'pandas_batches':
+            batch_size = self._df.session.batch_size
+            return (self._frame.iloc[start:start + batch_size].reset_index(drop=True)
+                    for start in range(0, len(self._frame), batch_size))
+        make_row = Row(*self._frame.columns)
+        return [make_row(*values) for values in self._frame.itertuples(index=False, name=None)]
+
+
+class LocalQueryHistory:
+    def __init__(self):
+        self.queries: List[QueryRecord] = []
+
+
+class LocalSession:
+    def __init__(self, responses: Optional[Dict[str, Response]] = None, latency: float = 0.0, batch_size: int = 10_000):
+        self.responses = []
+        self.latency = latency
+        self.batch_size = batch_size
+        self.queries = []
+        self.jobs = {}
+        self._listeners = []
+        for pattern, result in (responses or {}).items():
+            self.add_response(pattern, result)
+
+    def add_response(self, pattern: str, result: Response) -> None:
+        self.responses.append((re.compile(pattern, re.IGNORECASE | re.DOTALL), result))
+
+    def sql(self, query: str) -> LocalDataFrame:
+        self.queries.append(query)
+        return LocalDataFrame(self, query)
+
+    def create_async_job(self, query_id: str) -> 'LocalAsyncJob':
+        return self.jobs[query_id]
+
+    @contextmanager
+    def query_history(self, *args, **kwargs):
+        "Records `QueryRecord`s for statements executed inside the block, like `Session.query_history`."
+        history = LocalQueryHistory()
+        self._listeners.append(history)
+        try:
+            yield history
+        finally:
+            self._listeners.remove(history)
+
+    def _execute(self, query: str, query_id: Optional[str] = None) -> pd.DataFrame:
+        record = QueryRecord(query_id or str(uuid.uuid4()), query)
+        for history in list(self._listeners):
+            history.queries.append(record)
+        if self.latency:
+            time.sleep(self.latency)
+        for pattern, result in self.responses:
+            if pattern.search(query):
+                return result(query, self) if callable(result) else result
+        return self._run(query, record.query_id)
+
+    def _run(self, query: str, query_id: str) -> pd.DataFrame:
+        "Result for statements no response pattern matched."
+        return pd.DataFrame({'status': ['Statement executed successfully.']})
+
+    def close(self) -> None:
+        pass
+
+# %% ../nbs/02_testing.ipynb 6
+def make_panel(n_series: int = 10, n_steps: int = 365, freq: str = 'D', seed: int = 0,
+               timestamp_column: str = 'TS', target_column: str = 'TARGET', series_column: str = 'SERIES') -> pd.DataFrame:
+    """Synthetic multi-series panel with weekly seasonality, sorted by series then timestamp."""
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range('2024-01-01', periods=n_steps, freq=freq)
+    level = rng.uniform(50, 500, size=(n_series, 1))
+    season = 1 + 0.2 * np.sin(2 * np.pi * np.arange(n_steps) / 7)
+    values = level * season + rng.normal(0, 5, size=(n_series, n_steps))
+    return pd.DataFrame({
+        timestamp_column: np.tile(ts.values, n_series),
+        target_column: np.maximum(values, 0).ravel(),
+        series_column: np.repeat([f"S{i:05d}" for i in range(n_series)], n_steps),
+    })
+
+def make_config(table: str = 'PANEL', series_column: Optional[str] = 'SERIES', timestamp_column: str = 'TS',
+                target_column: str = 'TARGET', training_days: Optional[int] = 365, forecast_days: int = 14) -> Dict:
+    """Forecast config in the same shape as the YAML files under `files/yaml`."""
+    return {
+        'model': {'name': 'local_model', 'tags': {}, 'comment': 'Local stand-in run'},
+        'input_data': {
+            'table': table,
+            'timestamp_column': timestamp_column,
+            'target_column': target_column,
+            'series_column': series_column,
+            'exogenous_columns': [],
+        },
+        'forecast_config': {
+            'training_days': training_days,
+            'forecast_days': forecast_days,
+            'config_object': {
+                'on_error': 'skip',
+                'evaluate': True,
+                'evaluation_config': {'n_splits': 2, 'gap': 0, 'prediction_interval': 0.95},
+            },
+        },
+        'output': {'table': f'{table}_FORECAST'},
+    }
+
+# %% ../nbs/02_testing.ipynb 8
+def make_forecast_frame(config: Dict, n_series: int = 10, horizon: Optional[int] = None, seed: int = 0) -> pd.DataFrame:
+    """Rows shaped like the output table written by `SnowflakeMLForecast._generate_forecast_sql`."""
+    horizon = horizon or config['forecast_config'].get('forecast_days') or 14
+    series_col = config['input_data'].get('series_column')
+    rng = np.random.default_rng(seed)
+    n_series = n_series if series_col else 1
+    forecast = rng.uniform(50, 500, size=n_series * horizon)
+    df = pd.DataFrame({
+        config['input_data']['timestamp_column']: np.tile(pd.date_range('2025-01-01', periods=horizon).values, n_series),
+        'FORECAST': forecast,
+        'LOWER_BOUND': forecast * 0.9,
+        'UPPER_BOUND': forecast * 1.1,
+        'MODEL_NAME': config['model']['name'],
+    })
+    if series_col:
+        df.insert(0, series_col, np.repeat([f"S{i:05d}" for i in range(n_series)], horizon))
+    return df
+
+def pipeline_session(config: Dict, n_series: int = 10, latency: float = 0.0, **kwargs) -> LocalSession:
+    """A `LocalSession` that answers every statement issued by `create_and_run_forecast` and
+    `generate_forecast_and_visualization`."""
+    series_col = config['input_data'].get('series_column')
+    n_series = n_series if series_col else 1
+    actuals = make_panel(n_series=n_series, n_steps=21, timestamp_column=config['input_data']['timestamp_column'],
+                         target_column=config['input_data']['target_column'], series_column=series_col or 'SERIES')
+    series = [f'"S{i:05d}"' for i in range(n_series)] if series_col else [None] * n_series
+    metric_names = ['MAE', 'MAPE', 'MSE', 'SMAPE']
+    metrics = pd.DataFrame({
+        'SERIES': np.repeat(series, len(metric_names)),
+        'ERROR_METRIC': metric_names * n_series,
+        'METRIC_VALUE': np.random.default_rng(0).uniform(0, 1, size=n_series * len(metric_names)),
+    })
+    importance = pd.DataFrame({'SERIES': series, 'RANK': 1, 'FEATURE_NAME': 'aggregated_endogenous_trend_features',
+                               'SCORE': 1.0, 'FEATURE_TYPE': 'derived_from_endogenous'})
+    return LocalSession({
+        r'INFORMATION_SCHEMA\.TABLES': pd.DataFrame({'COUNT(*)': [0]}),
+        r'^\s*SELECT MAX\(': pd.DataFrame({'MAX': [pd.Timestamp('2024-12-31')]}),
+        r'^\s*SELECT \*\s+FROM': make_forecast_frame(config, n_series=n_series),
+        rf"ranked_data|^\s*SELECT {config['input_data']['timestamp_column']}, {config['input_data']['target_column']}\s":
+            actuals if series_col else actuals.drop(columns='SERIES'),
+        r'SHOW_EVALUATION_METRICS': metrics if series_col else metrics.drop(columns='SERIES'),
+        r'EXPLAIN_FEATURE_IMPORTANCE': importance if series_col else importance.drop(columns='SERIES'),
+    }, latency=latency, **kwargs)
+
+# %% ../nbs/02_testing.ipynb 11
+_INFORMATION_SCHEMA = re.compile(r'\b\w+\.INFORMATION_SCHEMA\.TABLES\b', re.IGNORECASE)
+_QUALIFIED_NAME = re.compile(r'\b(?!SNOWFLAKE\.ML\.)\w+\.\w+\.(\w+)\b', re.IGNORECASE)
+_CREATE_MODEL = re.compile(r'^\s*CREATE\s+(?:OR\s+REPLACE\s+)?SNOWFLAKE\.ML\.FORECAST\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)\s*\(', re.IGNORECASE)
+_DROP_MODEL = re.compile(r'^\s*DROP\s+SNOWFLAKE\.ML\.FORECAST\s+(?:IF\s+EXISTS\s+)?(\w+)', re.IGNORECASE)
+_SHOW_MODELS = re.compile(r"^\s*SHOW\s+SNOWFLAKE\.ML\.FORECAST(?:\s+LIKE\s+'([^']*)')?(?:\s+IN\s+\w+(?:\s+[\w.]+)?)?\s*;?\s*$",
+                          re.IGNORECASE)
+_CALL_MODEL = re.compile(r'^\s*CALL\s+(\w+)!(SHOW_EVALUATION_METRICS|EXPLAIN_FEATURE_IMPORTANCE)\s*\(', re.IGNORECASE)
+_NO_OP = re.compile(r'^\s*(CREATE\s+(OR\s+REPLACE\s+)?TAG\b|ALTER\s+.*\bSET\s+TAG\b|ALTER\s+SESSION\b|USE\s)', re.IGNORECASE | re.DOTALL)
+_FORECAST_CALL = re.compile(r'TABLE\s*\(\s*(\w+)!FORECAST\s*\(', re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"('(?:[^']|'')*')")
+_INPUT_DATA = re.compile(r"INPUT_DATA\s*=>\s*SYSTEM\$(?:REFERENCE\(\s*'\w+'\s*,\s*'([\w.]+)'|QUERY_REFERENCE\(\s*'((?:[^']|'')*)')",
+                         re.IGNORECASE)
+_SCRIPT = re.compile(r'^\s*EXECUTE\s+IMMEDIATE\s+\$\$\s*BEGIN\b(.*)\bEND\s*;?\s*\$\$\s*$', re.IGNORECASE | re.DOTALL)
+_LET_RESULTSET = re.compile(r'^\s*LET\s+(\w+)\s+RESULTSET\s*:=\s*\((.*)\)\s*$', re.IGNORECASE | re.DOTALL)
+_RETURN = re.compile(r'^\s*RETURN\s+(?:TABLE\s*\(\s*(\w+)\s*\)|(.*))$', re.IGNORECASE | re.DOTALL)
+_CREATE_PROCEDURE = re.compile(r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?PROCEDURE\s+([\w.]+)\s*\(.*\bHANDLER\s*=\s*'([\w.]+)'",
+                               re.IGNORECASE | re.DOTALL)
+_CALL_PROCEDURE = re.compile(r'^\s*CALL\s+([\w.]+)\s*\((.*)\)\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+_PARSE_JSON = re.compile(r'PARSE_JSON\(\s*\$\$(.*?)\$\$\s*\)', re.DOTALL)
+_RESULT_SCAN = re.compile(r"TABLE\s*\(\s*RESULT_SCAN\s*\(\s*(?:'([^']+)'|LAST_QUERY_ID\(\))\s*\)\s*\)", re.IGNORECASE)
+
+
+def _named_arg(text: str, name: str) -> Optional[str]:
+    match = re.search(rf"\b{name}\s*=>\s*(?:'([^']*)'|([\w.]+))", text, re.IGNORECASE)
+    return None if match is None else match.group(1) if match.group(1) is not None else match.group(2)
+
+
+def _split_statements(script: str) -> List[str]:
+    "Split a script on the semicolons that are outside quoted strings."
+    statements, start, quoted = [], 0, False
+    for i, char in enumerate(script):
+        if char == "'":
+            quoted = not quoted
+        elif char == ';' and not quoted:
+            statements.append(script[start:i])
+            start = i + 1
+    statements.append(script[start:])
+    return [statement for statement in statements if statement.strip()]
+
+
+def _closing_paren(text: str, start: int) -> int:
+    "Index just past the parenthesis that closes the one opened before `start`, skipping quoted strings."
+    depth, quoted = 1, False
+    for i in range(start, len(text)):
+        char = text[i]
+        if char == "'":
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    raise ValueError("Unbalanced parentheses in statement")
+
+
+class SeasonalNaiveModel:
+    """Stand-in for a trained `SNOWFLAKE.ML.FORECAST` model: repeats each series' last season."""
+    def __init__(self, data: pd.DataFrame, timestamp_column: str, target_column: str,
+                 series_column: Optional[str] = None, season: int = 7):
+        columns = {col.upper(): col for col in data.columns}
+        self.ts, self.target = columns[timestamp_column.upper()], columns[target_column.upper()]
+        self.series = columns[series_column.upper()] if series_column else None
+        self.season = season
+        self.comment = None
+        self.created_on = pd.Timestamp.now(tz='UTC')
+        keys = [self.series] if self.series else []
+        self.data = data.sort_values(keys + [self.ts], kind='stable', ignore_index=True)
+        self.feature_names = [col for col in data.columns if col not in (self.ts, self.target, self.series)]
+
+    def _groups(self, df: pd.DataFrame):
+        return df.groupby(self.series, sort=False) if self.series else df.groupby(np.zeros(len(df), dtype=int), sort=False)
+
+    def forecast(self, periods: int, prediction_interval: float = 0.95) -> pd.DataFrame:
+        from statistics import NormalDist
+        data, groups = self.data, self._groups(self.data)
+        tail = groups.tail(self.season)
+        position = self._groups(tail).cumcount()
+        keys = tail[self.series] if self.series else np.zeros(len(tail), dtype=int)
+        last_season = pd.DataFrame({'key': keys, 'pos': position.to_numpy(), 'y': tail[self.target].to_numpy()}) \
+            .pivot(index='key', columns='pos', values='y').ffill(axis=1).to_numpy()
+        n_obs = groups.size().to_numpy()
+        # Align so that step h repeats the value one season earlier, also for series shorter than a season
+        width = np.minimum(n_obs, self.season)
+        steps = np.arange(periods)
+        values = last_season[np.arange(len(width))[:, None], steps[None, :] % width[:, None]]
+
+        spread = self._groups(data)[self.target].diff(self.season)
+        sigma = spread.groupby(data[self.series] if self.series else np.zeros(len(data), dtype=int), sort=False).std()
+        sigma = np.nan_to_num(sigma.reindex(groups.size().index).to_numpy())
+        z = NormalDist().inv_cdf((1 + prediction_interval) / 2)
+        width_band = z * sigma[:, None] * np.sqrt(1 + steps[None, :] // self.season)
+
+        last_ts = groups[self.ts].max().to_numpy()
+        freq = groups[self.ts].apply(lambda ts: ts.diff().median()).fillna(pd.Timedelta(days=1)).to_numpy()
+        timestamps = last_ts[:, None] + freq[:, None] * (steps[None, :] + 1)
+        out = pd.DataFrame({
+            'TS': pd.to_datetime(timestamps.ravel()),
+            'FORECAST': values.ravel(),
+            'LOWER_BOUND': (values - width_band).ravel(),
+            'UPPER_BOUND': (values + width_band).ravel(),
+        })
+        if self.series:
+            out.insert(0, 'SERIES', np.repeat(groups.size().index.to_numpy(), periods))
+        return out
+
+    def evaluation_metrics(self) -> pd.DataFrame:
+        data = self.data
+        actual = data[self.target]
+        predicted = self._groups(data)[self.target].shift(self.season)
+        errors = pd.DataFrame({
+            'MAE': (actual - predicted).abs(),
+            'MAPE': ((actual - predicted) / actual.where(actual != 0)).abs(),
+            'MSE': (actual - predicted) ** 2,
+            'SMAPE': 2 * (actual - predicted).abs() / (actual.abs() + predicted.abs()).where(lambda d: d != 0),
+        })
+        keys = data[self.series] if self.series else np.zeros(len(data), dtype=int)
+        grouped = errors.groupby(keys, sort=False)
+        metrics = grouped.mean().stack().rename('METRIC_VALUE').to_frame()
+        metrics['STANDARD_DEVIATION'] = grouped.std().stack()
+        metrics = metrics.rename_axis(['SERIES', 'ERROR_METRIC']).reset_index()
+        metrics['LOGS'] = None
+        if self.series:
+            # SERIES is a VARIANT in Snowflake and comes back JSON-quoted
+            metrics['SERIES'] = '"' + metrics['SERIES'].astype(str) + '"'
+            return metrics
+        return metrics.drop(columns='SERIES')
+
+    def feature_importance(self) -> pd.DataFrame:
+        names = ['aggregated_endogenous_trend_features'] + self.feature_names
+        rows = pd.DataFrame({'RANK': np.arange(1, len(names) + 1), 'FEATURE_NAME': names,
+                             'SCORE': [1.0] + [0.0] * len(self.feature_names),
+                             'FEATURE_TYPE': ['derived_from_endogenous'] + ['user_provided'] * len(self.feature_names)})
+        if not self.series:
+            return rows
+        series = self.data[self.series].drop_duplicates().astype(str)
+        return rows.merge(pd.DataFrame({'SERIES': '"' + series + '"'}), how='cross')[['SERIES'] + list(rows.columns)]
+
+
+class DuckDBSession(LocalSession):
+    """`LocalSession` that runs the generated SQL on an in-memory DuckDB database."""
+    def __init__(self, tables: Optional[Dict[str, pd.DataFrame]] = None, responses: Optional[Dict[str, Response]] = None,
+                 latency: float = 0.0, batch_size: int = 10_000, season: int = 7, max_results: int = 64,
+                 database: str = 'LOCAL', schema: str = 'PUBLIC'):
+        import duckdb
+        super().__init__(responses, latency=latency, batch_size=batch_size)
+        self.con = duckdb.connect()
+        self.con.execute("CREATE MACRO TO_TIMESTAMP_NTZ(x) AS CAST(x AS TIMESTAMP)")
+        self.con.execute("CREATE MACRO DATEADD(part, n, x) AS x + CAST(n || ' ' || part AS INTERVAL)")
+        self.con.execute("CREATE MACRO RLIKE(s, pattern) AS regexp_full_match(s, pattern)")
+        self.models: Dict[str, SeasonalNaiveModel] = {}
+        self.procedures: Dict[str, Callable] = {}
+        self.database, self.schema = database, schema
+        self.season = season
+        self.max_results = max_results
+        self._results: Dict[str, pd.DataFrame] = {}
+        self._last_query_id = None
+        self._lock = threading.Lock()
+        for name, df in (tables or {}).items():
+            self.create_table(name, df)
+
+    def get_current_database(self) -> str:
+        return self.database
+
+    def get_current_schema(self) -> str:
+        return self.schema
+
+    def get_current_warehouse(self) -> Optional[str]:
+        return None
+
+    def create_table(self, name: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            self.con.register('_df', df)
+            self.con.execute(f"CREATE OR REPLACE TABLE {name} AS SELECT * FROM _df")
+            self.con.unregister('_df')
+
+    def translate(self, query: str) -> str:
+        "Rewrite a generated Snowflake statement into DuckDB SQL (model calls are handled separately)."
+        query = _INFORMATION_SCHEMA.sub('information_schema.tables', query)
+        query = re.sub(r"\bTABLE_SCHEMA\s*=\s*'[^']*'", 'TRUE', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bTABLE_NAME\s*=', 'upper(TABLE_NAME) =', query, flags=re.IGNORECASE)
+        # Qualifiers are dropped outside string literals only, so stored names such as watermark rows keep theirs
+        query = ''.join(part if i % 2 else _QUALIFIED_NAME.sub(r'\1', part)
+                        for i, part in enumerate(_STRING_LITERAL.split(query)))
+        query = re.sub(r'\bTIMESTAMP_NTZ\(9\)', 'TIMESTAMP_NS', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bTIMESTAMP_NTZ\b', 'TIMESTAMP', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bTIMESTAMP_TZ(\(\d\))?', 'TIMESTAMPTZ', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bTIMESTAMP_LTZ\b', 'TIMESTAMPTZ', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bCURRENT_TIMESTAMP\(\)', 'CURRENT_TIMESTAMP', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bCLUSTER\s+BY\s*\([^)]*\)', '', query, flags=re.IGNORECASE)
+        query = re.sub(r'\bDATEADD\(\s*(\w+)\s*,', r"DATEADD('\1',", query, flags=re.IGNORECASE)
+        return query
+
+    def _register(self, df: pd.DataFrame) -> str:
+        name = f"_frame_{uuid.uuid4().hex[:12]}"
+        self.con.register(name, df)
+        return name
+
+    def _expand_table_functions(self, query: str) -> str:
+        while (match := _FORECAST_CALL.search(query)):
+            end = _closing_paren(query, match.end())
+            end = _closing_paren(query, end)
+            args = query[match.end():end]
+            model = self.models[match.group(1).upper()]
+            periods = _named_arg(args, 'FORECASTING_PERIODS')
+            interval = re.search(r"'prediction_interval'\s*:\s*([\d.]+)", args)
+            series = _named_arg(args, 'SERIES_COLNAME')
+            if (source := _INPUT_DATA.search(args)):
+                # Future exogenous rows: one step per row, and like Cortex every series must have been trained on
+                source_sql = self.translate(source.group(2).replace("''", "'") if source.group(2) is not None
+                                            else f"SELECT * FROM {source.group(1)}")
+                future = self.con.execute(source_sql).df().rename(columns=str.upper)
+                if series:
+                    unknown = set(future[series.upper()].astype(str)) - set(model.data[model.series].astype(str))
+                    if unknown:
+                        raise ValueError(f"INPUT_DATA has {len(unknown)} series the model was not trained on, e.g. {sorted(unknown)[0]}")
+                periods = future.groupby(series.upper()).size().max() if series else len(future)
+            frame = model.forecast(int(periods) if periods else 14, float(interval.group(1)) if interval else 0.95)
+            if source and series:
+                frame = frame[frame.iloc[:, 0].astype(str).isin(set(future[series.upper()].astype(str)))]
+            query = query[:match.start()] + self._register(frame) + query[end:]
+        return _RESULT_SCAN.sub(lambda m: self._register(self._results[m.group(1) or self._last_query_id]), query)
+
+    def _run_script(self, body: str, query_id: str) -> pd.DataFrame:
+        # Just enough Snowflake Scripting for compiled plans: plain statements, `LET ... RESULTSET` and `RETURN`
+        result_sets = {}
+        for i, statement in enumerate(_split_statements(body)):
+            if (match := _LET_RESULTSET.match(statement)):
+                result_sets[match.group(1).upper()] = self._run(match.group(2), f"{query_id}-{i}")
+            elif (match := _RETURN.match(statement)):
+                if match.group(1):
+                    return result_sets[match.group(1).upper()]
+                return pd.DataFrame({'ANONYMOUS BLOCK': [match.group(2).strip().strip("'")]})
+            else:
+                self._run(statement, f"{query_id}-{i}")
+        return pd.DataFrame({'ANONYMOUS BLOCK': [None]})
+
+    def _call_procedure(self, name: str, args: str) -> pd.DataFrame:
+        # Python handlers are called with this session, a VARIANT from `PARSE_JSON($$...$$)` and string literals
+        values = []
+        for match in re.finditer(r"PARSE_JSON\(\s*\$\$.*?\$\$\s*\)|'([^']*)'|\bNULL\b", args, re.IGNORECASE | re.DOTALL):
+            parsed = _PARSE_JSON.match(match.group(0))
+            values.append(json.loads(parsed.group(1)) if parsed else match.group(1))
+        result = self.procedures[name](self, *values)
+        return pd.DataFrame({name: [json.dumps(result, default=str)]})
+
+    def _run(self, query: str, query_id: str) -> pd.DataFrame:
+        if (script := _SCRIPT.match(query)):
+            return self._run_script(script.group(1), query_id)
+        if (match := _CREATE_PROCEDURE.match(query)):
+            module, handler = match.group(2).rsplit('.', 1)
+            name = match.group(1).split('.')[-1].upper()
+            self.procedures[name] = getattr(importlib.import_module(module), handler)
+            return pd.DataFrame({'status': [f"Function {name} successfully created."]})
+        if (match := _CALL_PROCEDURE.match(query)) and match.group(1).split('.')[-1].upper() in self.procedures:
+            return self._call_procedure(match.group(1).split('.')[-1].upper(), match.group(2))
+        query = self.translate(query)
+        with self._lock:
+            if _NO_OP.match(query):
+                result = pd.DataFrame({'status': ['Statement executed successfully.']})
+            elif (match := _CREATE_MODEL.match(query)):
+                args = query[match.end():]
+                table = re.search(r"SYSTEM\$REFERENCE\(\s*'\w+'\s*,\s*'([\w.]+)'", args, re.IGNORECASE).group(1).split('.')[-1]
+                self.models[match.group(1).upper()] = SeasonalNaiveModel(
+                    self.con.execute(f"SELECT * FROM {table}").df(), _named_arg(args, 'TIMESTAMP_COLNAME'),
+                    _named_arg(args, 'TARGET_COLNAME'), _named_arg(args, 'SERIES_COLNAME'), season=self.season)
+                comment = re.search(r"\bCOMMENT\s*=\s*'((?:[^']|'')*)'", args, re.IGNORECASE)
+                self.models[match.group(1).upper()].comment = comment.group(1).replace("''", "'") if comment else None
+                result = pd.DataFrame({'status': [f"Instance {match.group(1)} successfully created."]})
+            elif (match := _DROP_MODEL.match(query)):
+                self.models.pop(match.group(1).upper(), None)
+                result = pd.DataFrame({'status': [f"{match.group(1)} successfully dropped."]})
+            elif (match := _SHOW_MODELS.match(query)):
+                # Same columns as Snowflake's SHOW output, which come back lower case
+                like = re.compile(re.escape(match.group(1) or '%').replace('%', '.*').replace('_', '.') + '$', re.IGNORECASE)
+                result = pd.DataFrame([
+                    {'created_on': model.created_on, 'name': name, 'database_name': self.database, 'schema_name': self.schema,
+                     'current_version': None, 'comment': model.comment, 'owner': None}
+                    for name, model in self.models.items() if like.match(name)
+                ], columns=['created_on', 'name', 'database_name', 'schema_name', 'current_version', 'comment', 'owner'])
+            elif (match := _CALL_MODEL.match(query)):
+                model = self.models[match.group(1).upper()]
+                result = (model.evaluation_metrics() if match.group(2).upper() == 'SHOW_EVALUATION_METRICS'
+                          else model.feature_importance())
+            else:
+                cursor = self.con.execute(self._expand_table_functions(query))
+                result = (cursor.df() if cursor.description is not None
+                          else pd.DataFrame({'status': ['Statement executed successfully.']}))
+                # Unquoted identifiers resolve to upper case in Snowflake
+                result.columns = [str(col).upper() for col in result.columns]
+            self._results[query_id] = result
+            self._last_query_id = query_id
+            while len(self._results) > self.max_results:
+                self._results.pop(next(iter(self._results)))
+        return result
+
+    def close(self) -> None:
+        self.con.close()
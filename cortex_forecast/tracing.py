@@ -0,0 +1,218 @@
+"""Per-statement spans and run reports for forecast pipelines"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_tracing.ipynb.
+
+# %% auto 0
+__all__ = ['Span', 'RunReport', 'traced_step']
+
+# %% ../nbs/06_tracing.ipynb 3
+import json
+import time
+import functools
+import uuid
+import logging
+import threading
+import pandas as pd
+
+from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Union, IO
+
+# %% ../nbs/06_tracing.ipynb 5
+@dataclass
+class Span:
+    kind: str
+    step: Optional[str] = None
+    sql: Optional[str] = None
+    query_id: Optional[str] = None
+    rows: Optional[int] = None
+    warehouse: Optional[str] = None
+    status: str = 'ok'
+    error: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    end: Optional[float] = None
+    seconds: Optional[float] = None
+    attributes: Dict = field(default_factory=dict)
+    span_id: str = field(default_factory=lambda: uuid.uuid4().hex[:16])
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def finish(self, rows: Optional[int] = None, error: Optional[BaseException] = None) -> 'Span':
+        self.end = time.time()
+        self.seconds = time.perf_counter() - self._started
+        if rows is not None:
+            self.rows = rows
+        if error is not None:
+            self.status, self.error = 'error', f"{type(error).__name__}: {error}"
+        return self
+
+    def to_dict(self) -> Dict:
+        return {key: value for key, value in asdict(self).items() if not key.startswith('_')}
+
+# %% ../nbs/06_tracing.ipynb 7
+def _matching_query_id(history, sql: str) -> Optional[str]:
+    # Sessions can be shared between threads, so prefer the record for this exact statement
+    records = getattr(history, 'queries', None) or []
+    for record in reversed(records):
+        if record.sql_text == sql:
+            return record.query_id
+    return records[-1].query_id if records else None
+
+
+class RunReport:
+    """Spans recorded for one forecast run, with per-step summaries and optional JSON lines/OpenTelemetry export."""
+    def __init__(self, name: Optional[str] = None, warehouse: Optional[str] = None,
+                 json_lines: Optional[Union[str, IO]] = None, opentelemetry: bool = False):
+        self.name = name
+        self.run_id = uuid.uuid4().hex
+        self.warehouse = warehouse
+        self.json_lines = json_lines
+        self.opentelemetry = opentelemetry
+        self.spans: List[Span] = []
+        self.current_step: Optional[str] = None
+        self._pending: Dict[str, Span] = {}
+        self._lock = threading.Lock()
+
+    def start(self, kind: str, sql: Optional[str] = None, query_id: Optional[str] = None) -> Span:
+        span = Span(kind, step=self.current_step, sql=sql, query_id=query_id, warehouse=self.warehouse)
+        if query_id is not None:
+            with self._lock:
+                self._pending[query_id] = span
+        return span
+
+    def finish(self, span: Span, rows: Optional[int] = None, error: Optional[BaseException] = None) -> Span:
+        span.finish(rows, error)
+        with self._lock:
+            if span.query_id is not None:
+                self._pending.pop(span.query_id, None)
+            self.spans.append(span)
+        self._emit(span)
+        return span
+
+    def finish_query(self, query_id: str, rows: Optional[int] = None, error: Optional[BaseException] = None) -> Optional[Span]:
+        "Close the span opened for an async statement; a no-op if it was already closed."
+        with self._lock:
+            span = self._pending.get(query_id)
+        return self.finish(span, rows, error) if span is not None else None
+
+    @contextmanager
+    def span(self, kind: str, sql: Optional[str] = None, session=None):
+        "Time the block as one statement, picking up its query ID from `session.query_history()` when available."
+        span = self.start(kind, sql)
+        history = session.query_history() if session is not None and hasattr(session, 'query_history') else nullcontext()
+        error = None
+        with history as records:
+            try:
+                yield span
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                span.query_id = span.query_id or _matching_query_id(records, sql)
+                self.finish(span, error=error)
+
+    @contextmanager
+    def step(self, name: str):
+        "Attribute the statements in the block to pipeline step `name` and time the step as a whole."
+        previous, self.current_step = self.current_step, name
+        span = self.start('step')
+        try:
+            yield span
+        except BaseException as e:
+            self.finish(span, error=e)
+            raise
+        else:
+            self.finish(span)
+        finally:
+            self.current_step = previous
+
+    def _emit(self, span: Span) -> None:
+        if self.json_lines is not None:
+            line = json.dumps({'run_id': self.run_id, 'name': self.name, **span.to_dict()}, default=str)
+            with self._lock:
+                if isinstance(self.json_lines, str):
+                    with open(self.json_lines, 'a') as f:
+                        f.write(line + '\n')
+                else:
+                    self.json_lines.write(line + '\n')
+        if self.opentelemetry:
+            self._emit_opentelemetry(span)
+
+    def _emit_opentelemetry(self, span: Span) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            logging.warning("opentelemetry is not installed; disabling OpenTelemetry export for this report")
+            self.opentelemetry = False
+            return
+        attributes = {'cortex_forecast.run_id': self.run_id, 'cortex_forecast.kind': span.kind}
+        for key, value in (('cortex_forecast.model', self.name), ('cortex_forecast.step', span.step),
+                           ('db.system', 'snowflake'), ('db.statement', span.sql), ('snowflake.query_id', span.query_id),
+                           ('snowflake.warehouse', span.warehouse), ('db.response.returned_rows', span.rows)):
+            if value is not None:
+                attributes[key] = value
+        otel_span = trace.get_tracer('cortex_forecast').start_span(
+            f"{span.step or self.name}.{span.kind}", start_time=int(span.start * 1e9), attributes=attributes)
+        if span.status == 'error':
+            otel_span.set_status(trace.Status(trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int(span.end * 1e9))
+
+    def to_dataframe(self) -> pd.DataFrame:
+        columns = ['step', 'kind', 'query_id', 'seconds', 'rows', 'warehouse', 'status', 'error', 'sql', 'start', 'end']
+        rows = [span.to_dict() for span in self.spans]
+        df = pd.DataFrame(rows, columns=columns + sorted({key for row in rows for key in row['attributes']}))
+        for i, row in enumerate(rows):
+            for key, value in row['attributes'].items():
+                df.at[i, key] = value
+        return df
+
+    def summary(self) -> pd.DataFrame:
+        "Wall time per step next to the number, time and rows of the statements it ran."
+        df = self.to_dataframe()
+        if df.empty:
+            return pd.DataFrame(columns=['seconds', 'statements', 'statement_seconds', 'rows'])
+        df['step'] = df['step'].fillna('(no step)')
+        steps = df[df['kind'] == 'step'].groupby('step', sort=False)['seconds'].sum()
+        statements = df[df['kind'] != 'step'].groupby('step', sort=False).agg(
+            statements=('kind', 'size'), statement_seconds=('seconds', 'sum'), rows=('rows', 'sum'))
+        summary = statements.join(steps, how='outer') if len(steps) else statements.assign(seconds=statements['statement_seconds'])
+        summary['seconds'] = summary['seconds'].fillna(summary['statement_seconds'])
+        summary['statements'] = summary['statements'].fillna(0).astype(int)
+        order = list(dict.fromkeys(df['step']))
+        return summary.reindex(order)[['seconds', 'statements', 'statement_seconds', 'rows']]
+
+    def enrich(self, session) -> pd.DataFrame:
+        """Add bytes scanned, rows produced, warehouse and cloud services credits from the session's query history.
+
+        Costs one `QUERY_HISTORY_BY_SESSION` query; returns the enriched `to_dataframe()`.
+        """
+        query_ids = [span.query_id for span in self.spans if span.query_id]
+        if query_ids:
+            history = session.sql(f"""
+            SELECT QUERY_ID, WAREHOUSE_NAME, BYTES_SCANNED, ROWS_PRODUCED, TOTAL_ELAPSED_TIME,
+                   CREDITS_USED_CLOUD_SERVICES
+            FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 10000))
+            WHERE QUERY_ID IN ({', '.join(f"'{query_id}'" for query_id in query_ids)})
+            """).to_pandas()
+            by_id = {row.pop('QUERY_ID'): row for row in history.rename(columns=str.upper).to_dict('records')}
+            for span in self.spans:
+                row = by_id.get(span.query_id)
+                if row:
+                    span.warehouse = row.pop('WAREHOUSE_NAME', None) or span.warehouse
+                    span.attributes.update({key.lower(): value for key, value in row.items()})
+        return self.to_dataframe()
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __repr__(self):
+        return f"RunReport({self.name!r}, spans={len(self.spans)})"
+
+# %% ../nbs/06_tracing.ipynb 11
+def traced_step(name: str):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.report.step(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
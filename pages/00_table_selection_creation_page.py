@@ -63,42 +63,43 @@ def on_table_view_select():
         st.session_state.preview = None  # Reset preview for the new table/view
 
 def load_example_data():
-    conn = st.session_state.snowpark_connection.get_session()
+    connection = st.session_state.snowpark_connection
+    conn = connection.get_session()
     
     try:
         # Create file format
-        conn.sql("""
+        connection.run_sql("""
         CREATE OR REPLACE FILE FORMAT csv_ff
             type = 'csv'
             SKIP_HEADER = 1,
             COMPRESSION = AUTO;
-        """).collect()
+        """)
 
         # Create stage
-        conn.sql("""
+        connection.run_sql("""
         CREATE OR REPLACE STAGE s3load 
             COMMENT = 'Quickstart S3 Stage Connection'
             url = 's3://sfquickstarts/frostbyte_tastybytes/mlpf_quickstart/'
             file_format = csv_ff;
-        """).collect()
+        """)
 
         # Create table
-        conn.sql("""
+        connection.run_sql("""
         CREATE OR REPLACE TABLE tasty_byte_sales(
             DATE DATE,
             PRIMARY_CITY VARCHAR(16777216),
             MENU_ITEM_NAME VARCHAR(16777216),
             TOTAL_SOLD NUMBER(17,0)
         );
-        """).collect()
+        """)
 
         # Load data
-        conn.sql("""
+        connection.run_sql("""
         COPY INTO tasty_byte_sales FROM @s3load/ml_functions_quickstart.csv;
-        """).collect()
+        """)
 
         # Create view for lobster sales
-        conn.sql("""
+        connection.run_sql("""
         CREATE OR REPLACE VIEW lobster_sales AS (
             SELECT
                 to_timestamp_ntz(date) as timestamp,
@@ -108,7 +109,7 @@ def load_example_data():
             WHERE
                 menu_item_name LIKE 'Lobster Mac & Cheese'
         );
-        """).collect()
+        """)
 
         # Set session state variables
         st.session_state.selected_database = conn.get_current_database()
@@ -120,7 +121,7 @@ def load_example_data():
         st.session_state.exogenous_columns = []
         
         # Load preview data
-        st.session_state.preview = conn.sql("SELECT * FROM LOBSTER_SALES LIMIT 5").to_pandas()
+        st.session_state.preview = connection.cached_sql("SELECT * FROM LOBSTER_SALES LIMIT 5")
         
         st.session_state.selection_step = 4
         st.session_state.example_data_loaded = True  # Set the flag for example data
@@ -138,7 +139,7 @@ display_state_sidebar()
 if 'snowpark_connection' not in st.session_state or st.session_state.snowpark_connection is None:
     st.error("No Snowpark connection available. Please return to the Home page to establish a connection.")
 else:
-    conn = st.session_state.snowpark_connection.get_session()
+    connection = st.session_state.snowpark_connection
 
     # Initialize step if it doesn't exist
     if 'selection_step' not in st.session_state:
@@ -153,8 +154,7 @@ else:
             if os.path.isfile("/snowflake/session/token"):
                 st.session_state.databases = pd.DataFrame([os.getenv('SNOWFLAKE_DATABASE')], columns=['name'])
             else:
-                databases_result = conn.sql("SHOW DATABASES").collect()
-                st.session_state.databases = pd.DataFrame(databases_result, columns=['created_on', 'name', 'is_default', 'is_current', 'origin', 'owner', 'comment', 'options', 'retention_time', 'kind', 'budget', 'owner_role_type'])
+                st.session_state.databases = connection.cached_sql("SHOW DATABASES")
 
         # Step 1: Database selection
         st.subheader("Step 1: Select a database")
@@ -165,8 +165,8 @@ else:
         if st.session_state.selection_step >= 2:
             st.subheader("Step 2: Select a schema")
             if 'schemas' not in st.session_state or st.session_state.schemas is None:
-                schemas_result = conn.sql(f"SHOW SCHEMAS IN DATABASE {st.session_state.selected_database}").collect()
-                st.session_state.schemas = [""] + [row['name'] for row in schemas_result]
+                schemas_result = connection.cached_sql(f"SHOW SCHEMAS IN DATABASE {st.session_state.selected_database}")
+                st.session_state.schemas = [""] + schemas_result['name'].tolist()
             
             st.selectbox("Choose a schema", st.session_state.schemas, key="schema_select", on_change=on_schema_select)
 
@@ -174,9 +174,9 @@ else:
         if st.session_state.selection_step >= 3:
             st.subheader("Step 3: Select a table or view")
             if 'tables_views' not in st.session_state or st.session_state.tables_views is None:
-                tables_result = conn.sql(f"SHOW TABLES IN {st.session_state.selected_database}.{st.session_state.selected_schema}").collect()
-                views_result = conn.sql(f"SHOW VIEWS IN {st.session_state.selected_database}.{st.session_state.selected_schema}").collect()
-                st.session_state.tables_views = [""] + [row['name'] for row in tables_result] + [row['name'] for row in views_result]
+                tables_result = connection.cached_sql(f"SHOW TABLES IN {st.session_state.selected_database}.{st.session_state.selected_schema}")
+                views_result = connection.cached_sql(f"SHOW VIEWS IN {st.session_state.selected_database}.{st.session_state.selected_schema}")
+                st.session_state.tables_views = [""] + tables_result['name'].tolist() + views_result['name'].tolist()
             
             st.selectbox("Choose a table or view", st.session_state.tables_views, key="table_view_select", on_change=on_table_view_select)
 
@@ -185,7 +185,7 @@ else:
             st.subheader("Step 4: Preview and Column Selection")
             if 'preview' not in st.session_state or st.session_state.preview is None:
                 fully_qualified_name = ensure_fully_qualified_name(st.session_state.selected_database, st.session_state.selected_schema, st.session_state.selected_table_view)
-                st.session_state.preview = conn.table(fully_qualified_name).limit(5).to_pandas()
+                st.session_state.preview = connection.cached_table_preview(fully_qualified_name)
             
             st.write("Table/View preview:")
             st.dataframe(st.session_state.preview)
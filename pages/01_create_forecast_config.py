@@ -1,6 +1,8 @@
 import streamlit as st
 import yaml
+from cortex_forecast.connection import get_session_pool
 from cortex_forecast.forecast import SnowflakeMLForecast
+from cortex_forecast.local import BASELINES
 
 def display_state_sidebar():
     st.sidebar.title("Current Selections")
@@ -87,6 +89,13 @@ else:
         if st.session_state.config_step >= 2:
             config['model']['comment'] = st.text_area("Model Comment", value=st.session_state.get('model_comment', 'Forecast model for predicting trends.'), key="model_comment_input")
             st.session_state.model_comment = config['model']['comment']
+            if st.checkbox("Reuse the trained model while config and data are unchanged", value=st.session_state.get('model_reuse', False), key="model_reuse_input"):
+                config['model']['reuse'] = {'data_version': 'stats'}
+                keep_models = st.number_input("Models to keep per config (0 keeps all)", value=st.session_state.get('keep_models', 0), min_value=0, key="keep_models_input")
+                if keep_models:
+                    config['model']['reuse']['keep_models'] = keep_models
+                st.session_state.keep_models = keep_models
+            st.session_state.model_reuse = 'reuse' in config['model']
 
             if st.session_state.config_step == 2 and st.button("Next", key="next_step_2"):
                 st.session_state.config_step = 3
@@ -167,4 +176,22 @@ else:
 
     forecast_config = create_forecast_config()
 
-    st.sidebar.write(f"Current Step: {st.session_state.config_step + 1}/6")
\ No newline at end of file
+    st.sidebar.write(f"Current Step: {st.session_state.config_step + 1}/6")
+
+    if 'forecast_config' in st.session_state:
+        st.subheader("Quick Preview")
+        st.caption("Fits a simple baseline in the app on a sample of series, without building a Cortex model.")
+        method = st.selectbox("Baseline", list(BASELINES), key="preview_method_select")
+        max_series = st.number_input("Series to preview", value=10, min_value=1, key="preview_series_input")
+        if st.button("Preview Forecast", key="preview_button"):
+            with SnowflakeMLForecast(
+                config=st.session_state.forecast_config,
+                connection_config=st.session_state.connection_config,
+                is_streamlit=True,
+                pool=get_session_pool()
+            ) as preview_model:
+                preview = preview_model.local_forecast(method=method, max_series=max_series)
+            config_input = st.session_state.forecast_config['input_data']
+            series_col = config_input.get('series_column')
+            st.line_chart(preview, x=config_input['timestamp_column'], y='FORECAST', color=series_col or None)
+            st.dataframe(preview)
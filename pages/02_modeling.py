@@ -1,6 +1,7 @@
 import streamlit as st
 import yaml
-from cortex_forecast.forecast import SnowflakeMLForecast
+from cortex_forecast.connection import get_session_pool
+from cortex_forecast.forecast import SnowflakeMLForecast, LazyCharts
 
 def display_state_sidebar():
     st.sidebar.title("Current Selections")
@@ -43,7 +44,8 @@ else:
     with st.expander("View Current Forecast Configuration", expanded=False):
         st.json(st.session_state.forecast_config)
 
-    if st.button("Execute Forecast Model"):
+    executed = st.button("Execute Forecast Model")
+    if executed:
         try:
             # Get the fully qualified name for the table/view
             fully_qualified_table = get_fully_qualified_name(
@@ -61,24 +63,31 @@ else:
                 'exogenous_columns': st.session_state.exogenous_columns
             }
 
-            # Create SnowflakeMLForecast instance
-            forecast_model = SnowflakeMLForecast(
+            # Borrow a pooled session for the current connection settings; leaving the block returns it
+            with SnowflakeMLForecast(
                 config=st.session_state.forecast_config,
                 connection_config=st.session_state.connection_config,
-                is_streamlit=True
-            )
-            
-            # Create and run forecast
-            forecast_data = forecast_model.create_and_run_forecast()
+                is_streamlit=True,
+                pool=get_session_pool()
+            ) as forecast_model:
+                # Create and run forecast
+                forecast_data = forecast_model.create_and_run_forecast()
             
-            st.success("Forecast generated successfully!")
+                st.success("Forecast generated successfully!")
             
-            # Display the first few rows of the forecast data
-            st.write("Forecast Data Preview:")
-            st.dataframe(forecast_data.head())
+                # Display the first few rows of the forecast data
+                st.write("Forecast Data Preview:")
+                st.dataframe(forecast_data.head())
             
-            # Generate forecast and visualization
-            forecast_model.generate_forecast_and_visualization()
+                # Generate forecast and visualization; per-series charts are kept so later pages render on demand
+                st.session_state['forecast_charts'] = forecast_model.generate_forecast_and_visualization()
+
+                with st.expander("Timing breakdown", expanded=False):
+                    timing = forecast_model.report.summary()
+                    st.bar_chart(timing['seconds'])
+                    st.dataframe(timing)
+                    st.write("Statements:")
+                    st.dataframe(forecast_model.report.to_dataframe())
             
             # Display the chart if it's available in the session state
             if 'chart' in st.session_state:
@@ -102,4 +111,19 @@ else:
             safe_connection_config = {k: v for k, v in st.session_state.connection_config.items() if k not in ['password', 'private_key']}
             st.json(safe_connection_config)
             
-            st.error("If the problem persists, please contact your streamlit developer with the above information")
\ No newline at end of file
+            st.error("If the problem persists, please contact your streamlit developer with the above information")
+
+    charts = st.session_state.get('forecast_charts')
+    if not executed and isinstance(charts, LazyCharts):
+        st.subheader("Browse Series Forecasts")
+        search = st.text_input("Search series", key="chart_search")
+        page_size = st.selectbox("Charts per page", [5, 10, 25], index=1, key="chart_page_size")
+        n_pages = charts.n_pages(page_size, search)
+        # A narrower search or a bigger page size can leave the remembered page past the last one
+        if st.session_state.get('chart_page', 1) > n_pages:
+            st.session_state.chart_page = n_pages
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key="chart_page")
+        st.caption(f"{len(charts.search(search))} series")
+        for series, chart in charts.page(page, page_size, search).items():
+            st.write(f"Forecast for {series}")
+            st.altair_chart(chart, use_container_width=True)